@@ -0,0 +1 @@
+"""Offline benchmarks for fast_flights. Run modules with ``python -m benchmarks.<name>``."""
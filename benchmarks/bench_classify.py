@@ -0,0 +1,63 @@
+"""Time entry classification in ``ResultDecoder.decode``.
+
+``ResultDecoder.decode`` used to decode both sections and then walk them a
+second time, re-running ``_is_itinerary_entry`` on every entry just to pick
+out the travel warnings. It now partitions each section in one pass. This
+times the current decode and the rescan it no longer does.
+
+    python -m benchmarks.bench_classify [--captured DIR] [--repeat N]
+"""
+
+import argparse
+import json
+import time
+
+from fast_flights.core import _scan_ds1_data
+from fast_flights.decoder import ResultDecoder, _is_itinerary_entry, _parse_travel_warning
+
+from .corpus import js_corpus
+
+
+def _rescan(root) -> None:
+    # The second pass removed from ResultDecoder.decode.
+    for idx in (2, 3):
+        if idx < len(root) and isinstance(root[idx], list) and root[idx] and isinstance(root[idx][0], list):
+            for el in root[idx][0]:
+                if not _is_itinerary_entry(el):
+                    _parse_travel_warning(el)
+
+
+def _time(fn, root, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(root)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--captured", help="directory of captured *.html responses")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'page':<18}{'entries':>9}{'decode ms':>11}{'rescan ms':>11}{'two-pass ms':>13}{'saved':>8}")
+    for name, body in js_corpus(args.captured):
+        payload = _scan_ds1_data(body)
+        if payload is None:
+            continue
+        root = json.loads(payload)
+        if not isinstance(root, list) or isinstance(root[0], str):
+            continue
+
+        entries = sum(len(root[i][0]) for i in (2, 3) if isinstance(root[i], list) and root[i])
+        decode = _time(ResultDecoder.decode, root, args.repeat)
+        rescan = _time(_rescan, root, args.repeat)
+        two_pass = decode + rescan
+        print(
+            f"{name:<18}{entries:>9}{decode:>11.3f}{rescan:>11.3f}{two_pass:>13.3f}"
+            f"{rescan / two_pass:>7.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Time ``ResultDecoder.decode`` with compiled vs. generic decoders.
+
+    python -m benchmarks.bench_decode [--captured DIR] [--repeat N]
+"""
+
+import argparse
+import json
+import time
+from contextlib import contextmanager
+
+from fast_flights.core import _scan_ds1_data
+from fast_flights.decoder import Decoder, ResultDecoder
+
+from .corpus import js_corpus
+
+
+@contextmanager
+def generic_decoders():
+    """Temporarily route every Decoder subclass through the generic DecoderKey walk."""
+    compiled = {cls: cls.__dict__["_decode_raw"] for cls in Decoder.__subclasses__()}
+    for cls in compiled:
+        cls._decode_raw = None
+    try:
+        yield
+    finally:
+        for cls, fn in compiled.items():
+            cls._decode_raw = fn
+
+
+def _time(root, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        ResultDecoder.decode(root)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--captured", help="directory of captured *.html responses")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'page':<18}{'itineraries':>12}{'generic ms':>12}{'compiled ms':>13}{'speedup':>10}")
+    for name, body in js_corpus(args.captured):
+        payload = _scan_ds1_data(body)
+        if payload is None:
+            print(f"{name:<18} skipped: no ds:1 payload")
+            continue
+        root = json.loads(payload)
+        if not isinstance(root, list) or isinstance(root[0], str):
+            print(f"{name:<18} skipped: not an itinerary payload")
+            continue
+
+        result = ResultDecoder.decode(root)
+        with generic_decoders():
+            assert ResultDecoder.decode(root) == result, f"generic and compiled decode differ on {name}"
+            generic = _time(root, args.repeat)
+        compiled = _time(root, args.repeat)
+
+        count = len(result.best) + len(result.other)
+        print(f"{name:<18}{count:>12}{generic:>12.3f}{compiled:>13.3f}{generic / compiled:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Compare JSON backends on the ``ds:1`` payload.
+
+    python -m benchmarks.bench_json [--captured DIR] [--repeat N]
+"""
+
+import argparse
+import json
+import time
+
+from fast_flights import _json
+from fast_flights.core import _scan_ds1_data
+
+from .corpus import js_corpus
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--captured", help="directory of captured *.html responses")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    backends = _json.available_backends()
+    print(f"backends: {', '.join(backends)} (default: {_json.backend})")
+    print(f"{'page':<18}{'bytes':>10}" + "".join(f"{name + ' ms':>14}" for name in backends) + f"{'speedup':>10}")
+
+    default = _json.backend
+    for name, body in js_corpus(args.captured):
+        payload = _scan_ds1_data(body)
+        if payload is None:
+            print(f"{name:<18} skipped: no ds:1 payload")
+            continue
+        expected = json.loads(payload)
+
+        timings = {}
+        for backend in backends:
+            _json.use_backend(backend)
+            assert _json.loads(payload) == expected, f"{backend} decoded {name} differently"
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                _json.loads(payload)
+            timings[backend] = (time.perf_counter() - start) / args.repeat * 1000
+
+        fastest = min(timings.values())
+        print(
+            f"{name:<18}{len(payload):>10}"
+            + "".join(f"{timings[b]:>14.3f}" for b in backends)
+            + f"{timings['json'] / fastest:>9.1f}x"
+        )
+    _json.use_backend(default)
+
+
+if __name__ == "__main__":
+    main()
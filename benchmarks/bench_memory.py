@@ -0,0 +1,88 @@
+"""Measure memory retained by decoded results.
+
+Compares what ``ResultDecoder.decode`` keeps alive against a baseline of the
+same values held in plain ``__dict__`` objects with un-interned strings, i.e.
+what the models cost before they were slotted and interned.
+
+    python -m benchmarks.bench_memory [--captured DIR]
+"""
+
+import argparse
+import json
+import tracemalloc
+from dataclasses import fields, is_dataclass
+
+from fast_flights.core import _scan_ds1_data
+from fast_flights.decoder import ResultDecoder
+
+from .corpus import js_corpus
+
+
+class _Plain:
+    """Dict-backed stand-in for a dataclass instance."""
+
+
+def _unshared(value):
+    if isinstance(value, str):
+        # A bytes round-trip forces a distinct object.
+        return value.encode("utf-8").decode("utf-8")
+    if isinstance(value, list):
+        return [_unshared(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_unshared(v) for v in value)
+    if is_dataclass(value):
+        plain = _Plain()
+        for f in fields(value):
+            setattr(plain, f.name, _unshared(getattr(value, f.name)))
+        return plain
+    return value
+
+
+def _retained(build):
+    tracemalloc.start()
+    try:
+        obj = build()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del obj
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--captured", help="directory of captured *.html responses")
+    args = parser.parse_args()
+
+    print(f"{'page':<18}{'itineraries':>12}{'baseline KiB':>14}{'decoded KiB':>13}{'per-itin B saved':>18}")
+    for name, body in js_corpus(args.captured):
+        payload = _scan_ds1_data(body)
+        if payload is None:
+            continue
+        root = json.loads(payload)
+        if not isinstance(root, list) or isinstance(root[0], str):
+            continue
+
+        result = ResultDecoder.decode(root)
+        count = len(result.best) + len(result.other)
+        del root, result
+        if not count:
+            continue
+
+        # Both sides decode a fresh parse and let it go, so only what the
+        # results reference is counted.
+        def decoded():
+            fresh = ResultDecoder.decode(json.loads(payload))
+            return fresh.best + fresh.other
+
+        def baseline():
+            return [_unshared(it) for it in decoded()]
+
+        plain = _retained(baseline)
+        current = _retained(decoded)
+        saved = (plain - current) / count
+        print(f"{name:<18}{count:>12}{plain / 1024:>14.1f}{current / 1024:>13.1f}{saved:>18.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""Run every offline benchmark: throughput, latency percentiles and peak memory.
+
+Covers ``parse_response`` (``html`` and ``js``), ``ResultDecoder.decode``,
+``TFSData.as_b64``, ``create_return_flight_filter`` and
+``decode_return_flight_tfs`` over the corpus. Save a run with ``--save`` and
+check a later one against it with ``--compare``; the exit status is 1 if any
+case got slower (p50) or allocates more (peak) than ``--tolerance`` allows.
+
+    python -m benchmarks.bench_suite [--captured DIR] [--repeat N] [--only SUBSTR]
+                                     [--save FILE] [--compare FILE] [--tolerance 0.25]
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from fast_flights import diagnostics
+from fast_flights.cache import CachedResponse
+from fast_flights.core import _scan_ds1_data, parse_response
+from fast_flights.decoder import ResultDecoder
+from fast_flights.diagnostics import CallbackPayloadSink
+from fast_flights.exceptions import GoogleFlightsErrorResponse
+from fast_flights.flights_impl import FlightData, Passengers, TFSData
+from fast_flights.return_flight import create_booking_tfs, create_return_flight_filter, decode_return_flight_tfs
+
+from .corpus import html_corpus, js_corpus
+
+Case = Tuple[str, Callable[[], object]]
+
+
+@dataclass
+class CaseStats:
+    """Timings of one benchmark case (latencies in milliseconds)."""
+
+    name: str
+    runs: int
+    ops_per_sec: float
+    p50: float
+    p95: float
+    p99: float
+    peak_kib: float
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    # Nearest rank on an already sorted list.
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def _peak_kib(fn: Callable[[], object]) -> float:
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def measure(name: str, fn: Callable[[], object], repeat: int) -> CaseStats:
+    """Time ``repeat`` calls of ``fn`` after a warm-up call, then one more under tracemalloc."""
+    fn()
+    samples = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    total = time.perf_counter() - start
+    samples.sort()
+    ms = [s * 1000 for s in samples]
+    return CaseStats(
+        name=name,
+        runs=repeat,
+        ops_per_sec=repeat / total if total else float("inf"),
+        p50=_percentile(ms, 50),
+        p95=_percentile(ms, 95),
+        p99=_percentile(ms, 99),
+        peak_kib=_peak_kib(fn),
+    )
+
+
+def _expect_error_response(response: CachedResponse) -> Callable[[], object]:
+    def run():
+        try:
+            parse_response(response, "js")
+        except GoogleFlightsErrorResponse as e:
+            return e
+        raise AssertionError("expected a GoogleFlightsErrorResponse")
+
+    return run
+
+
+def parse_cases(captured: Optional[str] = None) -> Iterator[Case]:
+    """``parse_response`` on every page, then ``ResultDecoder.decode`` on every ``ds:1`` root."""
+    roots = []
+    for name, body in js_corpus(captured):
+        response = CachedResponse(body)
+        payload = _scan_ds1_data(body)
+        if payload is not None and "ErrorResponse" in payload:
+            yield f"parse_response[js,{name}]", _expect_error_response(response)
+            continue
+        yield f"parse_response[js,{name}]", lambda response=response: parse_response(response, "js")
+        if payload is not None:
+            roots.append((name, json.loads(payload)))
+
+    for name, body in html_corpus(captured):
+        response = CachedResponse(body)
+        yield f"parse_response[html,{name}]", lambda response=response: parse_response(response, "html")
+
+    for name, root in roots:
+        yield f"ResultDecoder.decode[{name}]", lambda root=root: ResultDecoder.decode(root)
+
+
+def tfs_cases() -> Iterator[Case]:
+    """TFS encoding for search filters and the return-flight/booking helpers."""
+    passengers = Passengers(adults=2, children=1)
+    filters = {
+        "one-way": TFSData.from_interface(
+            flight_data=[FlightData(date="2026-11-18", from_airport="SFO", to_airport="MCO")],
+            trip="one-way", passengers=passengers, seat="economy",
+        ),
+        "round-trip": TFSData.from_interface(
+            flight_data=[
+                FlightData(date="2026-11-18", from_airport="SFO", to_airport="MCO"),
+                FlightData(date="2026-11-25", from_airport="MCO", to_airport="SFO"),
+            ],
+            trip="round-trip", passengers=passengers, seat="business", max_stops=1,
+        ),
+        "multi-city": TFSData.from_interface(
+            flight_data=[
+                FlightData(date="2026-11-18", from_airport="SFO", to_airport="JFK"),
+                FlightData(date="2026-11-21", from_airport="JFK", to_airport="ORD"),
+                FlightData(date="2026-11-25", from_airport="ORD", to_airport="SFO"),
+            ],
+            trip="multi-city", passengers=passengers, seat="economy",
+        ),
+    }
+    for name, tfs in filters.items():
+        yield f"TFSData.as_b64[{name}]", tfs.as_b64
+
+    direct = dict(
+        outbound_date="2026-11-18", outbound_from="SFO", outbound_to="MCO",
+        outbound_airline="UA", outbound_flight_number="2018", return_date="2026-11-25",
+    )
+    connecting = dict(
+        direct,
+        outbound_airline="F9", outbound_flight_number="4158",
+        connecting_segments=[{"from": "LAS", "to": "MCO", "airline": "F9", "flight_number": "1876"}],
+    )
+    yield "create_return_flight_filter[direct]", lambda: create_return_flight_filter(**direct)
+    yield "create_return_flight_filter[connecting]", lambda: create_return_flight_filter(**connecting)
+
+    encoded = {
+        "return-direct": create_return_flight_filter(**direct),
+        "return-connecting": create_return_flight_filter(**connecting),
+        "booking": create_booking_tfs(
+            outbound_date="2026-11-18", outbound_from="SFO", outbound_to="MCO",
+            outbound_airline="UA", outbound_flight_number="2018",
+            return_date="2026-11-25", return_from="MCO", return_to="SFO",
+            return_airline="UA", return_flight_number="626",
+        ),
+    }
+    for name, tfs in encoded.items():
+        yield f"decode_return_flight_tfs[{name}]", lambda tfs=tfs: decode_return_flight_tfs(tfs)
+
+
+@contextmanager
+def quiet_error_responses() -> Iterator[None]:
+    """Discard ErrorResponse payloads and their log lines while benchmarking."""
+    previous = diagnostics.get_error_payload_sink()
+    level = diagnostics.logger.level
+    diagnostics.configure_error_payload_sink(CallbackPayloadSink(lambda digest, payload: None, background=False))
+    diagnostics.logger.setLevel(logging.CRITICAL)
+    try:
+        yield
+    finally:
+        diagnostics.configure_error_payload_sink(previous)
+        diagnostics.logger.setLevel(level)
+
+
+def run(captured: Optional[str] = None, repeat: int = 50, only: Optional[str] = None) -> List[CaseStats]:
+    """Measure every case whose name contains ``only``."""
+    results = []
+    with quiet_error_responses():
+        for name, fn in [*parse_cases(captured), *tfs_cases()]:
+            if only and only not in name:
+                continue
+            results.append(measure(name, fn, repeat))
+    return results
+
+
+def compare(results: List[CaseStats], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    """Describe every case whose p50 or peak memory grew by more than ``tolerance``."""
+    regressions = []
+    for stats in results:
+        before = baseline.get(stats.name)
+        if before is None:
+            continue
+        for metric in ("p50", "peak_kib"):
+            old, new = before[metric], getattr(stats, metric)
+            if old and new > old * (1 + tolerance):
+                regressions.append(f"{stats.name}: {metric} {old:.3f} -> {new:.3f} ({new / old - 1:+.0%})")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--captured", help="directory of captured *.html responses")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--only", help="run only cases whose name contains this")
+    parser.add_argument("--save", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="JSON file from an earlier --save to check against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed growth before a regression")
+    args = parser.parse_args()
+
+    results = run(args.captured, args.repeat, args.only)
+
+    print(f"{'case':<48}{'ops/s':>11}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'peak KiB':>11}")
+    for s in results:
+        print(f"{s.name:<48}{s.ops_per_sec:>11.1f}{s.p50:>10.3f}{s.p95:>10.3f}{s.p99:>10.3f}{s.peak_kib:>11.1f}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({s.name: asdict(s) for s in results}, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""Response bodies for the offline benchmarks.
+
+Pages are either loaded from a directory of captured Google Flights responses
+(``*.html``, one response body per file) or synthesised with the same shape
+as a live ``ds:1`` payload. The synthetic pages are deterministic for a given
+seed so numbers are comparable between runs.
+
+Synthetic ``html`` pages render the same itineraries as the result list markup
+``parse_response(..., 'html')`` reads, and keep the ``ds:1`` script, as a
+live page does.
+"""
+
+import base64
+import json
+import os
+import random
+from typing import List, Optional, Tuple
+
+from fast_flights import flights_pb2 as PB
+
+Page = Tuple[str, str]  # (name, response body)
+
+_AIRPORTS = [
+    ("SFO", "San Francisco International Airport", "San Francisco"),
+    ("LAX", "Los Angeles International Airport", "Los Angeles"),
+    ("JFK", "John F. Kennedy International Airport", "New York"),
+    ("ORD", "O'Hare International Airport", "Chicago"),
+    ("DEN", "Denver International Airport", "Denver"),
+    ("SEA", "Seattle-Tacoma International Airport", "Seattle"),
+    ("MCO", "Orlando International Airport", "Orlando"),
+    ("LAS", "Harry Reid International Airport", "Las Vegas"),
+    ("ATL", "Hartsfield-Jackson Atlanta International Airport", "Atlanta"),
+    ("DFW", "Dallas/Fort Worth International Airport", "Dallas"),
+]
+
+_AIRLINES = [
+    ("UA", "United"),
+    ("AA", "American"),
+    ("DL", "Delta"),
+    ("AS", "Alaska"),
+    ("B6", "JetBlue"),
+    ("F9", "Frontier"),
+    ("NK", "Spirit"),
+    ("WN", "Southwest"),
+]
+
+_AIRCRAFT = [
+    "Boeing 737MAX 8 Passenger",
+    "Airbus A321neo",
+    "Airbus A320",
+    "Boeing 757",
+    "Embraer 175",
+    "Boeing 787-9",
+]
+
+TRAVEL_WARNING = [
+    12,
+    None,
+    None,
+    None,
+    None,
+    ["Travel restricted", "Airspace closure may affect flights.", 2],
+]
+
+ERROR_RESPONSE = [
+    "type.googleapis.com/travel.frontend.flights.ErrorResponse",
+    [
+        [
+            None,
+            [[1783229001196007, 44793028, 186418482], None, None, None, None, [[0]]],
+            0,
+            "SepJaqf7C8T5rcUPsoryWA",
+            "HLLtqUXTmDdQAMMg4gBG---------vwkl16AAAAAGpJ6kkDI5PSA",
+        ],
+        0,
+    ],
+]
+
+
+def _summary_b64(flights: str, price: int, currency: str = "USD") -> str:
+    pb = PB.ItinerarySummary()
+    pb.flights = flights
+    pb.price.price = price * 100
+    pb.price.currency = currency
+    return base64.b64encode(pb.SerializeToString()).decode("ascii")
+
+
+def _flight(rng: random.Random, dep, arr, date, hour: int, minutes: int) -> list:
+    code, name = rng.choice(_AIRLINES)
+    number = str(rng.randint(100, 2999))
+    arr_total = hour * 60 + minutes
+    f: list = [None] * 31
+    f[2] = name
+    f[3], f[4] = dep[0], dep[1]
+    f[5], f[6] = arr[0], arr[1]
+    f[8] = [hour % 24, rng.choice([0, 5, 15, 30, 45])]
+    f[10] = [(arr_total // 60) % 24, arr_total % 60]
+    f[11] = minutes
+    f[14] = rng.choice(["30 inches", "31 inches", "32 inches"])
+    f[15] = [[c, str(rng.randint(1000, 9999)), None, n] for c, n in rng.sample(_AIRLINES, rng.randint(0, 2))]
+    f[17] = rng.choice(_AIRCRAFT)
+    f[20] = list(date)
+    f[21] = list(date)
+    f[22] = [code, number, None, name]
+    return f
+
+
+def _itinerary(rng: random.Random, origin, destination, date) -> list:
+    stops = rng.choice([0, 0, 1, 1, 2])
+    path = [origin] + rng.sample([a for a in _AIRPORTS if a not in (origin, destination)], stops) + [destination]
+    hour = rng.randint(5, 21)
+    flights = []
+    layovers = []
+    total = 0
+    for i, (dep, arr) in enumerate(zip(path, path[1:])):
+        minutes = rng.randint(55, 360)
+        flights.append(_flight(rng, dep, arr, date, hour, minutes))
+        total += minutes
+        hour += minutes // 60 + 1
+        if i < stops:
+            wait = rng.randint(40, 240)
+            total += wait
+            layovers.append([wait, arr[0], arr[0], None, arr[1], arr[2], arr[1], arr[2]])
+
+    main: list = [None] * 24
+    main[0] = flights[0][22][0]
+    main[1] = sorted({f[2] for f in flights})
+    main[2] = flights
+    main[3] = origin[0]
+    main[4] = list(date)
+    main[5] = flights[0][8]
+    main[6] = destination[0]
+    main[7] = list(date)
+    main[8] = flights[-1][10]
+    main[9] = total
+    main[13] = layovers or None
+    flight_codes = "|".join(f"{f[22][0]}{f[22][1]}" for f in flights)
+    return [main, [None, _summary_b64(flight_codes, rng.randint(79, 1400))]]
+
+
+def _price_insights(rng: random.Random) -> list:
+    low = rng.randint(150, 300)
+    high = low + rng.randint(80, 300)
+    current = rng.randint(low - 50, high + 50)
+    history = [[1_760_000_000_000 + day * 86_400_000, rng.randint(low - 40, high + 40)] for day in range(60)]
+    return [3, [None, current], [None, (low + high) // 2], [None, current - (low + high) // 2],
+            [None, low], [None, high], 1, None, None, None, [history], None, "Orlando"]
+
+
+def synthetic_root(
+    *,
+    best: int = 3,
+    other: int = 60,
+    seed: int = 0,
+    inline_warnings: int = 0,
+    top_level_warnings: int = 0,
+    return_page: bool = False,
+) -> list:
+    """Build a ``ds:1`` data root shaped like a live Google Flights response.
+
+    Args:
+        best (int): Number of itineraries in the "best" section (``data[2][0]``).
+        other (int): Number of itineraries in the "other" section (``data[3][0]``).
+        seed (int): Random seed; the same arguments always give the same root.
+        inline_warnings (int): Travel advisories injected as siblings of itineraries.
+        top_level_warnings (int): Travel advisories placed at ``data[22]``.
+        return_page (bool): Mimic a return-flight page, where ``data[2]`` is null.
+    """
+    rng = random.Random(seed)
+    origin, destination = rng.sample(_AIRPORTS, 2)
+    date = (2026, rng.randint(1, 12), rng.randint(1, 28))
+
+    best_entries = [_itinerary(rng, origin, destination, date) for _ in range(best)]
+    other_entries = [_itinerary(rng, origin, destination, date) for _ in range(other)]
+    for i in range(inline_warnings):
+        other_entries.insert(rng.randint(0, len(other_entries)), list(TRAVEL_WARNING))
+
+    root: list = [None] * 31
+    root[0] = [None, "c7ZJaraMCuSM5LcP1Z_N4Q0", [[origin[0], origin[2]], [destination[0], destination[2]]]]
+    root[1] = [[[a[0], a[1], a[2]] for a in _AIRPORTS]]
+    root[2] = None if return_page else [best_entries]
+    root[3] = [other_entries]
+    root[5] = _price_insights(rng)
+    if top_level_warnings:
+        root[22] = [list(TRAVEL_WARNING) for _ in range(top_level_warnings)]
+    return root
+
+
+def js_page(root, main: str = "") -> str:
+    """Wrap a ``ds:1`` data root in the page markup Google serves."""
+    payload = json.dumps(root, separators=(",", ":"), ensure_ascii=False)
+    return (
+        "<!doctype html><html lang=\"en\"><head><meta charset=\"utf-8\">"
+        "<script nonce=\"n0\">window.WIZ_global_data = {};</script></head><body>"
+        f"<div role=\"main\"><div class=\"eQ35Ce\"></div>{main}</div>"
+        "<script class=\"ds:0\" nonce=\"n0\">AF_initDataCallback({key: 'ds:0', hash: '1', data:[], sideChannel: {}});</script>"
+        f"<script class=\"ds:1\" nonce=\"n0\">AF_initDataCallback({{key: 'ds:1', hash: '2', data:{payload}, sideChannel: {{}}}});</script>"
+        "</body></html>"
+    )
+
+
+def _clock(hm) -> str:
+    hour, minute = hm
+    return f"{(hour - 1) % 12 + 1}:{minute:02d}\u202f{'AM' if hour < 12 else 'PM'}"
+
+
+def _span(minutes: int) -> str:
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours} hr {minutes} min" if hours else f"{minutes} min"
+
+
+def _html_item(entry) -> str:
+    main, summary = entry
+    flights = main[2]
+    pb = PB.ItinerarySummary()
+    pb.ParseFromString(base64.b64decode(summary[1]))
+    stops = len(flights) - 1
+    dep, arr = flights[0], flights[-1]
+    layovers = "".join(
+        f"<div class=\"tvtJdb\">{_span(layover[0])} {layover[1]}{layover[4]}</div>" for layover in main[13] or []
+    )
+    return (
+        "<li class=\"pIav2d\"><div class=\"JMc5Xc\">"
+        f"<div class=\"sSHqwe tPgKwe ogfYpf\"><span>{', '.join(main[1])}</span></div>"
+        f"<span class=\"mv1WYe\"><div>{_clock(main[5])}</div><div>{_clock(main[8])}</div></span>"
+        f"<div class=\"Ak5kof\"><div>{_span(main[9])}</div></div>"
+        f"<div class=\"BbR8Ec\"><span class=\"ogfYpf\">{'Nonstop' if not stops else f'{stops} stop' + 's' * (stops > 1)}</span></div>"
+        f"{layovers}"
+        f"<div class=\"PTuQse\">{dep[3]}{dep[4]}\u2013{arr[5]}{arr[6]}</div>"
+        f"<div class=\"YMlIz FpEdX\"><span>${pb.price.price // 100:,}</span></div>"
+        "</div></li>"
+    )
+
+
+def html_page(root) -> str:
+    """Render a ``ds:1`` data root as the result list the ``html`` parser reads.
+
+    Like a live page, the "other" list ends with a "View more flights" row
+    (which the parser drops) and the ``ds:1`` script is still present.
+    """
+    sections = []
+    if isinstance(root[2], list):
+        items = "".join(_html_item(e) for e in root[2][0] if len(e) == 2)
+        sections.append(f"<div jsname=\"IWWDBc\"><ul class=\"Rk10dc\">{items}</ul></div>")
+    items = "".join(_html_item(e) for e in root[3][0] if len(e) == 2)
+    sections.append(
+        f"<div jsname=\"YdtKid\"><ul class=\"Rk10dc\">{items}"
+        "<li><button>View more flights</button></li></ul></div>"
+    )
+    insights = root[5]
+    typical = "typical" if insights[5][1] >= insights[1][1] >= insights[4][1] else "high"
+    sections.append(f"<div class=\"frOi8\">Prices are currently <span class=\"gOatQ\">{typical}</span></div>")
+    return js_page(root, "".join(sections))
+
+
+def load_captured(directory: str) -> List[Page]:
+    """Load captured response bodies (``*.html``) from ``directory``."""
+    pages = []
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".html"):
+            with open(os.path.join(directory, name), encoding="utf-8") as f:
+                pages.append((name[:-5], f.read()))
+    return pages
+
+
+def js_corpus(captured: Optional[str] = None) -> List[Page]:
+    """Pages for the ``data_source='js'`` benchmarks.
+
+    Uses the captured responses in ``captured`` when given, otherwise the
+    synthetic one-way, round-trip, return-flight, travel-warning, large and
+    ErrorResponse pages.
+    """
+    if captured:
+        return load_captured(captured)
+    return [
+        ("one-way", js_page(synthetic_root(best=3, other=40, seed=1))),
+        ("round-trip", js_page(synthetic_root(best=4, other=80, seed=2))),
+        ("return-flight", js_page(synthetic_root(other=60, seed=3, return_page=True))),
+        ("travel-warnings", js_page(synthetic_root(best=2, other=30, seed=4, inline_warnings=3, top_level_warnings=1))),
+        ("large", js_page(synthetic_root(best=5, other=300, seed=5))),
+        ("error-response", js_page(ERROR_RESPONSE)),
+    ]
+
+
+def html_corpus(captured: Optional[str] = None) -> List[Page]:
+    """Pages for the ``data_source='html'`` benchmarks.
+
+    Captured responses are full pages, so ``captured`` is read as for
+    :func:`js_corpus`. The synthetic pages match the ``js`` ones.
+    """
+    if captured:
+        return load_captured(captured)
+    return [
+        ("one-way", html_page(synthetic_root(best=3, other=40, seed=1))),
+        ("round-trip", html_page(synthetic_root(best=4, other=80, seed=2))),
+        ("return-flight", html_page(synthetic_root(other=60, seed=3, return_page=True))),
+        ("travel-warnings", html_page(synthetic_root(best=2, other=30, seed=4, inline_warnings=3, top_level_warnings=1))),
+        ("large", html_page(synthetic_root(best=5, other=300, seed=5))),
+    ]
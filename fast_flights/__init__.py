@@ -1,15 +1,45 @@
+from .browser_pool import BrowserPool, configure_browser_pool
+from .cache import MemoryCache, ResponseCache, SQLiteCache
+from .circuit_breaker import BreakerPolicy, configure_circuit_breakers, get_circuit_breakers
 from .cookies_impl import Cookies
-from .core import get_flights_from_filter, get_flights, get_flights_from_tfs
-from .exceptions import GoogleFlightsErrorResponse
+from .diagnostics import (
+    CallbackPayloadSink,
+    FilePayloadSink,
+    PayloadSink,
+    StderrPayloadSink,
+    configure_diagnostics,
+    configure_error_payload_sink,
+    flush_error_payloads,
+)
+from .core import (
+    get_flights_from_filter,
+    get_flights,
+    get_flights_from_tfs,
+    get_flights_async,
+    get_flights_from_filter_async,
+    get_flights_from_tfs_async,
+)
+from .batch import BatchResult, get_flights_batch
+from .exceptions import CircuitOpenError, FetchError, GoogleFlightsErrorResponse
 from .filter import create_filter
+from .hedging import HedgePolicy, configure_hedging, get_hedger
 from .flights_impl import Airport, FlightData, Passengers, TFSData
 from .decoder import PriceInsights, PriceGraphPoint, TravelWarning
 from .schema import Flight, Result
+from .proxy_pool import ProxyPool, ProxyStats
+from .rate_limit import RateLimit, configure_rate_limiter, get_rate_limiter
+from .readiness import ReadinessPolicy, configure_readiness
+from .request_filter import RequestFilter, configure_request_filter
+from .retry import RetryPolicy, configure_retry
 from .search import search_airport
+from .session_pool import SessionPool, configure_session_pool
+from .single_flight import configure_single_flight, get_single_flight
+from .tracing import CallbackTracer, OpenTelemetryTracer, SpanRecord, Tracer, configure_tracing
 from .return_flight import (
     create_return_flight_filter,
     create_return_flight_url,
     get_return_flight_options,
+    get_return_flight_options_async,
     decode_return_flight_tfs,
     ReturnFlightOption,
     create_booking_tfs,
@@ -23,6 +53,11 @@ __all__ = [
     "Passengers",
     "get_flights_from_filter",
     "get_flights_from_tfs",
+    "get_flights_async",
+    "get_flights_from_filter_async",
+    "get_flights_from_tfs_async",
+    "get_flights_batch",
+    "BatchResult",
     "Result",
     "Flight",
     "search_airport",
@@ -31,6 +66,7 @@ __all__ = [
     "create_return_flight_filter",
     "create_return_flight_url",
     "get_return_flight_options",
+    "get_return_flight_options_async",
     "decode_return_flight_tfs",
     "ReturnFlightOption",
     "create_booking_tfs",
@@ -38,4 +74,44 @@ __all__ = [
     "PriceGraphPoint",
     "TravelWarning",
     "GoogleFlightsErrorResponse",
+    "ResponseCache",
+    "MemoryCache",
+    "SQLiteCache",
+    "SessionPool",
+    "configure_session_pool",
+    "BrowserPool",
+    "configure_browser_pool",
+    "ReadinessPolicy",
+    "configure_readiness",
+    "RequestFilter",
+    "configure_request_filter",
+    "RateLimit",
+    "configure_rate_limiter",
+    "get_rate_limiter",
+    "FetchError",
+    "RetryPolicy",
+    "configure_retry",
+    "ProxyPool",
+    "ProxyStats",
+    "HedgePolicy",
+    "configure_hedging",
+    "get_hedger",
+    "BreakerPolicy",
+    "CircuitOpenError",
+    "configure_circuit_breakers",
+    "get_circuit_breakers",
+    "configure_single_flight",
+    "get_single_flight",
+    "Tracer",
+    "CallbackTracer",
+    "OpenTelemetryTracer",
+    "SpanRecord",
+    "configure_tracing",
+    "PayloadSink",
+    "StderrPayloadSink",
+    "FilePayloadSink",
+    "CallbackPayloadSink",
+    "configure_diagnostics",
+    "configure_error_payload_sink",
+    "flush_error_payloads",
 ]
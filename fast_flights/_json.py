@@ -0,0 +1,86 @@
+"""JSON decoding for the ``ds:1`` payload, with an optional fast backend.
+
+``orjson`` (preferred) or ``msgspec`` is used automatically when installed —
+``pip install fast-flights[speedups]`` pulls in ``orjson`` — and the stdlib
+``json`` module otherwise. Set ``FAST_FLIGHTS_JSON_BACKEND`` to ``json``,
+``orjson`` or ``msgspec`` to force a backend; an unavailable one logs a
+warning and the stdlib is used.
+
+The accelerated backends are stricter than the stdlib (e.g. they reject
+``NaN``), so a payload they refuse is retried with ``json.loads`` before
+anything is raised.
+"""
+
+import json
+import os
+from typing import Any, Callable, Dict, Tuple, Type
+
+from .diagnostics import logger
+
+Loads = Callable[[str], Any]
+
+# name -> (loads, exceptions that mean "retry with the stdlib")
+_BACKENDS: Dict[str, Tuple[Loads, Tuple[Type[BaseException], ...]]] = {
+    "json": (json.loads, ()),
+}
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    pass
+else:
+    _BACKENDS["orjson"] = (orjson.loads, (orjson.JSONDecodeError,))
+
+try:
+    import msgspec  # type: ignore
+except ImportError:
+    pass
+else:
+    _BACKENDS["msgspec"] = (msgspec.json.decode, (msgspec.DecodeError,))
+
+
+def available_backends() -> Tuple[str, ...]:
+    """Names of the JSON backends importable in this environment."""
+    return tuple(_BACKENDS)
+
+
+def _pick_backend() -> str:
+    forced = os.environ.get("FAST_FLIGHTS_JSON_BACKEND")
+    if forced:
+        if forced in _BACKENDS:
+            return forced
+        # An optional speed-up must never make ``import fast_flights`` fail.
+        logger.warning(
+            "FAST_FLIGHTS_JSON_BACKEND=%r is not available (installed backends: %s); using json",
+            forced,
+            ", ".join(_BACKENDS),
+            extra={"event": "json_backend_unavailable"},
+        )
+        return "json"
+    for name in ("orjson", "msgspec"):
+        if name in _BACKENDS:
+            return name
+    return "json"
+
+
+backend = _pick_backend()
+_loads, _fallback_errors = _BACKENDS[backend]
+
+
+def use_backend(name: str) -> None:
+    """Switch the backend used by :func:`loads` (``json``, ``orjson`` or ``msgspec``)."""
+    global backend, _loads, _fallback_errors
+    if name not in _BACKENDS:
+        raise ValueError(f"JSON backend {name!r} is not available; installed backends: {', '.join(_BACKENDS)}")
+    backend = name
+    _loads, _fallback_errors = _BACKENDS[name]
+
+
+def loads(s: str) -> Any:
+    """Decode ``s`` with the active backend, falling back to ``json.loads``."""
+    if not _fallback_errors:
+        return _loads(s)
+    try:
+        return _loads(s)
+    except _fallback_errors:
+        return json.loads(s)
@@ -0,0 +1,121 @@
+"""Fan out many searches over a bounded worker pool."""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, Literal, Optional, Union
+
+from .cache import ResponseCache
+from .core import DataSource, FetchMode, get_flights_from_filter
+from .decoder import DecodedResult, KeepRaw
+from .filter import TFSData
+from .proxy_pool import ProxyLike
+from .schema import Result
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one filter in a :func:`get_flights_batch` run.
+
+    Exactly one of ``result`` / ``error`` is meaningful: ``error`` is the
+    exception raised for this filter, or ``None`` on success.
+    """
+
+    index: int
+    filter: TFSData
+    result: Union[Result, DecodedResult, None] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def get_flights_batch(
+    filters: Iterable[TFSData],
+    *,
+    concurrency: int = 8,
+    mode: FetchMode = "common",
+    data_source: DataSource = 'html',
+    currency: str = "",
+    tfu: str = "EgQIABABIgA",
+    proxy: ProxyLike = None,
+    cache: Optional[ResponseCache] = None,
+    keep_raw: KeepRaw = True,
+) -> Iterator[BatchResult]:
+    """Search many filters concurrently, yielding results as they complete.
+
+    At most ``concurrency`` searches are in flight at once, and ``filters`` is
+    consumed lazily, so it can be a generator over a large route × date grid.
+    A failing filter is reported as a :class:`BatchResult` with ``error`` set;
+    it never aborts the rest of the batch.
+
+    Args:
+        filters (Iterable[TFSData]): Filters to search.
+        concurrency (int, optional): Maximum searches in flight. Defaults to 8.
+        mode (str, optional): Fetch mode for every search. Defaults to "common".
+        data_source (str, optional): Data source ('html' or 'js'). Defaults to 'html'.
+        currency (str, optional): Currency code for prices. Defaults to "".
+        tfu (str, optional): TFU parameter for Google Flights. Defaults to "EgQIABABIgA".
+        proxy (str or ProxyPool, optional): Proxy URL for HTTP requests, or
+            a ProxyPool to rotate through. Defaults to None.
+        cache (ResponseCache, optional): Response body cache shared by every
+            search in the batch. Defaults to None.
+        keep_raw (bool or "lazy", optional): What each ``DecodedResult.raw``
+            retains; see :func:`get_flights_from_tfs`. Defaults to True.
+
+    Yields:
+        BatchResult: One per filter, in completion order. ``index`` is the
+        filter's position in ``filters``.
+
+    Example:
+        >>> for item in get_flights_batch(filters, concurrency=16, data_source='js'):
+        ...     if item.ok:
+        ...         print(item.index, len(item.result.best))
+        ...     else:
+        ...         print(item.index, "failed:", item.error)
+    """
+    assert concurrency >= 1, "concurrency must be >= 1"
+
+    def run(index: int, tfs_filter: TFSData) -> BatchResult:
+        try:
+            result = get_flights_from_filter(
+                tfs_filter,
+                currency,
+                mode=mode,
+                data_source=data_source,
+                tfu=tfu,
+                proxy=proxy,
+                cache=cache,
+                keep_raw=keep_raw,
+            )
+        except Exception as e:
+            return BatchResult(index=index, filter=tfs_filter, error=e)
+        return BatchResult(index=index, filter=tfs_filter, result=result)
+
+    source = iter(enumerate(filters))
+    in_flight: Dict[Future, int] = {}
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="fast_flights-batch")
+    try:
+        exhausted = False
+        while True:
+            while not exhausted and len(in_flight) < concurrency:
+                try:
+                    index, tfs_filter = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                in_flight[executor.submit(run, index, tfs_filter)] = index
+
+            if not in_flight:
+                return
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                del in_flight[future]
+                yield future.result()
+    finally:
+        # Reached on normal exhaustion and when the caller stops iterating
+        # early; don't block the caller on searches nobody will read.
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=False)
@@ -1,6 +1,8 @@
 import os
 from typing import Any
-from .primp import Client
+from .exceptions import FetchError
+from .session_pool import get_session_pool
+from .urls import flights_url
 
 
 def bright_data_fetch(params: dict) -> Any:
@@ -13,20 +15,21 @@ def bright_data_fetch(params: dict) -> Any:
         raise ValueError("BRIGHT_DATA_API_KEY environment variable is required")
     
     # Construct Google Flights URL
-    url = "https://www.google.com/travel/flights?" + "&".join(f"{k}={v}" for k, v in params.items())
+    url = flights_url(params)
     
     # Make request to Bright Data (no impersonation needed - Bright Data handles it)
-    client = Client(verify=False)
-    res = client.post(
-        api_url,
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}"
-        },
-        json={"url": url, "zone": zone}
-    )
+    with get_session_pool().session(verify=False) as client:
+        res = client.post(
+            api_url,
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {api_key}"
+            },
+            json={"url": url, "zone": zone}
+        )
     
-    assert res.status_code == 200, f"{res.status_code} Result: {res.text}"
+    if res.status_code != 200:
+        raise FetchError.from_response(res, res.text)
     
     # Return DummyResponse with HTML content
     class DummyResponse:
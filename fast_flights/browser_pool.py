@@ -0,0 +1,348 @@
+"""Long-lived Chromium browsers shared by the Playwright fetch modes.
+
+Launching Chromium costs seconds; loading a results page costs about as much
+again. The pool keeps a few browsers (each with one warm context) running on
+a private event loop thread so every search only pays for the page load, and
+so both sync callers and callers on any asyncio loop can share them —
+Playwright objects are bound to the loop that created them.
+
+``playwright`` is imported only when the first browser is launched, so
+importing this module doesn't require the ``local`` extra.
+
+Example:
+    >>> configure_browser_pool(size=4, max_pages_per_browser=2)
+    >>> get_flights_from_filter(filter, mode="local")
+"""
+
+import asyncio
+import atexit
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from .request_filter import get_request_filter
+
+T = TypeVar("T")
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+# Remove webdriver property to avoid detection
+STEALTH_INIT_SCRIPT = "delete Object.getPrototypeOf(navigator).webdriver"
+
+
+async def _start_playwright() -> Any:
+    from playwright.async_api import async_playwright
+
+    return await async_playwright().start()
+
+
+async def launch_chromium(playwright: Any) -> Any:
+    """Default launcher: a local headless Chromium with anti-detection flags."""
+    return await playwright.chromium.launch(args=["--disable-blink-features=AutomationControlled"])
+
+
+class _PooledBrowser:
+    __slots__ = ("browser", "context", "active", "uses", "retired", "created_at")
+
+    def __init__(self, browser: Any, context: Any):
+        self.browser = browser
+        self.context = context
+        self.active = 0
+        self.uses = 0
+        self.retired = False
+        self.created_at = time.monotonic()
+
+    def healthy(self) -> bool:
+        return not self.retired and self.browser.is_connected()
+
+
+class BrowserPool:
+    """A pool of warm Playwright browsers, safe to share between threads and event loops.
+
+    Each browser holds one context (user agent, init script and the active
+    :class:`~fast_flights.request_filter.RequestFilter` applied once) and
+    serves up to ``max_pages_per_browser`` pages at a time. A browser is
+    recycled after ``max_uses`` pages, once it is ``max_age`` seconds old, or
+    as soon as it is found disconnected.
+
+    Args:
+        size (int, optional): Maximum number of browsers. Defaults to 2.
+        max_pages_per_browser (int, optional): Concurrent pages per browser.
+            Defaults to 4.
+        max_uses (int, optional): Pages a browser serves before it is replaced.
+            Defaults to 100.
+        max_age (float, optional): Seconds after which a browser takes no new
+            pages and is replaced; useful for remote sessions with a hard
+            lifetime. Defaults to None (no limit).
+        reconnect_retries (int, optional): How many times a page is retried on
+            a fresh browser when its browser disconnects mid-run. Defaults to 0.
+        launcher (callable, optional): ``async (playwright) -> Browser``.
+            Defaults to :func:`launch_chromium`.
+        context_options (dict, optional): Keyword arguments for
+            ``browser.new_context``. Defaults to a desktop Chrome user agent.
+        init_script (str, optional): Script added to every context. Defaults
+            to hiding ``navigator.webdriver``.
+        playwright_factory (callable, optional): ``async () -> Playwright``.
+            Defaults to starting ``playwright.async_api``.
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int = 2,
+        max_pages_per_browser: int = 4,
+        max_uses: int = 100,
+        max_age: Optional[float] = None,
+        reconnect_retries: int = 0,
+        launcher: Callable[[Any], Awaitable[Any]] = launch_chromium,
+        context_options: Optional[Dict[str, Any]] = None,
+        init_script: Optional[str] = STEALTH_INIT_SCRIPT,
+        playwright_factory: Callable[[], Awaitable[Any]] = _start_playwright,
+    ):
+        assert size >= 1, "size must be >= 1"
+        assert max_pages_per_browser >= 1, "max_pages_per_browser must be >= 1"
+        assert max_uses >= 1, "max_uses must be >= 1"
+        self.size = size
+        self.max_pages_per_browser = max_pages_per_browser
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self.reconnect_retries = reconnect_retries
+        self.launcher = launcher
+        self.context_options = {"user_agent": USER_AGENT} if context_options is None else context_options
+        self.init_script = init_script
+        self.playwright_factory = playwright_factory
+
+        self._browsers: List[_PooledBrowser] = []
+        self._launching = 0
+        self._playwright: Any = None
+        self._cond: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    # -- public API -------------------------------------------------------
+
+    def run_sync(self, fn: Callable[[Any], Awaitable[T]]) -> T:
+        """Run ``await fn(page)`` on a pooled page and return its result (blocking)."""
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(self._with_page(fn), loop).result()
+
+    async def run(self, fn: Callable[[Any], Awaitable[T]]) -> T:
+        """Async variant of :meth:`run_sync`, usable from any event loop."""
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(self._with_page(fn), loop)
+        return await asyncio.wrap_future(future)
+
+    def browser_count(self) -> int:
+        """Number of browsers currently held, including ones being recycled."""
+        return len(self._browsers)
+
+    def close(self) -> None:
+        """Close every browser and stop the pool's event loop thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            loop, thread = self._loop, self._thread
+        if loop is None or thread is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._aclose(), loop).result(timeout=30)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+
+    # -- event loop thread ------------------------------------------------
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            assert not self._closed, "BrowserPool is closed"
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def serve() -> None:
+                    asyncio.set_event_loop(loop)
+                    self._cond = asyncio.Condition()
+                    ready.set()
+                    loop.run_forever()
+                    loop.close()
+
+                self._thread = threading.Thread(target=serve, name="fast_flights-browser-pool", daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+    async def _with_page(self, fn: Callable[[Any], Awaitable[T]]) -> T:
+        for attempt in range(self.reconnect_retries + 1):
+            pooled = await self._acquire()
+            try:
+                return await self._run_on(pooled, fn)
+            except Exception:
+                # A dropped connection (remote session expired, browser
+                # crashed) is worth another try on a fresh browser; anything
+                # else is the caller's error.
+                if attempt == self.reconnect_retries or pooled.browser.is_connected():
+                    raise
+        raise AssertionError("unreachable")
+
+    async def _run_on(self, pooled: _PooledBrowser, fn: Callable[[Any], Awaitable[T]]) -> T:
+        page = None
+        try:
+            page = await pooled.context.new_page()
+            return await fn(page)
+        finally:
+            if page is not None:
+                try:
+                    await page.close()
+                except Exception:
+                    pass  # the browser may already be gone
+            await self._release(pooled)
+
+    async def _acquire(self) -> _PooledBrowser:
+        assert self._cond is not None
+        expired: List[_PooledBrowser] = []
+        try:
+            async with self._cond:
+                while True:
+                    expired += self._reap()
+                    candidates = [
+                        b for b in self._browsers if b.healthy() and b.active < self.max_pages_per_browser
+                    ]
+                    if candidates:
+                        pooled = min(candidates, key=lambda b: b.active)
+                        pooled.active += 1
+                        return pooled
+                    if len(self._browsers) + self._launching < self.size:
+                        self._launching += 1
+                        break
+                    await self._cond.wait()
+        finally:
+            await _close_all(expired)
+
+        pooled = None
+        try:
+            pooled = await self._launch()
+            pooled.active = 1
+            return pooled
+        finally:
+            async with self._cond:
+                self._launching -= 1
+                if pooled is not None:
+                    self._browsers.append(pooled)
+                self._cond.notify_all()
+
+    async def _launch(self) -> _PooledBrowser:
+        if self._playwright is None:
+            self._playwright = await self.playwright_factory()
+        browser = await self.launcher(self._playwright)
+        try:
+            context = await browser.new_context(**self.context_options)
+            if self.init_script:
+                await context.add_init_script(self.init_script)
+            request_filter = get_request_filter()
+            if request_filter is not None:
+                await request_filter.install(context)
+        except BaseException:
+            await _close_quietly(browser)
+            raise
+        return _PooledBrowser(browser, context)
+
+    async def _release(self, pooled: _PooledBrowser) -> None:
+        assert self._cond is not None
+        async with self._cond:
+            pooled.active -= 1
+            pooled.uses += 1
+            if pooled.uses >= self.max_uses or not pooled.browser.is_connected():
+                pooled.retired = True
+            expired = self._reap()
+            self._cond.notify_all()
+        await _close_all(expired)
+
+    def _reap(self) -> List[_PooledBrowser]:
+        # Caller must hold self._cond. Drops retired / crashed browsers once
+        # their in-flight pages are done and returns them; the caller closes
+        # them after releasing the lock so a slow close can't stall the pool.
+        now = time.monotonic()
+        expired = []
+        for pooled in list(self._browsers):
+            if not pooled.browser.is_connected():
+                pooled.retired = True
+            elif self.max_age is not None and now - pooled.created_at >= self.max_age:
+                pooled.retired = True
+            if pooled.retired and pooled.active == 0:
+                self._browsers.remove(pooled)
+                expired.append(pooled)
+        return expired
+
+    async def _aclose(self) -> None:
+        for pooled in self._browsers:
+            await _close_quietly(pooled.browser)
+        self._browsers.clear()
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+
+async def _close_all(expired: List[_PooledBrowser]) -> None:
+    for pooled in expired:
+        await _close_quietly(pooled.browser)
+
+
+async def _close_quietly(browser: Any) -> None:
+    try:
+        await browser.close()
+    except Exception:
+        pass  # already crashed or disconnected
+
+
+_browser_pool: Optional[BrowserPool] = None
+_browser_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the process-wide browser pool used by ``mode="local"``."""
+    global _browser_pool
+    with _browser_pool_lock:
+        if _browser_pool is None:
+            _browser_pool = BrowserPool()
+        return _browser_pool
+
+
+def configure_browser_pool(
+    *,
+    size: int = 2,
+    max_pages_per_browser: int = 4,
+    max_uses: int = 100,
+) -> BrowserPool:
+    """Replace the process-wide browser pool used by ``mode="local"``.
+
+    Browsers held by the previous pool are closed.
+
+    Args:
+        size (int, optional): Maximum number of browsers. Defaults to 2.
+        max_pages_per_browser (int, optional): Concurrent pages per browser.
+            Defaults to 4.
+        max_uses (int, optional): Pages a browser serves before it is
+            replaced. Defaults to 100.
+    """
+    global _browser_pool
+    with _browser_pool_lock:
+        previous = _browser_pool
+        _browser_pool = BrowserPool(size=size, max_pages_per_browser=max_pages_per_browser, max_uses=max_uses)
+    if previous is not None:
+        previous.close()
+    return _browser_pool
+
+
+@atexit.register
+def _close_browser_pool() -> None:
+    if _browser_pool is not None:
+        _browser_pool.close()
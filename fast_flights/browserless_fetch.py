@@ -1,8 +1,92 @@
 import os
-import asyncio
+import atexit
 import re
 import base64
-from typing import Any, Optional, List, Dict
+import threading
+from typing import Any, Optional, List, Dict, NamedTuple, Sequence, Tuple
+
+from .browser_pool import BrowserPool
+from .readiness import expand_results, get_readiness_policy
+from .urls import flights_url
+
+DEFAULT_BROWSERLESS_ENDPOINT = "wss://production-sfo.browserless.io"
+
+
+class FlightTarget(NamedTuple):
+    """A flight card to resolve, identified as it appears in the result list."""
+
+    airline: str
+    departure_time: str
+    price: str
+
+
+# (endpoint URL with token, pool size, pages per session, session TTL)
+_PoolConfig = Tuple[str, int, int, float]
+_browserless_pool: Optional[BrowserPool] = None
+_browserless_pool_config: Optional[_PoolConfig] = None
+_browserless_pool_lock = threading.Lock()
+
+
+def _browserless_pool_config_from_env(api_key: str) -> _PoolConfig:
+    endpoint = os.environ.get("BROWSERLESS_ENDPOINT") or DEFAULT_BROWSERLESS_ENDPOINT
+    separator = "&" if "?" in endpoint else "?"
+    ttl = os.environ.get("BROWSERLESS_SESSION_TTL")
+    return (
+        f"{endpoint}{separator}token={api_key}",
+        int(os.environ.get("BROWSERLESS_POOL_SIZE") or 1),
+        int(os.environ.get("BROWSERLESS_MAX_PAGES_PER_SESSION") or 4),
+        float(ttl) if ttl else 240.0,
+    )
+
+
+def get_browserless_pool(api_key: str) -> BrowserPool:
+    """Return the pool of Browserless.io CDP sessions shared by every browserless search.
+
+    Browserless bills and rate-limits per session, so sessions stay connected
+    across searches and each serves several pages at once. Configured from
+    the environment:
+
+    - ``BROWSERLESS_ENDPOINT``: WebSocket endpoint (default
+      ``wss://production-sfo.browserless.io``).
+    - ``BROWSERLESS_POOL_SIZE``: concurrent sessions (default 1).
+    - ``BROWSERLESS_MAX_PAGES_PER_SESSION``: concurrent pages per session
+      (default 4).
+    - ``BROWSERLESS_SESSION_TTL``: seconds before a session is replaced,
+      ahead of the server-side session timeout (default 240).
+
+    A session that drops is reconnected, and the page that was running on it
+    is retried once. Changing the key or any of the variables replaces the
+    pool on the next call.
+    """
+    global _browserless_pool, _browserless_pool_config
+    config = _browserless_pool_config_from_env(api_key)
+    previous = None
+    with _browserless_pool_lock:
+        if _browserless_pool is None or _browserless_pool_config != config:
+            previous = _browserless_pool
+            ws_endpoint, size, pages, ttl = config
+
+            async def connect(playwright: Any) -> Any:
+                return await playwright.chromium.connect_over_cdp(ws_endpoint)
+
+            _browserless_pool = BrowserPool(
+                size=size,
+                max_pages_per_browser=pages,
+                max_age=ttl,
+                reconnect_retries=1,
+                launcher=connect,
+            )
+            _browserless_pool_config = config
+        pool = _browserless_pool
+    if previous is not None:
+        previous.close()
+    return pool
+
+
+@atexit.register
+def _close_browserless_pool() -> None:
+    if _browserless_pool is not None:
+        _browserless_pool.close()
 
 
 def _extract_segments_from_google_tfs(url: str) -> Optional[List[Dict]]:
@@ -93,10 +177,97 @@ def fetch_flight_details(
             ]
         }
     """
+    api_key = _require_api_key()
+    url = _details_search_url(params, origin, destination, date)
+    is_oneway_search = bool(origin and destination and date)
+    return get_browserless_pool(api_key).run_sync(
+        lambda page: _flight_details_on_page(
+            page, url, airline, departure_time, price, origin, destination, is_oneway_search
+        )
+    )
+
+
+async def fetch_flight_details_async(
+    params: dict,
+    airline: str,
+    departure_time: str,
+    price: str,
+    origin: str = "",
+    destination: str = "",
+    date: str = ""
+) -> Optional[Dict]:
+    """Async variant of :func:`fetch_flight_details` for use inside a running event loop."""
+    api_key = _require_api_key()
+    url = _details_search_url(params, origin, destination, date)
+
+    # When using one-way search, prices will differ from roundtrip
+    is_oneway_search = bool(origin and destination and date)
+    return await _fetch_flight_details_async(url, api_key, airline, departure_time, price, origin, destination, is_oneway_search)
+
+
+def fetch_flight_details_batch(
+    params: dict,
+    targets: Sequence[FlightTarget],
+    origin: str = "",
+    destination: str = "",
+    date: str = ""
+) -> List[Optional[Dict]]:
+    """Resolve flight numbers for many flights of the same search in one page session.
+
+    Like calling :func:`fetch_flight_details` once per target, but the search
+    page is loaded and expanded once; each card is then clicked in turn and
+    the page navigated back to the results between targets.
+
+    Args:
+        params: The search parameters (tfs, hl, tfu, curr)
+        targets: ``(airline, departure_time, price)`` for each flight, e.g.
+            ``[FlightTarget("Delta", "8:05 PM", "$634"), ...]``
+        origin: Origin airport code - for creating one-way search
+        destination: Destination airport code - for creating one-way search
+        date: Flight date in YYYY-MM-DD format - for creating one-way search
+
+    Returns:
+        One entry per target, in order: the same dict :func:`fetch_flight_details`
+        returns, or None if that flight couldn't be resolved.
+    """
+    api_key = _require_api_key()
+    url = _details_search_url(params, origin, destination, date)
+    is_oneway_search = bool(origin and destination and date)
+    targets = [FlightTarget(*target) for target in targets]
+    if not targets:
+        return []
+    return get_browserless_pool(api_key).run_sync(
+        lambda page: _flight_details_batch_on_page(page, url, targets, origin, destination, is_oneway_search)
+    )
+
+
+async def fetch_flight_details_batch_async(
+    params: dict,
+    targets: Sequence[FlightTarget],
+    origin: str = "",
+    destination: str = "",
+    date: str = ""
+) -> List[Optional[Dict]]:
+    """Async variant of :func:`fetch_flight_details_batch` for use inside a running event loop."""
+    api_key = _require_api_key()
+    url = _details_search_url(params, origin, destination, date)
+    is_oneway_search = bool(origin and destination and date)
+    targets = [FlightTarget(*target) for target in targets]
+    if not targets:
+        return []
+    return await get_browserless_pool(api_key).run(
+        lambda page: _flight_details_batch_on_page(page, url, targets, origin, destination, is_oneway_search)
+    )
+
+
+def _require_api_key() -> str:
     api_key = os.environ.get("BROWSERLESS_API_KEY")
     if not api_key:
         raise ValueError("BROWSERLESS_API_KEY environment variable is required")
+    return api_key
+
 
+def _details_search_url(params: dict, origin: str, destination: str, date: str) -> str:
     # If we have origin, destination, and date, create a one-way search URL
     # This is necessary for roundtrips because clicking an outbound flight
     # shows return options instead of outbound flight details
@@ -110,18 +281,13 @@ def fetch_flight_details(
             passengers=Passengers(adults=1),
             seat="economy"
         )
-        url = "https://www.google.com/travel/flights?" + "&".join([
-            f"tfs={oneway_filter.as_b64().decode('utf-8')}",
-            "hl=en",
-            "tfu=EgQIABABIgA",
-            "curr="
-        ])
-    else:
-        url = "https://www.google.com/travel/flights?" + "&".join(f"{k}={v}" for k, v in params.items())
-
-    # When using one-way search, prices will differ from roundtrip
-    is_oneway_search = bool(origin and destination and date)
-    return asyncio.run(_fetch_flight_details_async(url, api_key, airline, departure_time, price, origin, destination, is_oneway_search))
+        return flights_url({
+            "tfs": oneway_filter.as_b64().decode('utf-8'),
+            "hl": "en",
+            "tfu": "EgQIABABIgA",
+            "curr": "",
+        })
+    return flights_url(params)
 
 
 async def _fetch_flight_details_async(
@@ -134,238 +300,271 @@ async def _fetch_flight_details_async(
     not outbound details. This function handles that by looking for flight numbers
     in the expanded view and using the origin/destination to determine direction.
     """
-    from playwright.async_api import async_playwright
-
-    async with async_playwright() as p:
-        browser = await p.chromium.connect_over_cdp(
-            f"wss://production-sfo.browserless.io?token={api_key}"
+    return await get_browserless_pool(api_key).run(
+        lambda page: _flight_details_on_page(
+            page, url, airline, departure_time, price, origin, destination, is_oneway_search
         )
+    )
 
-        context = await browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        )
-        page = await context.new_page()
-        await page.add_init_script('delete Object.getPrototypeOf(navigator).webdriver')
 
-        await page.goto(url)
+async def _flight_details_on_page(
+    page: Any, url: str, airline: str, departure_time: str, price: str,
+    origin: str = "", destination: str = "", is_oneway_search: bool = False
+) -> Optional[Dict]:
+    if not await _open_results(page, url):
+        return None
+    target_item = await _find_flight_item(page, FlightTarget(airline, departure_time, price), is_oneway_search)
+    if not target_item:
+        return None
+    return await _select_and_extract(page, target_item, origin, destination)
 
-        # Handle consent page
-        if page.url.startswith("https://consent.google.com"):
-            await page.click('text="Accept all"')
-            await page.wait_for_timeout(2000)
 
-        # Wait for flight results
-        try:
-            await page.wait_for_selector('li.pIav2d', timeout=30000)
-        except Exception as e:
-            await browser.close()
-            return None
+async def _flight_details_batch_on_page(
+    page: Any, url: str, targets: List[FlightTarget],
+    origin: str = "", destination: str = "", is_oneway_search: bool = False
+) -> List[Optional[Dict]]:
+    if not await _open_results(page, url):
+        return [None] * len(targets)
+
+    # Google may rewrite the URL once the results render; that is the list.
+    results_url = page.url
+    results: List[Optional[Dict]] = []
+    for target in targets:
+        if page.url != results_url:
+            if not await _back_to_results(page, url):
+                results.append(None)
+                continue
+            results_url = page.url
+        target_item = await _find_flight_item(page, target, is_oneway_search)
+        if target_item is None:
+            # Navigating back can collapse the "View more flights" sections.
+            await expand_results(page)
+            target_item = await _find_flight_item(page, target, is_oneway_search)
+        if target_item is None:
+            results.append(None)
+            continue
+        results.append(await _select_and_extract(page, target_item, origin, destination))
+    return results
+
+
+async def _open_results(page: Any, url: str) -> bool:
+    await page.goto(url)
+
+    # Handle consent page
+    if page.url.startswith("https://consent.google.com"):
+        await page.click('text="Accept all"')
+        await page.wait_for_load_state()
+
+    # Wait for flight results
+    try:
+        await page.wait_for_selector('li.pIav2d', timeout=30000)
+    except Exception as e:
+        return False
 
-        await page.wait_for_timeout(5000)
+    # Click "View more flights" buttons to ensure all flights are visible
+    policy = get_readiness_policy()
+    await policy.settle(page)
+    await expand_results(page, policy)
+    return True
 
-        # Click "View more flights" buttons to ensure all flights are visible
-        try:
-            buttons = await page.locator('span.bEfgkb:has-text("View more flights")').all()
-            for btn in buttons:
-                try:
-                    await btn.click()
-                    await page.wait_for_timeout(2000)
-                except:
-                    pass
-        except:
-            pass
 
+async def _back_to_results(page: Any, url: str) -> bool:
+    """Return to the result list after a card click navigated away from it."""
+    try:
+        await page.go_back()
+        await page.wait_for_selector('li.pIav2d', timeout=10000)
+        return True
+    except Exception:
+        # History didn't lead back to the list; reload the search.
+        return await _open_results(page, url)
+
+
+def _matches_flight(item_text: str, target: FlightTarget, is_oneway_search: bool) -> bool:
+    airline, departure_time, price = target
+
+    # Match airline (check if any part of airline name is in the text)
+    airline_parts = [a.strip() for a in airline.replace('+', ',').split(',')]
+    airline_match = any(part.lower() in item_text.lower() for part in airline_parts)
+
+    # Match departure time (normalize spaces)
+    time_clean = departure_time.replace('\xa0', ' ').strip()
+    time_match = time_clean in item_text.replace('\xa0', ' ')
+
+    # Match price (skip for one-way searches since prices differ from roundtrip)
+    if is_oneway_search:
+        price_match = True  # Skip price matching for one-way
+    else:
         # Normalize price for matching (remove $ and commas)
         price_clean = price.replace('$', '').replace(',', '').strip()
+        price_match = price_clean in item_text.replace(',', '')
 
-        # Find the flight row by matching airline, time, and price
-        flight_items = await page.locator('li.pIav2d').all()
+    return airline_match and time_match and price_match
 
-        target_item = None
-        for item in flight_items:
-            item_text = await item.inner_text()
 
-            # Check if this item matches our flight
-            # Match airline (check if any part of airline name is in the text)
-            airline_parts = [a.strip() for a in airline.replace('+', ',').split(',')]
-            airline_match = any(part.lower() in item_text.lower() for part in airline_parts)
+async def _find_flight_item(page: Any, target: FlightTarget, is_oneway_search: bool) -> Any:
+    """Find the flight row by matching airline, time, and price."""
+    for item in await page.locator('li.pIav2d').all():
+        if _matches_flight(await item.inner_text(), target, is_oneway_search):
+            return item
+    return None
 
-            # Match departure time (normalize spaces)
-            time_clean = departure_time.replace('\xa0', ' ').strip()
-            time_match = time_clean in item_text.replace('\xa0', ' ')
 
-            # Match price (skip for one-way searches since prices differ from roundtrip)
-            if is_oneway_search:
-                price_match = True  # Skip price matching for one-way
-            else:
-                price_match = price_clean in item_text.replace(',', '')
+async def _select_and_extract(page: Any, target_item: Any, origin: str, destination: str) -> Optional[Dict]:
+    # Scroll item into view and click to expand details
+    try:
+        await target_item.scroll_into_view_if_needed()
+        url_before_click = page.url
+        await target_item.click()
+        await get_readiness_policy().after_select(page, url_before_click)
 
-            if airline_match and time_match and price_match:
-                target_item = item
-                break
+        # Capture the URL after clicking - Google may update it with selection info
+        url_after_click = page.url
+        if os.environ.get('DEBUG_FLIGHT_DETAILS'):
+            print(f"DEBUG: URL after click: {url_after_click}")
 
-        if not target_item:
-            await browser.close()
-            return None
+        # Try to extract segments from Google's TFS in the URL
+        google_segments = _extract_segments_from_google_tfs(url_after_click)
+        if google_segments:
+            return {
+                'flight_numbers': [f"{s['airline']} {s['flight_number']}" for s in google_segments],
+                'connecting_segments': google_segments
+            }
 
-        # Scroll item into view and click to expand details
-        try:
-            await target_item.scroll_into_view_if_needed()
-            await target_item.click()
-            await page.wait_for_timeout(3000)
-
-            # Capture the URL after clicking - Google may update it with selection info
-            url_after_click = page.url
-            if os.environ.get('DEBUG_FLIGHT_DETAILS'):
-                print(f"DEBUG: URL after click: {url_after_click}")
-
-            # Try to extract segments from Google's TFS in the URL
-            google_segments = _extract_segments_from_google_tfs(url_after_click)
-            if google_segments:
-                await browser.close()
-                return {
-                    'flight_numbers': [f"{s['airline']} {s['flight_number']}" for s in google_segments],
-                    'connecting_segments': google_segments
-                }
-
-        except Exception as e:
-            await browser.close()
-            return None
+    except Exception as e:
+        return None
 
-        # After clicking, the element may have changed. Get the full page content
-        # which should now include the expanded flight details
-        try:
-            page_html = await page.inner_html('body')
-            page_text = await page.inner_text('body')
-        except Exception as e:
-            await browser.close()
-            return None
+    # After clicking, the element may have changed. Get the full page content
+    # which should now include the expanded flight details
+    try:
+        page_html = await page.inner_html('body')
+        page_text = await page.inner_text('body')
+    except Exception as e:
+        return None
 
-        # Use page content for extraction
-        item_html = page_html
-        item_text = page_text
-
-        # Extract all airport codes found in the text (3-letter codes)
-        all_airport_codes = re.findall(r'\b([A-Z]{3})\b', item_text)
-
-        # Extract all route segments using multiple patterns
-        all_routes = []
-
-        # Pattern 1: BOS → IST or BOS–IST or BOS - IST
-        routes_pattern1 = re.findall(r'([A-Z]{3})\s*[→–\-−]\s*([A-Z]{3})', item_html)
-        all_routes.extend(routes_pattern1)
-
-        # Pattern 2: Look for consecutive airport codes in text (e.g., "BOS ... IST")
-        # This is a fallback when arrows aren't in the HTML
-        if not all_routes and origin and destination:
-            # Build routes from airport codes found, starting from origin
-            valid_airports = []
-            found_origin = False
-            for code in all_airport_codes:
-                if code == origin:
-                    found_origin = True
-                if found_origin:
-                    if code not in valid_airports:  # Avoid duplicates
-                        valid_airports.append(code)
-                    if code == destination:
-                        break
-
-            # Create route pairs from consecutive airports
-            for i in range(len(valid_airports) - 1):
-                all_routes.append((valid_airports[i], valid_airports[i + 1]))
-
-        # Extract all flight numbers (pattern: XX 1234 where XX is airline code)
-        # Also try XX1234 format (no space)
-        all_flights = re.findall(r'\b([A-Z]{2})[\s\.\-]?(\d{1,4})\b', item_html)
-
-        # Filter to only include segments in the correct direction (origin → destination)
-        # For roundtrips, Google shows both directions; we want segments starting from origin
-        outbound_routes = []
-        if origin and destination and all_routes:
-            # Find segments that belong to the outbound direction
-            # The first segment should start with origin, last should end with destination
-            in_outbound = False
-            for from_apt, to_apt in all_routes:
-                if from_apt == origin:
-                    in_outbound = True
-                if in_outbound:
-                    outbound_routes.append((from_apt, to_apt))
-                if to_apt == destination:
+    return _extract_details_from_page(page_html, page_text, origin, destination)
+
+
+def _extract_details_from_page(item_html: str, item_text: str, origin: str = "", destination: str = "") -> Optional[Dict]:
+    """Pull flight numbers and route segments out of an expanded flight card."""
+    # Extract all airport codes found in the text (3-letter codes)
+    all_airport_codes = re.findall(r'\b([A-Z]{3})\b', item_text)
+
+    # Extract all route segments using multiple patterns
+    all_routes = []
+
+    # Pattern 1: BOS → IST or BOS–IST or BOS - IST
+    routes_pattern1 = re.findall(r'([A-Z]{3})\s*[→–\-−]\s*([A-Z]{3})', item_html)
+    all_routes.extend(routes_pattern1)
+
+    # Pattern 2: Look for consecutive airport codes in text (e.g., "BOS ... IST")
+    # This is a fallback when arrows aren't in the HTML
+    if not all_routes and origin and destination:
+        # Build routes from airport codes found, starting from origin
+        valid_airports = []
+        found_origin = False
+        for code in all_airport_codes:
+            if code == origin:
+                found_origin = True
+            if found_origin:
+                if code not in valid_airports:  # Avoid duplicates
+                    valid_airports.append(code)
+                if code == destination:
                     break
+
+        # Create route pairs from consecutive airports
+        for i in range(len(valid_airports) - 1):
+            all_routes.append((valid_airports[i], valid_airports[i + 1]))
+
+    # Extract all flight numbers (pattern: XX 1234 where XX is airline code)
+    # Also try XX1234 format (no space)
+    all_flights = re.findall(r'\b([A-Z]{2})[\s\.\-]?(\d{1,4})\b', item_html)
+
+    # Filter to only include segments in the correct direction (origin → destination)
+    # For roundtrips, Google shows both directions; we want segments starting from origin
+    outbound_routes = []
+    if origin and destination and all_routes:
+        # Find segments that belong to the outbound direction
+        # The first segment should start with origin, last should end with destination
+        in_outbound = False
+        for from_apt, to_apt in all_routes:
+            if from_apt == origin:
+                in_outbound = True
+            if in_outbound:
+                outbound_routes.append((from_apt, to_apt))
+            if to_apt == destination:
+                break
+    else:
+        # No origin/destination provided, use all routes
+        outbound_routes = all_routes
+
+    # Deduplicate routes while preserving order
+    seen_routes = set()
+    unique_routes = []
+    for route in outbound_routes:
+        if route not in seen_routes:
+            seen_routes.add(route)
+            unique_routes.append(route)
+
+    # Now extract unique flight numbers, filtering false positives
+    seen_flights = set()
+    flight_numbers = []
+
+    for airline_code, flight_num in all_flights:
+        # Skip common false positives (time indicators, units)
+        if airline_code in ['AM', 'PM', 'CO', 'HR', 'KG', 'MI', 'GB', 'MB', 'KB']:
+            continue
+
+        flight_str = f"{airline_code} {flight_num}"
+        if flight_str not in seen_flights:
+            seen_flights.add(flight_str)
+            flight_numbers.append(flight_str)
+
+    # For roundtrips, the HTML shows both directions' flight numbers
+    # The outbound flights appear first, then return flights
+    # If we have routes, take only as many flight numbers as we have route segments
+    if unique_routes and len(flight_numbers) > len(unique_routes):
+        # For roundtrip, flight numbers are usually: [outbound1, outbound2, ..., return1, return2, ...]
+        # Take only the first N where N = number of outbound segments
+        flight_numbers = flight_numbers[:len(unique_routes)]
+
+    # Build connecting_segments by pairing flight numbers with routes
+    connecting_segments = []
+    for i, flight_str in enumerate(flight_numbers):
+        parts = flight_str.split()
+        segment = {
+            'airline': parts[0],
+            'flight_number': parts[1] if len(parts) > 1 else ''
+        }
+        if i < len(unique_routes):
+            segment['from'] = unique_routes[i][0]
+            segment['to'] = unique_routes[i][1]
         else:
-            # No origin/destination provided, use all routes
-            outbound_routes = all_routes
-
-        # Deduplicate routes while preserving order
-        seen_routes = set()
-        unique_routes = []
-        for route in outbound_routes:
-            if route not in seen_routes:
-                seen_routes.add(route)
-                unique_routes.append(route)
-
-        # Now extract unique flight numbers, filtering false positives
-        seen_flights = set()
-        flight_numbers = []
-
-        for airline_code, flight_num in all_flights:
-            # Skip common false positives (time indicators, units)
-            if airline_code in ['AM', 'PM', 'CO', 'HR', 'KG', 'MI', 'GB', 'MB', 'KB']:
-                continue
+            # No route info available, leave empty
+            segment['from'] = ''
+            segment['to'] = ''
+        connecting_segments.append(segment)
+
+    # Final validation: if we have origin/destination, ensure segments form a valid path
+    if origin and destination and connecting_segments:
+        # Check if the segments form a valid outbound path
+        valid_path = False
+        if connecting_segments[0].get('from') == origin:
+            # Check if path ends at destination
+            last_to = connecting_segments[-1].get('to', '')
+            if last_to == destination:
+                valid_path = True
+
+        if not valid_path and len(connecting_segments) > 1:
+            # Might have grabbed return flights instead - try reversing logic
+            # This shouldn't happen if our extraction is correct, but as a safeguard
+            pass
 
-            flight_str = f"{airline_code} {flight_num}"
-            if flight_str not in seen_flights:
-                seen_flights.add(flight_str)
-                flight_numbers.append(flight_str)
-
-        # For roundtrips, the HTML shows both directions' flight numbers
-        # The outbound flights appear first, then return flights
-        # If we have routes, take only as many flight numbers as we have route segments
-        if unique_routes and len(flight_numbers) > len(unique_routes):
-            # For roundtrip, flight numbers are usually: [outbound1, outbound2, ..., return1, return2, ...]
-            # Take only the first N where N = number of outbound segments
-            flight_numbers = flight_numbers[:len(unique_routes)]
-
-        # Build connecting_segments by pairing flight numbers with routes
-        connecting_segments = []
-        for i, flight_str in enumerate(flight_numbers):
-            parts = flight_str.split()
-            segment = {
-                'airline': parts[0],
-                'flight_number': parts[1] if len(parts) > 1 else ''
-            }
-            if i < len(unique_routes):
-                segment['from'] = unique_routes[i][0]
-                segment['to'] = unique_routes[i][1]
-            else:
-                # No route info available, leave empty
-                segment['from'] = ''
-                segment['to'] = ''
-            connecting_segments.append(segment)
-
-        # Final validation: if we have origin/destination, ensure segments form a valid path
-        if origin and destination and connecting_segments:
-            # Check if the segments form a valid outbound path
-            valid_path = False
-            if connecting_segments[0].get('from') == origin:
-                # Check if path ends at destination
-                last_to = connecting_segments[-1].get('to', '')
-                if last_to == destination:
-                    valid_path = True
-
-            if not valid_path and len(connecting_segments) > 1:
-                # Might have grabbed return flights instead - try reversing logic
-                # This shouldn't happen if our extraction is correct, but as a safeguard
-                pass
-
-        await browser.close()
-
-        if flight_numbers:
-            return {
-                'flight_numbers': flight_numbers,
-                'connecting_segments': connecting_segments
-            }
-        return None
+    if flight_numbers:
+        return {
+            'flight_numbers': flight_numbers,
+            'connecting_segments': connecting_segments
+        }
+    return None
 
 
 def browserless_fetch(params: dict) -> Any:
@@ -373,15 +572,26 @@ def browserless_fetch(params: dict) -> Any:
 
     Requires BROWSERLESS_API_KEY environment variable.
     """
-    api_key = os.environ.get("BROWSERLESS_API_KEY")
-    if not api_key:
-        raise ValueError("BROWSERLESS_API_KEY environment variable is required")
+    url = flights_url(params)
+    body = get_browserless_pool(_require_api_key()).run_sync(lambda page: _results_on_page(page, url))
+    return _dummy_response(body)
+
+
+async def browserless_fetch_async(params: dict) -> Any:
+    """Async variant of :func:`browserless_fetch` for use inside a running event loop.
+
+    Requires BROWSERLESS_API_KEY environment variable.
+    """
+    api_key = _require_api_key()
 
     # Construct Google Flights URL
-    url = "https://www.google.com/travel/flights?" + "&".join(f"{k}={v}" for k, v in params.items())
+    url = flights_url(params)
 
-    body = asyncio.run(_fetch_with_browserless(url, api_key))
+    body = await _fetch_with_browserless(url, api_key)
+    return _dummy_response(body)
 
+
+def _dummy_response(body: str) -> Any:
     class DummyResponse:
         status_code = 200
         text = body
@@ -391,60 +601,35 @@ def browserless_fetch(params: dict) -> Any:
 
 
 async def _fetch_with_browserless(url: str, api_key: str) -> str:
-    """Connect to Browserless.io via Playwright and fetch the page."""
-    from playwright.async_api import async_playwright
+    """Load ``url`` on a pooled Browserless.io session and return the page HTML."""
+    return await get_browserless_pool(api_key).run(lambda page: _results_on_page(page, url))
 
-    async with async_playwright() as p:
-        # Connect to Browserless.io via CDP
-        browser = await p.chromium.connect_over_cdp(
-            f"wss://production-sfo.browserless.io?token={api_key}"
-        )
 
-        # Create context with anti-detection measures
-        context = await browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        )
-        page = await context.new_page()
+async def _results_on_page(page: Any, url: str) -> str:
+    await page.goto(url)
 
-        # Remove webdriver property to avoid detection
-        await page.add_init_script('delete Object.getPrototypeOf(navigator).webdriver')
+    # Handle consent page if redirected
+    if page.url.startswith("https://consent.google.com"):
+        await page.click('text="Accept all"')
+        await page.wait_for_load_state()
 
-        await page.goto(url)
+    # Wait for flight results (try multiple selectors)
+    try:
+        await page.wait_for_selector('.eQ35Ce', timeout=30000)
+    except Exception as e1:
+        # Try waiting for any flight list item instead
+        try:
+            await page.wait_for_selector('li.pIav2d', timeout=10000)
+        except Exception as e2:
+            # Check if page shows "No results" - return HTML anyway for caller to handle
+            pass
 
-        # Handle consent page if redirected
-        if page.url.startswith("https://consent.google.com"):
-            await page.click('text="Accept all"')
-            await page.wait_for_timeout(2000)
+    # Wait for lazy loading to finish; the caller may parse ds:1, so wait for it too
+    policy = get_readiness_policy()
+    await policy.settle(page, require_ds1=True)
 
-        # Wait for flight results (try multiple selectors)
-        try:
-            await page.wait_for_selector('.eQ35Ce', timeout=30000)
-        except Exception as e1:
-            # Try waiting for any flight list item instead
-            try:
-                await page.wait_for_selector('li.pIav2d', timeout=10000)
-            except Exception as e2:
-                # Check if page shows "No results" - return HTML anyway for caller to handle
-                pass
-
-        # Wait for page to fully load (lazy loading)
-        await page.wait_for_timeout(5000)
-
-        # Click ALL "View more flights" buttons (there can be multiple in Best + Cheapest sections)
-        try:
-            buttons = await page.locator('span.bEfgkb:has-text("View more flights")').all()
-            for btn in buttons:
-                try:
-                    await btn.click()
-                    await page.wait_for_timeout(2000)
-                except:
-                    pass  # Button may have become stale, continue
-        except:
-            pass  # No buttons found, continue
-
-        # Extract full page HTML including script tags (needed for JS parser to get flight numbers)
-        body = await page.evaluate('() => document.documentElement.outerHTML')
-
-        await browser.close()
-
-    return body
+    # Click ALL "View more flights" buttons (there can be multiple in Best + Cheapest sections)
+    await expand_results(page, policy)
+
+    # Extract full page HTML including script tags (needed for JS parser to get flight numbers)
+    return await page.evaluate('() => document.documentElement.outerHTML')
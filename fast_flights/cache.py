@@ -0,0 +1,174 @@
+"""Response caches keyed by the canonical request parameters.
+
+A cache sits between the params dict built by ``get_flights_from_tfs`` and
+the fetch modes. It stores the raw response body, so a hit skips the network
+entirely but still goes through ``parse_response``.
+
+Example:
+    >>> cache = MemoryCache(ttl=60, max_size=1024)
+    >>> get_flights_from_filter(filter, data_source='js', cache=cache)
+"""
+
+import abc
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+
+def cache_key(params: dict, mode: str) -> str:
+    """Build a stable cache key from the request params and fetch mode.
+
+    ``tfs`` is canonicalised to URL-safe base64 without padding, which is how
+    Google (and ``TFSData.as_b64``) encode it, so equivalent spellings share an
+    entry. The mode is part of the key because the browser modes return a
+    different document (e.g. only ``[role="main"]``) than the HTTP modes.
+    """
+    canonical = dict(params)
+    tfs = canonical.get("tfs")
+    if isinstance(tfs, str):
+        canonical["tfs"] = tfs.replace("+", "-").replace("/", "_").rstrip("=")
+    material = json.dumps([mode, sorted((str(k), str(v)) for k, v in canonical.items())], separators=(",", ":"))
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class CachedResponse:
+    """Stand-in for a fetch response, built from a cached body."""
+
+    status_code = 200
+
+    def __init__(self, text: str):
+        self.text = text
+        self.text_markdown = text
+
+
+class ResponseCache(abc.ABC):
+    """Base class for response body caches."""
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached body for ``key``, or ``None`` on a miss."""
+
+    @abc.abstractmethod
+    def set(self, key: str, body: str) -> None:
+        """Store ``body`` under ``key``."""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Drop every entry."""
+
+
+class MemoryCache(ResponseCache):
+    """In-process LRU cache with a TTL. Safe to share between threads.
+
+    Args:
+        ttl (float, optional): Seconds an entry stays valid. Defaults to 300.
+        max_size (int, optional): Maximum number of entries; the least
+            recently used entry is evicted first. Defaults to 256.
+    """
+
+    def __init__(self, *, ttl: float = 300.0, max_size: int = 256):
+        assert max_size >= 1, "max_size must be >= 1"
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, body = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return body
+
+    def set(self, key: str, body: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class SQLiteCache(ResponseCache):
+    """On-disk LRU cache with a TTL, backed by SQLite.
+
+    Several processes can point at the same file to share entries.
+
+    Args:
+        path (str): Database file path (``":memory:"`` for a private
+            in-memory database).
+        ttl (float, optional): Seconds an entry stays valid. Defaults to 300.
+        max_size (int, optional): Maximum number of entries; the least
+            recently used entry is evicted first. Defaults to 4096.
+    """
+
+    def __init__(self, path: str, *, ttl: float = 300.0, max_size: int = 4096):
+        assert max_size >= 1, "max_size must be >= 1"
+        self.path = path
+        self.ttl = ttl
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, body TEXT NOT NULL, "
+            "stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+
+    def get(self, key: str) -> Optional[str]:
+        # Wall-clock time, not monotonic: entries outlive this process.
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            body, stored_at = row
+            if now - stored_at > self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            return body
+
+    def set(self, key: str, body: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, stored_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, body, now, now),
+            )
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_size,),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
@@ -0,0 +1,354 @@
+"""Per-mode circuit breakers, and the ``"auto"`` fetch mode built on them.
+
+When Google starts refusing plain requests, or the remote Playwright service
+is down, every search still pays for a failed round trip through that path.
+A breaker watches the recent outcomes of one fetch mode and, once too many
+of them failed, *opens*: requests for that mode fail fast with
+:class:`~fast_flights.exceptions.CircuitOpenError` (so ``mode="fallback"``
+goes straight to the browser). After ``open_for`` seconds the breaker is
+*half-open* and lets a probe request through; a successful probe closes it
+again, a failed one re-opens it.
+
+An outcome is only a success once the page has parsed: a 200 carrying a
+consent or "unusual traffic" page is how Google usually refuses a path, so
+it counts as a failure of the mode that fetched it. Otherwise only transport
+errors, timeouts, 429s and 5xx count against a mode; a missing API key, a 404
+or a caller's mistake says nothing about its health and is ignored.
+
+``mode="auto"`` tries the configured modes cheapest first, skipping any whose
+breaker is open, and moves on to the next mode when one fails or returns an
+unparseable page.
+
+Breakers are off until configured:
+
+    >>> configure_circuit_breakers(BreakerPolicy(failure_rate=0.5, open_for=60))
+    >>> get_flights_from_filter(filter, mode="auto", data_source="js")
+    >>> get_circuit_breakers().states()
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Awaitable, Callable, Deque, Dict, List, Literal, Optional, Sequence, Tuple, TypeVar
+
+from .exceptions import CircuitOpenError, FetchError, GoogleFlightsErrorResponse
+
+if TYPE_CHECKING:
+    from .core import FetchMode
+
+T = TypeVar("T")
+
+CircuitState = Literal["closed", "open", "half-open"]
+
+
+@dataclass(frozen=True)
+class BreakerPolicy:
+    """When a fetch mode's breaker opens, and for how long.
+
+    Args:
+        window (int, optional): Number of recent outcomes the failure rate is
+            computed over. Defaults to 20.
+        min_requests (int, optional): Outcomes needed in the window before the
+            breaker may open. Defaults to 5.
+        failure_rate (float, optional): Failed fraction of the window that
+            opens the breaker. Defaults to 0.5.
+        open_for (float, optional): Seconds the breaker stays open before it
+            lets a probe through. Defaults to 30.
+        half_open_probes (int, optional): Concurrent probe requests allowed
+            while half-open. Defaults to 1.
+    """
+
+    window: int = 20
+    min_requests: int = 5
+    failure_rate: float = 0.5
+    open_for: float = 30.0
+    half_open_probes: int = 1
+
+    def __post_init__(self):
+        assert self.window >= 1, "window must be >= 1"
+        assert 1 <= self.min_requests <= self.window, "min_requests must be in [1, window]"
+        assert 0 < self.failure_rate <= 1, "failure_rate must be in (0, 1]"
+        assert self.half_open_probes >= 1, "half_open_probes must be >= 1"
+
+
+class CircuitBreaker:
+    """A failure-rate circuit breaker for one fetch mode. Thread-safe."""
+
+    def __init__(self, mode: str, policy: BreakerPolicy, *, clock: Callable[[], float] = time.monotonic):
+        self.mode = mode
+        self.policy = policy
+        self._clock = clock
+        self._outcomes: Deque[bool] = deque(maxlen=policy.window)
+        self._opened_at: Optional[float] = None
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._state(self._clock())
+
+    def available(self) -> bool:
+        """Whether a request would currently be let through (without reserving it)."""
+        with self._lock:
+            state = self._state(self._clock())
+            return state == "closed" or (state == "half-open" and self._probes < self.policy.half_open_probes)
+
+    def retry_after(self) -> float:
+        """Seconds until the breaker lets a request through again (0 if it would now)."""
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(0.0, self._opened_at + self.policy.open_for - self._clock())
+
+    def acquire(self) -> bool:
+        """Reserve permission for one request. Returns whether it is a half-open probe.
+
+        Raises:
+            CircuitOpenError: The breaker is open (or out of probe slots).
+        """
+        with self._lock:
+            now = self._clock()
+            state = self._state(now)
+            if state == "closed":
+                return False
+            if state == "half-open" and self._probes < self.policy.half_open_probes:
+                self._probes += 1
+                return True
+            assert self._opened_at is not None
+            raise CircuitOpenError(self.mode, max(0.0, self._opened_at + self.policy.open_for - now))
+
+    def record(self, ok: bool, *, probe: bool = False) -> None:
+        """Record the outcome of a request let through by :meth:`acquire`."""
+        with self._lock:
+            if probe:
+                self._probes -= 1
+                if ok:
+                    self._opened_at = None
+                    self._outcomes.clear()
+                else:
+                    self._opened_at = self._clock()
+                return
+            if self._opened_at is not None:
+                return  # a request from before the breaker opened
+            self._outcomes.append(ok)
+            if len(self._outcomes) >= self.policy.min_requests:
+                failures = self._outcomes.count(False)
+                if failures / len(self._outcomes) >= self.policy.failure_rate:
+                    self._opened_at = self._clock()
+
+    def release(self, probe: bool) -> None:
+        """Give back a reservation whose request ended without an outcome (e.g. cancelled)."""
+        if probe:
+            with self._lock:
+                self._probes -= 1
+
+    def _state(self, now: float) -> CircuitState:
+        # Caller must hold self._lock.
+        if self._opened_at is None:
+            return "closed"
+        if now - self._opened_at >= self.policy.open_for:
+            return "half-open"
+        return "open"
+
+
+def is_fetch_failure(exc: BaseException) -> bool:
+    """Whether a fetch error says the mode itself is unhealthy.
+
+    Transport errors (primp raises ``RuntimeError``), timeouts, 429/5xx and
+    Playwright's browser or connection errors count; anything else, such as
+    a ``ValueError`` for a missing API key or a 404, does not.
+    """
+    if isinstance(exc, FetchError):
+        return exc.status_code == 429 or exc.status_code >= 500
+    if isinstance(exc, CircuitOpenError):
+        return False
+    if isinstance(exc, (RuntimeError, OSError, asyncio.TimeoutError)):
+        return True
+    # playwright is optional, so its errors are recognised by module.
+    return type(exc).__module__.split(".", 1)[0] == "playwright"
+
+
+def is_page_failure(exc: BaseException) -> bool:
+    """Whether failing to parse a fetched page counts against the mode.
+
+    A typed ``ErrorResponse`` is Google answering the query itself, so it
+    doesn't.
+    """
+    return isinstance(exc, Exception) and not isinstance(exc, GoogleFlightsErrorResponse)
+
+
+class Admission:
+    """A fetch let through by a breaker, judged once its page has been parsed.
+
+    Call :meth:`settle` exactly once: with no argument when the page parsed,
+    or with the parse error. Later calls are ignored.
+    """
+
+    __slots__ = ("_breaker", "_probe")
+
+    def __init__(self, breaker: Optional[CircuitBreaker], probe: bool = False):
+        self._breaker = breaker
+        self._probe = probe
+
+    def settle(self, error: Optional[BaseException] = None) -> None:
+        breaker, self._breaker = self._breaker, None
+        if breaker is None:
+            return
+        if error is None:
+            breaker.record(True, probe=self._probe)
+        elif is_page_failure(error):
+            breaker.record(False, probe=self._probe)
+        else:
+            breaker.release(self._probe)
+
+
+SETTLED = Admission(None)
+
+
+def _fetch_failed(breaker: CircuitBreaker, probe: bool, exc: BaseException) -> None:
+    if is_fetch_failure(exc):
+        breaker.record(False, probe=probe)
+    else:
+        breaker.release(probe)
+
+
+def _configured_modes() -> List["FetchMode"]:
+    modes: List["FetchMode"] = ["common"]
+    if os.environ.get("BRIGHT_DATA_API_KEY"):
+        modes.append("bright-data")
+    if os.environ.get("BROWSERLESS_API_KEY"):
+        modes.append("browserless")
+    modes.append("force-fallback")
+    return modes
+
+
+class CircuitBreakers:
+    """One breaker per fetch mode, plus the routing for ``mode="auto"``.
+
+    Args:
+        policy (BreakerPolicy, optional): Policy for every mode's breaker;
+            None disables breaking (outcomes are ignored and nothing is
+            refused). Defaults to ``BreakerPolicy()``.
+        auto_modes (sequence of str, optional): Modes ``mode="auto"`` tries,
+            cheapest first. Defaults to ``common``, then ``bright-data`` and
+            ``browserless`` when their API keys are set, then
+            ``force-fallback``.
+    """
+
+    def __init__(
+        self,
+        policy: Optional[BreakerPolicy] = BreakerPolicy(),
+        *,
+        auto_modes: Optional[Sequence["FetchMode"]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        assert auto_modes is None or "auto" not in auto_modes, "auto_modes cannot contain 'auto'"
+        self.policy = policy
+        self.auto_modes: Optional[Tuple["FetchMode", ...]] = tuple(auto_modes) if auto_modes is not None else None
+        self._clock = clock
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, mode: str) -> Optional[CircuitBreaker]:
+        """The breaker for ``mode``, or None when breaking is disabled."""
+        if self.policy is None:
+            return None
+        with self._lock:
+            breaker = self._breakers.get(mode)
+            if breaker is None:
+                breaker = self._breakers[mode] = CircuitBreaker(mode, self.policy, clock=self._clock)
+            return breaker
+
+    def admit(self, mode: str, fetch: Callable[[], T]) -> Tuple[T, Admission]:
+        """Run ``fetch()`` as one request of ``mode``, guarded by its breaker.
+
+        A failed fetch is recorded straight away. A successful one is judged
+        when the caller settles the returned :class:`Admission` after parsing.
+
+        Raises:
+            CircuitOpenError: The mode's breaker is open.
+        """
+        breaker = self.breaker(mode)
+        if breaker is None:
+            return fetch(), SETTLED
+        probe = breaker.acquire()
+        try:
+            value = fetch()
+        except BaseException as e:
+            _fetch_failed(breaker, probe, e)
+            raise
+        return value, Admission(breaker, probe)
+
+    async def admit_async(self, mode: str, fetch: Callable[[], Awaitable[T]]) -> Tuple[T, Admission]:
+        """Async variant of :meth:`admit`."""
+        breaker = self.breaker(mode)
+        if breaker is None:
+            return await fetch(), SETTLED
+        probe = breaker.acquire()
+        try:
+            value = await fetch()
+        except BaseException as e:
+            _fetch_failed(breaker, probe, e)
+            raise
+        return value, Admission(breaker, probe)
+
+    def call(self, mode: str, fn: Callable[[], T]) -> T:
+        """Run ``fn()`` as one complete request of ``mode``, guarded by its breaker."""
+        value, admission = self.admit(mode, fn)
+        admission.settle()
+        return value
+
+    async def call_async(self, mode: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Async variant of :meth:`call`."""
+        value, admission = await self.admit_async(mode, fn)
+        admission.settle()
+        return value
+
+    def route(self) -> List["FetchMode"]:
+        """Modes ``mode="auto"`` should try, cheapest first, skipping open breakers.
+
+        Raises:
+            CircuitOpenError: Every candidate mode is open.
+        """
+        modes = list(self.auto_modes) if self.auto_modes is not None else _configured_modes()
+        if self.policy is None:
+            return modes
+        healthy: List["FetchMode"] = [m for m in modes if self.breaker(m).available()]  # type: ignore[union-attr]
+        if not healthy:
+            raise CircuitOpenError("auto", min(self.breaker(m).retry_after() for m in modes))  # type: ignore[union-attr]
+        return healthy
+
+    def states(self) -> Dict[str, CircuitState]:
+        """Current state of every breaker that has seen traffic."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {b.mode: b.state for b in breakers}
+
+
+_circuit_breakers = CircuitBreakers(policy=None)
+
+
+def get_circuit_breakers() -> CircuitBreakers:
+    """Return the process-wide circuit breakers consulted by every fetch."""
+    return _circuit_breakers
+
+
+def configure_circuit_breakers(
+    policy: Optional[BreakerPolicy] = BreakerPolicy(),
+    *,
+    auto_modes: Optional[Sequence["FetchMode"]] = None,
+) -> CircuitBreakers:
+    """Replace the process-wide circuit breakers; ``policy=None`` disables them.
+
+    Args:
+        policy (BreakerPolicy, optional): Policy for every mode's breaker.
+        auto_modes (sequence of str, optional): Modes ``mode="auto"`` tries,
+            cheapest first.
+    """
+    global _circuit_breakers
+    _circuit_breakers = CircuitBreakers(policy, auto_modes=auto_modes)
+    return _circuit_breakers
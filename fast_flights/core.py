@@ -1,15 +1,18 @@
+import asyncio
+import functools
 import hashlib
-import json
 import re
 import sys
-from typing import List, Literal, Optional, Union, overload
+from typing import Any, Callable, List, Literal, Optional, Tuple, TypeVar, Union, overload
 
 from selectolax.lexbor import LexborHTMLParser, LexborNode
 
-from .decoder import DecodedResult, ResultDecoder
-from .exceptions import GoogleFlightsErrorResponse
+from . import _json
+from .decoder import DecodedResult, KeepRaw, ResultDecoder
+from .exceptions import FetchError, GoogleFlightsErrorResponse
 from .schema import Flight, Result
 from .flights_impl import FlightData, Passengers
+from .hedging import get_hedger
 from .filter import TFSData
 # fallback_playwright_fetch / local_playwright_fetch are imported lazily inside
 # the functions that use them — keeping them at module top-level would make
@@ -17,64 +20,446 @@ from .filter import TFSData
 # caller, even those that never invoke fallback mode. See
 # https://github.com/jimmyliu03/google-flights/issues for context.
 from .bright_data_fetch import bright_data_fetch
-from .browserless_fetch import browserless_fetch
-from .primp import Client, Response
+from .cache import CachedResponse, ResponseCache, cache_key
+from .circuit_breaker import SETTLED, Admission, get_circuit_breakers
+from .diagnostics import get_error_payload_sink, logger
+from .browserless_fetch import browserless_fetch, browserless_fetch_async
+from .primp import Response
+from .proxy_pool import ProxyLike, ProxyPool
+from .rate_limit import get_rate_limiter
+from .retry import get_retry_policy
+from .session_pool import get_session_pool
+from .single_flight import get_single_flight, search_key
+from .tracing import get_tracer
+from .urls import FLIGHTS_URL
 
 
 DataSource = Literal['html', 'js']
+T = TypeVar('T')
 
 _GOOGLE_ERROR_RESPONSE_MARKER = "type.googleapis.com/travel.frontend.flights.ErrorResponse"
-_RAW_ERROR_RESPONSE_CHUNK_SIZE = 8000
 
 
-def _dump_google_error_response_payload(raw_data_json: str) -> str:
-    """Emit exact Google ErrorResponse ``ds:1`` JSON for postmortem debugging.
+def _dump_google_error_response_payload(raw_data_json: str) -> Tuple[str, str]:
+    """Hand exact Google ErrorResponse ``ds:1`` JSON to the payload sink for postmortems.
 
-    Vercel can truncate large individual log lines, so the payload is printed
-    in deterministic chunks with a checksum. This only fires after the exact
-    ErrorResponse protobuf type URL is present in the parsed ``script.ds:1``
-    payload; normal flight result payloads are never dumped.
+    This only fires after the exact ErrorResponse protobuf type URL is present
+    in the parsed ``script.ds:1`` payload; normal flight result payloads are
+    never dumped. By default the payload is printed to stderr in checksummed
+    chunks; see :func:`~fast_flights.diagnostics.configure_error_payload_sink`.
 
-    Returns the SHA-256 digest so callers can include it in the raised error.
+    Returns the SHA-256 digest and where the payload went, for the raised error.
     """
     digest = hashlib.sha256(raw_data_json.encode("utf-8")).hexdigest()
-    total = (len(raw_data_json) + _RAW_ERROR_RESPONSE_CHUNK_SIZE - 1) // _RAW_ERROR_RESPONSE_CHUNK_SIZE
-    print(
-        "[fast_flights][ERROR_RESPONSE_RAW][BEGIN] "
-        f"bytes={len(raw_data_json.encode('utf-8'))} chars={len(raw_data_json)} "
-        f"sha256={digest} chunks={total}",
-        file=sys.stderr,
-        flush=True,
+    sink = get_error_payload_sink()
+    logger.error(
+        "Google Flights returned an ErrorResponse payload sha256=%s (sent to %s)",
+        digest,
+        sink.description,
+        extra={"event": "error_response", "sha256": digest, "chars": len(raw_data_json)},
     )
-    for index in range(total):
-        start = index * _RAW_ERROR_RESPONSE_CHUNK_SIZE
-        chunk = raw_data_json[start:start + _RAW_ERROR_RESPONSE_CHUNK_SIZE]
-        print(
-            f"[fast_flights][ERROR_RESPONSE_RAW][{index + 1}/{total}] {chunk}",
-            file=sys.stderr,
-            flush=True,
-        )
-    print(
-        f"[fast_flights][ERROR_RESPONSE_RAW][END] sha256={digest}",
-        file=sys.stderr,
-        flush=True,
-    )
-    return digest
+    sink.submit(digest, raw_data_json)
+    return digest, sink.description
+
+# A fetched page, or the stand-in built from a cache hit.
+FetchedResponse = Union[Response, CachedResponse]
+
+FetchMode = Literal["common", "fallback", "force-fallback", "local", "bright-data", "browserless", "hedged", "auto"]
+
+
+def _scan_ds1_data(html: str) -> Optional[str]:
+    """Slice the ``data:[...]`` array out of the ``ds:1`` script without a DOM.
+
+    Mirrors ``re.search(r'^.*?\\{.*?data:(\\[.*\\]).*\\}', script)`` over the
+    ``script.ds:1`` text: the array runs from the first ``data:[`` after the
+    first ``{`` to the last ``]`` that is still followed by a ``}``. Every
+    step is a ``str.find``/``rfind`` so the multi-megabyte page is scanned
+    in C, never tokenised.
+
+    Returns ``None`` whenever the page doesn't have the expected shape; the
+    caller then falls back to the Lexbor + regex path.
+    """
+    marker = html.find('class="ds:1"')
+    if marker == -1:
+        return None
+    tag_start = html.rfind("<", 0, marker)
+    if tag_start == -1 or html[tag_start + 1:tag_start + 7].lower() != "script":
+        return None
+    body_start = html.find(">", marker) + 1
+    if body_start == 0:
+        return None
+    body_end = html.find("</script", body_start)
+    if body_end == -1:
+        return None
+
+    brace = html.find("{", body_start, body_end)
+    if brace == -1:
+        return None
+    data = html.find("data:", brace, body_end)
+    if data == -1 or html[data + 5:data + 6] != "[":
+        return None
+    closing_brace = html.rfind("}", data, body_end)
+    if closing_brace == -1:
+        return None
+    end = html.rfind("]", data, closing_brace)
+    if end == -1:
+        return None
+    # ``.`` in the regex doesn't cross newlines; leave that case to the regex.
+    if html.find("\n", body_start, closing_brace) != -1:
+        return None
+    return html[data + 5:end + 1]
+
 
 def fetch(params: dict, proxy: Optional[str] = None) -> Response:
-    client = Client(impersonate="chrome_126", verify=False, proxy=proxy)
-    res = client.get("https://www.google.com/travel/flights", params=params)
-    assert res.status_code == 200, f"{res.status_code} Result: {res.text_markdown}"
+    with get_session_pool().session(proxy=proxy, impersonate="chrome_126", verify=False) as client:
+        res = client.get(FLIGHTS_URL, params=params)
+    if res.status_code != 200:
+        raise FetchError.from_response(res, res.text_markdown)
     return res
 
+
+def _build_params(tfs: str, currency: str, tfu: str) -> dict:
+    return {
+        "tfs": tfs,
+        "hl": "en",
+        "gl": "US",  # Pinned for fred-app D-API-04 — prevents currency drift at non-US edge locations
+        "tfu": tfu,
+        "curr": currency,
+    }
+
+
+def _fetch_with_mode(params: dict, mode: FetchMode, proxy: ProxyLike) -> Tuple[Response, Admission]:
+    limiter = get_rate_limiter()
+    breakers = get_circuit_breakers()
+    retry = get_retry_policy()
+
+    def force_fallback() -> Response:
+        from .fallback_playwright import fallback_playwright_fetch
+        limiter.acquire("force-fallback")
+        return fallback_playwright_fetch(params)
+
+    if mode in {"common", "fallback"}:
+        def attempt() -> Response:
+            if not isinstance(proxy, ProxyPool):
+                limiter.acquire("common", proxy)
+                return fetch(params, proxy=proxy)
+            chosen = proxy.choose()
+            limiter.acquire("common", chosen)
+            with proxy.track(chosen):
+                return fetch(params, proxy=chosen)
+
+        try:
+            # Transient 429/5xx are retried here before paying for a browser;
+            # an open breaker skips the request altogether. The breaker's
+            # verdict waits until the caller has parsed the page.
+            return breakers.admit("common", functools.partial(retry.call, attempt))
+        except AssertionError as e:
+            if mode == "fallback":
+                _trace_fallback("common", "force-fallback", e)
+                return breakers.admit("force-fallback", force_fallback)
+            raise e
+
+    elif mode == "local":
+        def local() -> Response:
+            from .local_playwright import local_playwright_fetch
+
+            limiter.acquire("local")
+            return local_playwright_fetch(params)
+
+        return breakers.admit("local", local)
+
+    elif mode == "bright-data":
+        def attempt_bright_data() -> Response:
+            limiter.acquire("bright-data")
+            return bright_data_fetch(params)
+
+        return breakers.admit("bright-data", functools.partial(retry.call, attempt_bright_data))
+
+    elif mode == "browserless":
+        def browserless() -> Response:
+            limiter.acquire("browserless")
+            return browserless_fetch(params)
+
+        return breakers.admit("browserless", browserless)
+
+    return breakers.admit("force-fallback", force_fallback)
+
+
+async def _run_blocking(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    # primp is synchronous; run it on the loop's default executor so the
+    # event loop stays free for other searches.
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(fn, *args, **kwargs))
+
+
+async def _fetch_with_mode_async(params: dict, mode: FetchMode, proxy: ProxyLike) -> Tuple[Response, Admission]:
+    limiter = get_rate_limiter()
+    breakers = get_circuit_breakers()
+    retry = get_retry_policy()
+
+    async def force_fallback() -> Response:
+        from .fallback_playwright import fallback_playwright_fetch
+        await limiter.acquire_async("force-fallback")
+        return await _run_blocking(fallback_playwright_fetch, params)
+
+    if mode in {"common", "fallback"}:
+        async def attempt() -> Response:
+            if not isinstance(proxy, ProxyPool):
+                await limiter.acquire_async("common", proxy)
+                return await _run_blocking(fetch, params, proxy=proxy)
+            chosen = proxy.choose()
+            await limiter.acquire_async("common", chosen)
+            with proxy.track(chosen):
+                return await _run_blocking(fetch, params, proxy=chosen)
+
+        try:
+            return await breakers.admit_async("common", functools.partial(retry.call_async, attempt))
+        except AssertionError as e:
+            if mode == "fallback":
+                _trace_fallback("common", "force-fallback", e)
+                return await breakers.admit_async("force-fallback", force_fallback)
+            raise e
+
+    elif mode == "local":
+        async def local() -> Response:
+            from .local_playwright import local_playwright_fetch_async
+
+            await limiter.acquire_async("local")
+            return await local_playwright_fetch_async(params)
+
+        return await breakers.admit_async("local", local)
+
+    elif mode == "bright-data":
+        async def attempt_bright_data() -> Response:
+            await limiter.acquire_async("bright-data")
+            return await _run_blocking(bright_data_fetch, params)
+
+        return await breakers.admit_async("bright-data", functools.partial(retry.call_async, attempt_bright_data))
+
+    elif mode == "browserless":
+        async def browserless() -> Response:
+            await limiter.acquire_async("browserless")
+            return await browserless_fetch_async(params)
+
+        return await breakers.admit_async("browserless", browserless)
+
+    return await breakers.admit_async("force-fallback", force_fallback)
+
+
+def _fetch_traced(
+    params: dict, mode: FetchMode, proxy: ProxyLike, cached: Optional[str] = None
+) -> Tuple[FetchedResponse, Admission]:
+    tracer = get_tracer()
+    with tracer.span("fast_flights.fetch", {"mode": mode, "cache_hit": cached is not None}) as span:
+        if cached is not None:
+            res, admission = CachedResponse(cached), SETTLED
+        else:
+            res, admission = _fetch_with_mode(params, mode, proxy)
+        if tracer.enabled:
+            span.set_attribute("bytes", len(res.text.encode("utf-8")))
+    return res, admission
+
+
+async def _fetch_traced_async(
+    params: dict, mode: FetchMode, proxy: ProxyLike, cached: Optional[str] = None
+) -> Tuple[FetchedResponse, Admission]:
+    tracer = get_tracer()
+    with tracer.span("fast_flights.fetch", {"mode": mode, "cache_hit": cached is not None}) as span:
+        if cached is not None:
+            res, admission = CachedResponse(cached), SETTLED
+        else:
+            res, admission = await _fetch_with_mode_async(params, mode, proxy)
+        if tracer.enabled:
+            span.set_attribute("bytes", len(res.text.encode("utf-8")))
+    return res, admission
+
+
+def _parse_settling(
+    res: FetchedResponse,
+    admission: Admission,
+    data_source: DataSource,
+    tfu: str,
+    keep_raw: KeepRaw,
+) -> Union[Result, DecodedResult, None]:
+    # A blocked or consent page arrives as a 200; only a page that parses
+    # counts as a success for the breaker of the mode that fetched it.
+    try:
+        result = parse_response(res, data_source, tfu=tfu, keep_raw=keep_raw)
+    except BaseException as e:
+        admission.settle(e)
+        raise
+    admission.settle()
+    return result
+
+
+def _trace_fallback(from_mode: str, to_mode: str, error: BaseException) -> None:
+    get_tracer().event(
+        "fast_flights.fallback",
+        {"from_mode": from_mode, "to_mode": to_mode, "reason": type(error).__name__},
+    )
+
+
+def _fetch_and_parse(
+    params: dict,
+    mode: FetchMode,
+    proxy: ProxyLike,
+    data_source: DataSource,
+    tfu: str,
+    keep_raw: KeepRaw,
+) -> Tuple[FetchedResponse, Union[Result, DecodedResult, None]]:
+    # One leg of a hedged or auto search: it only "wins" once its page has parsed.
+    res, admission = _fetch_traced(params, mode, proxy)
+    return res, _parse_settling(res, admission, data_source, tfu, keep_raw)
+
+
+async def _fetch_and_parse_async(
+    params: dict,
+    mode: FetchMode,
+    proxy: ProxyLike,
+    data_source: DataSource,
+    tfu: str,
+    keep_raw: KeepRaw,
+) -> Tuple[FetchedResponse, Union[Result, DecodedResult, None]]:
+    res, admission = await _fetch_traced_async(params, mode, proxy)
+    return res, _parse_settling(res, admission, data_source, tfu, keep_raw)
+
+
+def _fetch_and_parse_routed(
+    params: dict,
+    mode: FetchMode,
+    proxy: ProxyLike,
+    data_source: DataSource,
+    tfu: str,
+    keep_raw: KeepRaw,
+) -> Tuple[FetchedResponse, Union[Result, DecodedResult, None]]:
+    """Run a ``hedged`` or ``auto`` search, where the mode is picked per request."""
+    leg = functools.partial(_fetch_and_parse, params, proxy=proxy, data_source=data_source, tfu=tfu, keep_raw=keep_raw)
+    if mode == "hedged":
+        hedger = get_hedger()
+        return hedger.run(
+            functools.partial(leg, mode=hedger.policy.primary),
+            functools.partial(leg, mode=hedger.policy.secondary),
+        )
+
+    error: Optional[Exception] = None
+    modes = get_circuit_breakers().route()
+    for i, candidate in enumerate(modes):
+        try:
+            return leg(mode=candidate)
+        except Exception as e:
+            error = e
+            if i + 1 < len(modes):
+                _trace_fallback(candidate, modes[i + 1], e)
+    assert error is not None
+    raise error
+
+
+async def _fetch_and_parse_routed_async(
+    params: dict,
+    mode: FetchMode,
+    proxy: ProxyLike,
+    data_source: DataSource,
+    tfu: str,
+    keep_raw: KeepRaw,
+) -> Tuple[FetchedResponse, Union[Result, DecodedResult, None]]:
+    leg = functools.partial(_fetch_and_parse_async, params, proxy=proxy, data_source=data_source, tfu=tfu, keep_raw=keep_raw)
+    if mode == "hedged":
+        hedger = get_hedger()
+        return await hedger.run_async(
+            functools.partial(leg, mode=hedger.policy.primary),
+            functools.partial(leg, mode=hedger.policy.secondary),
+        )
+
+    error: Optional[Exception] = None
+    modes = get_circuit_breakers().route()
+    for i, candidate in enumerate(modes):
+        try:
+            return await leg(mode=candidate)
+        except Exception as e:
+            error = e
+            if i + 1 < len(modes):
+                _trace_fallback(candidate, modes[i + 1], e)
+    assert error is not None
+    raise error
+
+
+def _search(
+    params: dict,
+    mode: FetchMode,
+    data_source: DataSource,
+    tfu: str,
+    proxy: ProxyLike,
+    cache: Optional[ResponseCache],
+    keep_raw: KeepRaw,
+) -> Union[Result, DecodedResult, None]:
+    """Cache lookup, fetch and parse for one search (one single-flight unit)."""
+    key = cache_key(params, mode) if cache is not None else None
+    cached = cache.get(key) if cache is not None and key is not None else None
+    if mode in {"hedged", "auto"} and cached is None:
+        res, result = _fetch_and_parse_routed(params, mode, proxy, data_source, tfu, keep_raw)
+        if cache is not None and key is not None:
+            cache.set(key, res.text)
+        return result
+
+    res, admission = _fetch_traced(params, mode, proxy, cached)
+
+    try:
+        result = _parse_settling(res, admission, data_source, tfu, keep_raw)
+    except RuntimeError as e:
+        if mode == "fallback":
+            _trace_fallback("fallback", "force-fallback", e)
+            return _search(params, "force-fallback", data_source, tfu, proxy, cache, keep_raw)
+        raise e
+
+    # Only bodies that parsed cleanly are cached.
+    if cache is not None and key is not None and cached is None:
+        cache.set(key, res.text)
+    return result
+
+
+async def _search_async(
+    params: dict,
+    mode: FetchMode,
+    data_source: DataSource,
+    tfu: str,
+    proxy: ProxyLike,
+    cache: Optional[ResponseCache],
+    keep_raw: KeepRaw,
+) -> Union[Result, DecodedResult, None]:
+    key = cache_key(params, mode) if cache is not None else None
+    cached = cache.get(key) if cache is not None and key is not None else None
+    if mode in {"hedged", "auto"} and cached is None:
+        res, result = await _fetch_and_parse_routed_async(params, mode, proxy, data_source, tfu, keep_raw)
+        if cache is not None and key is not None:
+            cache.set(key, res.text)
+        return result
+
+    res, admission = await _fetch_traced_async(params, mode, proxy, cached)
+
+    try:
+        result = _parse_settling(res, admission, data_source, tfu, keep_raw)
+    except RuntimeError as e:
+        if mode == "fallback":
+            _trace_fallback("fallback", "force-fallback", e)
+            return await _search_async(params, "force-fallback", data_source, tfu, proxy, cache, keep_raw)
+        raise e
+
+    if cache is not None and key is not None and cached is None:
+        cache.set(key, res.text)
+    return result
+
+
 @overload
 def get_flights_from_filter(
     filter: TFSData,
     currency: str = "",
     *,
-    mode: Literal["common", "fallback", "force-fallback", "local", "bright-data", "browserless"] = "common",
+    mode: FetchMode = "common",
     data_source: Literal['js'] = ...,
-    proxy: Optional[str] = None,
+    tfu: str = "EgQIABABIgA",
+    proxy: ProxyLike = None,
+    cache: Optional[ResponseCache] = None,
+    keep_raw: KeepRaw = True,
 ) -> Union[DecodedResult, None]: ...
 
 @overload
@@ -82,61 +467,121 @@ def get_flights_from_filter(
     filter: TFSData,
     currency: str = "",
     *,
-    mode: Literal["common", "fallback", "force-fallback", "local", "bright-data", "browserless"] = "common",
+    mode: FetchMode = "common",
     data_source: Literal['html'],
-    proxy: Optional[str] = None,
+    tfu: str = "EgQIABABIgA",
+    proxy: ProxyLike = None,
+    cache: Optional[ResponseCache] = None,
+    keep_raw: KeepRaw = True,
 ) -> Result: ...
 
+@overload
+def get_flights_from_filter(
+    filter: TFSData,
+    currency: str = "",
+    *,
+    mode: FetchMode = "common",
+    data_source: DataSource,
+    tfu: str = "EgQIABABIgA",
+    proxy: ProxyLike = None,
+    cache: Optional[ResponseCache] = None,
+    keep_raw: KeepRaw = True,
+) -> Union[Result, DecodedResult, None]: ...
+
 def get_flights_from_filter(
     filter: TFSData,
     currency: str = "",
     *,
-    mode: Literal["common", "fallback", "force-fallback", "local", "bright-data", "browserless"] = "common",
+    mode: FetchMode = "common",
     data_source: DataSource = 'html',
     tfu: str = "EgQIABABIgA",
-    proxy: Optional[str] = None,
+    proxy: ProxyLike = None,
+    cache: Optional[ResponseCache] = None,
+    keep_raw: KeepRaw = True,
 ) -> Union[Result, DecodedResult, None]:
-    data = filter.as_b64()
+    with get_tracer().span("fast_flights.encode_tfs"):
+        data = filter.as_b64()
 
-    params = {
-        "tfs": data.decode("utf-8"),
-        "hl": "en",
-        "gl": "US",  # Pinned for fred-app D-API-04 — prevents currency drift at non-US edge locations
-        "tfu": tfu,
-        "curr": currency,
-    }
+    return get_flights_from_tfs(
+        data.decode("utf-8"),
+        currency,
+        mode=mode,
+        data_source=data_source,
+        tfu=tfu,
+        proxy=proxy,
+        cache=cache,
+        keep_raw=keep_raw,
+    )
 
-    if mode in {"common", "fallback"}:
-        try:
-            res = fetch(params, proxy=proxy)
-        except AssertionError as e:
-            if mode == "fallback":
-                from .fallback_playwright import fallback_playwright_fetch
-                res = fallback_playwright_fetch(params)
-            else:
-                raise e
 
-    elif mode == "local":
-        from .local_playwright import local_playwright_fetch
+@overload
+async def get_flights_from_filter_async(
+    filter: TFSData,
+    currency: str = "",
+    *,
+    mode: FetchMode = "common",
+    data_source: Literal['js'] = ...,
+    tfu: str = "EgQIABABIgA",
+    proxy: ProxyLike = None,
+    cache: Optional[ResponseCache] = None,
+    keep_raw: KeepRaw = True,
+) -> Union[DecodedResult, None]: ...
 
-        res = local_playwright_fetch(params)
+@overload
+async def get_flights_from_filter_async(
+    filter: TFSData,
+    currency: str = "",
+    *,
+    mode: FetchMode = "common",
+    data_source: Literal['html'],
+    tfu: str = "EgQIABABIgA",
+    proxy: ProxyLike = None,
+    cache: Optional[ResponseCache] = None,
+    keep_raw: KeepRaw = True,
+) -> Result: ...
 
-    elif mode == "bright-data":
-        res = bright_data_fetch(params)
+@overload
+async def get_flights_from_filter_async(
+    filter: TFSData,
+    currency: str = "",
+    *,
+    mode: FetchMode = "common",
+    data_source: DataSource,
+    tfu: str = "EgQIABABIgA",
+    proxy: ProxyLike = None,
+    cache: Optional[ResponseCache] = None,
+    keep_raw: KeepRaw = True,
+) -> Union[Result, DecodedResult, None]: ...
 
-    elif mode == "browserless":
-        res = browserless_fetch(params)
+async def get_flights_from_filter_async(
+    filter: TFSData,
+    currency: str = "",
+    *,
+    mode: FetchMode = "common",
+    data_source: DataSource = 'html',
+    tfu: str = "EgQIABABIgA",
+    proxy: ProxyLike = None,
+    cache: Optional[ResponseCache] = None,
+    keep_raw: KeepRaw = True,
+) -> Union[Result, DecodedResult, None]:
+    """Async variant of :func:`get_flights_from_filter`.
 
-    else:
-        from .fallback_playwright import fallback_playwright_fetch
-        res = fallback_playwright_fetch(params)
+    Safe to call from a running event loop and to run concurrently with
+    ``asyncio.gather``.
+    """
+    with get_tracer().span("fast_flights.encode_tfs"):
+        data = filter.as_b64()
 
-    try:
-        return parse_response(res, data_source, tfu=tfu)
-    except RuntimeError as e:
-        if mode == "fallback":
-            return get_flights_from_filter(filter, currency=currency, mode="force-fallback", data_source=data_source, tfu=tfu, proxy=proxy)
-        raise e
+    return await get_flights_from_tfs_async(
+        data.decode("utf-8"),
+        currency,
+        mode=mode,
+        data_source=data_source,
+        tfu=tfu,
+        proxy=proxy,
+        cache=cache,
+        keep_raw=keep_raw,
+    )
 
 
 def get_flights(
@@ -145,11 +590,13 @@ def get_flights(
     trip: Literal["round-trip", "one-way", "multi-city"],
     passengers: Passengers,
     seat: Literal["economy", "premium-economy", "business", "first"],
-    fetch_mode: Literal["common", "fallback", "force-fallback", "local", "bright-data"] = "common",
+    fetch_mode: FetchMode = "common",
     max_stops: Optional[int] = None,
     exclude_basic_economy: bool = False,
     data_source: DataSource = 'html',
-    proxy: Optional[str] = None,
+    proxy: ProxyLike = None,
+    cache: Optional[ResponseCache] = None,
+    keep_raw: KeepRaw = True,
 ) -> Union[Result, DecodedResult, None]:
     return get_flights_from_filter(
         TFSData.from_interface(
@@ -163,6 +610,40 @@ def get_flights(
         mode=fetch_mode,
         data_source=data_source,
         proxy=proxy,
+        cache=cache,
+        keep_raw=keep_raw,
+    )
+
+
+async def get_flights_async(
+    *,
+    flight_data: List[FlightData],
+    trip: Literal["round-trip", "one-way", "multi-city"],
+    passengers: Passengers,
+    seat: Literal["economy", "premium-economy", "business", "first"],
+    fetch_mode: FetchMode = "common",
+    max_stops: Optional[int] = None,
+    exclude_basic_economy: bool = False,
+    data_source: DataSource = 'html',
+    proxy: ProxyLike = None,
+    cache: Optional[ResponseCache] = None,
+    keep_raw: KeepRaw = True,
+) -> Union[Result, DecodedResult, None]:
+    """Async variant of :func:`get_flights`."""
+    return await get_flights_from_filter_async(
+        TFSData.from_interface(
+            flight_data=flight_data,
+            trip=trip,
+            passengers=passengers,
+            seat=seat,
+            max_stops=max_stops,
+            exclude_basic_economy=exclude_basic_economy,
+        ),
+        mode=fetch_mode,
+        data_source=data_source,
+        proxy=proxy,
+        cache=cache,
+        keep_raw=keep_raw,
     )
 
 
@@ -171,9 +652,12 @@ def get_flights_from_tfs(
     tfs: str,
     currency: str = "",
     *,
-    mode: Literal["common", "fallback", "force-fallback", "local", "bright-data", "browserless"] = "common",
+    mode: FetchMode = "common",
     data_source: Literal['js'] = ...,
-    proxy: Optional[str] = None,
+    tfu: str = "EgQIABABIgA",
+    proxy: ProxyLike = None,
+    cache: Optional[ResponseCache] = None,
+    keep_raw: KeepRaw = True,
 ) -> Union[DecodedResult, None]: ...
 
 @overload
@@ -181,19 +665,37 @@ def get_flights_from_tfs(
     tfs: str,
     currency: str = "",
     *,
-    mode: Literal["common", "fallback", "force-fallback", "local", "bright-data", "browserless"] = "common",
+    mode: FetchMode = "common",
     data_source: Literal['html'],
-    proxy: Optional[str] = None,
+    tfu: str = "EgQIABABIgA",
+    proxy: ProxyLike = None,
+    cache: Optional[ResponseCache] = None,
+    keep_raw: KeepRaw = True,
 ) -> Result: ...
 
+@overload
+def get_flights_from_tfs(
+    tfs: str,
+    currency: str = "",
+    *,
+    mode: FetchMode = "common",
+    data_source: DataSource,
+    tfu: str = "EgQIABABIgA",
+    proxy: ProxyLike = None,
+    cache: Optional[ResponseCache] = None,
+    keep_raw: KeepRaw = True,
+) -> Union[Result, DecodedResult, None]: ...
+
 def get_flights_from_tfs(
     tfs: str,
     currency: str = "",
     *,
-    mode: Literal["common", "fallback", "force-fallback", "local", "bright-data", "browserless"] = "common",
+    mode: FetchMode = "common",
     data_source: DataSource = 'html',
     tfu: str = "EgQIABABIgA",
-    proxy: Optional[str] = None,
+    proxy: ProxyLike = None,
+    cache: Optional[ResponseCache] = None,
+    keep_raw: KeepRaw = True,
 ) -> Union[Result, DecodedResult, None]:
     """Fetch flights from a raw TFS (base64-encoded protobuf) string.
 
@@ -202,10 +704,19 @@ def get_flights_from_tfs(
     Args:
         tfs (str): Base64-encoded TFS parameter (e.g., from create_return_flight_filter).
         currency (str, optional): Currency code for prices. Defaults to "".
-        mode (str, optional): Fetch mode. Defaults to "common".
+        mode (str, optional): Fetch mode; "hedged" races two modes as
+            configured by :func:`configure_hedging`, "auto" tries the
+            cheapest mode whose circuit breaker is closed. Defaults to "common".
         data_source (str, optional): Data source ('html' or 'js'). Defaults to 'html'.
         tfu (str, optional): TFU parameter for Google Flights. Defaults to "EgQIABABIgA".
-        proxy (str, optional): Proxy URL for HTTP requests. Defaults to None.
+        proxy (str or ProxyPool, optional): Proxy URL for HTTP requests, or
+            a ProxyPool to rotate through. Defaults to None.
+        cache (ResponseCache, optional): Response body cache. A hit skips the
+            fetch but is still parsed. Defaults to None (no caching).
+        keep_raw (bool or "lazy", optional): What ``DecodedResult.raw`` retains
+            for ``data_source='js'``: the parsed tree (True), nothing (False),
+            or the JSON text, parsed again on first access ("lazy").
+            Defaults to True.
 
     Returns:
         Result or DecodedResult: Flight search results.
@@ -222,54 +733,128 @@ def get_flights_from_tfs(
         ... )
         >>> return_flights = get_flights_from_tfs(tfs, data_source='js')
     """
-    params = {
-        "tfs": tfs,
-        "hl": "en",
-        "gl": "US",  # Pinned for fred-app D-API-04 — prevents currency drift at non-US edge locations
-        "tfu": tfu,
-        "curr": currency,
-    }
+    params = _build_params(tfs, currency, tfu)
 
-    if mode in {"common", "fallback"}:
-        try:
-            res = fetch(params, proxy=proxy)
-        except AssertionError as e:
-            if mode == "fallback":
-                from .fallback_playwright import fallback_playwright_fetch
-                res = fallback_playwright_fetch(params)
-            else:
-                raise e
+    search = functools.partial(_search, params, mode, data_source, tfu, proxy, cache, keep_raw)
+    single_flight = get_single_flight()
+    with get_tracer().span("fast_flights.search", {"mode": mode, "data_source": data_source}):
+        if single_flight is None:
+            return search()
+        return single_flight.do(search_key(params, mode, data_source, keep_raw), search)
 
-    elif mode == "local":
-        from .local_playwright import local_playwright_fetch
 
-        res = local_playwright_fetch(params)
+@overload
+async def get_flights_from_tfs_async(
+    tfs: str,
+    currency: str = "",
+    *,
+    mode: FetchMode = "common",
+    data_source: Literal['js'] = ...,
+    tfu: str = "EgQIABABIgA",
+    proxy: ProxyLike = None,
+    cache: Optional[ResponseCache] = None,
+    keep_raw: KeepRaw = True,
+) -> Union[DecodedResult, None]: ...
 
-    elif mode == "bright-data":
-        res = bright_data_fetch(params)
+@overload
+async def get_flights_from_tfs_async(
+    tfs: str,
+    currency: str = "",
+    *,
+    mode: FetchMode = "common",
+    data_source: Literal['html'],
+    tfu: str = "EgQIABABIgA",
+    proxy: ProxyLike = None,
+    cache: Optional[ResponseCache] = None,
+    keep_raw: KeepRaw = True,
+) -> Result: ...
 
-    elif mode == "browserless":
-        res = browserless_fetch(params)
+@overload
+async def get_flights_from_tfs_async(
+    tfs: str,
+    currency: str = "",
+    *,
+    mode: FetchMode = "common",
+    data_source: DataSource,
+    tfu: str = "EgQIABABIgA",
+    proxy: ProxyLike = None,
+    cache: Optional[ResponseCache] = None,
+    keep_raw: KeepRaw = True,
+) -> Union[Result, DecodedResult, None]: ...
 
-    else:
-        from .fallback_playwright import fallback_playwright_fetch
-        res = fallback_playwright_fetch(params)
+async def get_flights_from_tfs_async(
+    tfs: str,
+    currency: str = "",
+    *,
+    mode: FetchMode = "common",
+    data_source: DataSource = 'html',
+    tfu: str = "EgQIABABIgA",
+    proxy: ProxyLike = None,
+    cache: Optional[ResponseCache] = None,
+    keep_raw: KeepRaw = True,
+) -> Union[Result, DecodedResult, None]:
+    """Async variant of :func:`get_flights_from_tfs`.
 
-    try:
-        return parse_response(res, data_source, tfu=tfu)
-    except RuntimeError as e:
-        if mode == "fallback":
-            return get_flights_from_tfs(tfs, currency, mode="force-fallback", data_source=data_source, tfu=tfu, proxy=proxy)
-        raise e
+    Browser modes (``local``, ``browserless``) run on the caller's event loop;
+    the HTTP modes run their blocking request on the loop's default executor.
+
+    Example:
+        >>> results = await asyncio.gather(
+        ...     get_flights_from_tfs_async(tfs_a, data_source='js'),
+        ...     get_flights_from_tfs_async(tfs_b, data_source='js'),
+        ... )
+    """
+    params = _build_params(tfs, currency, tfu)
+
+    search = functools.partial(_search_async, params, mode, data_source, tfu, proxy, cache, keep_raw)
+    single_flight = get_single_flight()
+    with get_tracer().span("fast_flights.search", {"mode": mode, "data_source": data_source}):
+        if single_flight is None:
+            return await search()
+        return await single_flight.do_async(search_key(params, mode, data_source, keep_raw), search)
 
 
 def parse_response(
-    r: Response,
+    r: FetchedResponse,
     data_source: DataSource,
     *,
     dangerously_allow_looping_last_item: bool = False,
     tfu: str = "EgQIABABIgA",
+    keep_raw: KeepRaw = True,
 ) -> Union[Result, DecodedResult, None]:
+    tracer = get_tracer()
+    with tracer.span("fast_flights.parse", {"data_source": data_source}) as span:
+        result = _parse_response(
+            r,
+            data_source,
+            dangerously_allow_looping_last_item=dangerously_allow_looping_last_item,
+            tfu=tfu,
+            keep_raw=keep_raw,
+        )
+        if tracer.enabled:
+            span.set_attribute("bytes", len(r.text.encode("utf-8")))
+            span.set_attribute("itineraries", _itinerary_count(result))
+    return result
+
+
+def _itinerary_count(result: Union[Result, DecodedResult, None]) -> int:
+    if isinstance(result, DecodedResult):
+        return len(result.best) + len(result.other)
+    if isinstance(result, Result):
+        return len(result.flights)
+    return 0
+
+
+def _parse_response(
+    r: FetchedResponse,
+    data_source: DataSource,
+    *,
+    dangerously_allow_looping_last_item: bool,
+    tfu: str,
+    keep_raw: KeepRaw,
+) -> Union[Result, DecodedResult, None]:
+    tracer = get_tracer()
+
     class _blank:
         def text(self, *_, **__):
             return ""
@@ -282,24 +867,39 @@ def parse_response(
     def safe(n: Optional[LexborNode]):
         return n or blank
 
-    parser = LexborHTMLParser(r.text)
-
     if data_source == 'js':
-        script = parser.css_first(r'script.ds\:1').text()
-
-        match = re.search(r'^.*?\{.*?data:(\[.*\]).*\}', script)
-        assert match, 'Malformed js data, cannot find script data'
-        raw_data_json = match.group(1)
+        with tracer.span("fast_flights.extract_ds1") as span:
+            raw_data_json = _scan_ds1_data(r.text)
+            if tracer.enabled:
+                span.set_attribute("scanner", raw_data_json is not None)
+            if raw_data_json is None:
+                script = LexborHTMLParser(r.text).css_first(r'script.ds\:1').text()
+
+                match = re.search(r'^.*?\{.*?data:(\[.*\]).*\}', script)
+                assert match, 'Malformed js data, cannot find script data'
+                raw_data_json = match.group(1)
         if _GOOGLE_ERROR_RESPONSE_MARKER in raw_data_json:
-            digest = _dump_google_error_response_payload(raw_data_json)
+            digest, dumped_to = _dump_google_error_response_payload(raw_data_json)
             raise GoogleFlightsErrorResponse(
                 sha256=digest,
                 byte_count=len(raw_data_json.encode("utf-8")),
                 char_count=len(raw_data_json),
+                dumped_to=dumped_to,
             )
-        data = json.loads(raw_data_json)
-        return ResultDecoder.decode(data, tfu=tfu) if data is not None else None
-
+        with tracer.span("fast_flights.json_decode", {"backend": _json.backend}) as span:
+            if tracer.enabled:
+                span.set_attribute("bytes", len(raw_data_json.encode("utf-8")))
+            data = _json.loads(raw_data_json)
+        if data is None:
+            return None
+        with tracer.span("fast_flights.decode") as span:
+            decoded = ResultDecoder.decode(data, tfu=tfu, keep_raw=keep_raw, raw_json=raw_data_json)
+            if tracer.enabled:
+                span.set_attribute("itineraries", _itinerary_count(decoded))
+        return decoded
+
+    with tracer.span("fast_flights.dom_parse"):
+        parser = LexborHTMLParser(r.text)
     flights = []
 
     for i, fl in enumerate(parser.css('div[jsname="IWWDBc"], div[jsname="YdtKid"]')):
@@ -349,8 +949,8 @@ def parse_response(
             # e.g., "GVAGeneva Airport–ZADZadar Airport"
             route_match = re.search(r'([A-Z]{3})[A-Za-z\s]+[–\-]([A-Z]{3})[A-Za-z\s]+', item_text)
             if route_match:
-                departure_airport = route_match.group(1)
-                arrival_airport = route_match.group(2)
+                departure_airport = sys.intern(route_match.group(1))
+                arrival_airport = sys.intern(route_match.group(2))
 
             # Match layover pattern like "1 hr 20 min VIEVienna" or "45 min LAXLos Angeles"
             layover_match = re.search(r'(\d+\s*hr(?:\s*\d+\s*min)?|\d+\s*min)\s+([A-Z]{3})[A-Z]', item_text)
@@ -368,7 +968,7 @@ def parse_response(
             flights.append(
                 {
                     "is_best": is_best_flight,
-                    "name": name,
+                    "name": sys.intern(name),
                     "departure": " ".join(departure_time.split()),
                     "arrival": " ".join(arrival_time.split()),
                     "arrival_time_ahead": time_ahead,
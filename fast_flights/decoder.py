@@ -1,15 +1,25 @@
 import abc
+import logging
 import sys
 from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
-from typing import Any, List, Generic, Optional, Sequence, TypeVar, Union, Tuple
+from typing import Any, Dict, List, Generic, Literal, Optional, Sequence, TypeVar, Union, Tuple
 from typing_extensions import TypeAlias, override
 
+from . import _json
+from .diagnostics import LazyPreview, logger
 from .flights_impl import ItinerarySummary
 
 DecodePath: TypeAlias = List[int]
 PriceLevel: TypeAlias = str  # "low", "typical", "high"
 NLBaseType: TypeAlias = Union[int, str, None, Sequence['NLBaseType']]
+# True keeps the parsed tree, False drops it, "lazy" keeps the JSON text and
+# re-parses it the first time ``DecodedResult.raw`` is read.
+KeepRaw: TypeAlias = Union[bool, Literal['lazy']]
+
+# Decoded results are held in bulk (price analysis keeps millions around), so
+# the per-itinerary models drop their __dict__ where the runtime allows it.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 # N(ested)L(ist)Data, this class allows indexing using a path, and as an int to make
 # traversal easier within the nested list data
@@ -54,13 +64,25 @@ def normalize_time(data: NLData) -> List[int]:
 
 # DecoderKey is used to specify the path to a field from a decoder class
 V = TypeVar('V')
+def _intern_value(value: Any) -> Any:
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return [sys.intern(x) if isinstance(x, str) else x for x in value]
+    return value
+
 @dataclass
 class DecoderKey(Generic[V]):
     decode_path: DecodePath
     decoder: Optional[Callable[[NLData], V]] = None
+    # Intern the decoded string (or list of strings). Used for airport,
+    # airline and aircraft names, which repeat across every flight.
+    intern: bool = False
 
     def decode(self, root: NLData) -> Union[NLBaseType, V]:
         data = root[self.decode_path]
+        if self.intern and self.decoder is None:
+            return _intern_value(data)
 
         # Handle None values - return empty list if decoder expects a list
         # This handles return flight pages where data[2] = None (no "best" flights section)
@@ -72,16 +94,109 @@ class DecoderKey(Generic[V]):
             return self.decoder(NLData(data))
         return data
 
+class _Mismatch(Exception):
+    """Raised by compiled decoders to hand an element back to the generic path."""
+
+
+def _none_or_mismatch(it: Any) -> None:
+    if it is None:
+        return None
+    raise _Mismatch
+
+
+def _decode_el_generic(cls: type, el: NLData) -> Mapping[str, Any]:
+    decoded: Mapping[str, Any] = {}
+    for field_name, key_decoder in vars(cls).items():
+        if isinstance(key_decoder, DecoderKey):
+            value = key_decoder.decode(el)
+            decoded[field_name.lower()] = value
+    return decoded
+
+
+def _compile_decode_el(cls: type) -> Optional[Callable[[Any], Mapping[str, Any]]]:
+    """Generate a straight-line ``decode_el`` for ``cls`` from its DecoderKeys.
+
+    The generated function indexes the raw nested lists directly, shares
+    lookups between keys with a common path prefix (e.g. ``[0, 2]`` and
+    ``[0, 3]`` both reuse ``el[0]``), and passes lists straight to nested
+    Decoder classes instead of wrapping them in ``NLData``. Its output is
+    the same dict as :func:`_decode_el_generic`. Anything surprising (a
+    non-list in the middle of a path, an index out of range) re-runs the
+    element through the generic path so the error raised is unchanged.
+    """
+    keys = [(name, key) for name, key in vars(cls).items() if isinstance(key, DecoderKey)]
+    if not all(isinstance(key.decode_path, list) for _, key in keys):
+        return None
+
+    namespace: dict = {
+        "NLData": NLData,
+        "_Mismatch": _Mismatch,
+        "_none_or_mismatch": _none_or_mismatch,
+        "_generic": lambda el: _decode_el_generic(cls, NLData(el)),
+        "_intern": sys.intern,
+        "_intern_value": _intern_value,
+    }
+    lines = []
+    prefixes: Dict[Tuple[int, ...], str] = {(): "el"}
+    fields = []
+    for n, (name, key) in enumerate(keys):
+        path = tuple(key.decode_path)
+        for depth in range(1, len(path) + 1):
+            prefix = path[:depth]
+            if prefix in prefixes:
+                continue
+            parent = prefixes[prefix[:-1]]
+            var = f"p{len(prefixes)}"
+            prefixes[prefix] = var
+            lines.append(
+                f"{var} = {parent}[{prefix[-1]}] if isinstance({parent}, list) else _none_or_mismatch({parent})"
+            )
+        value = prefixes[path]
+
+        if key.decoder is not None:
+            decoder = key.decoder
+            namespace[f"d{n}"] = decoder
+            owner = getattr(decoder, "__self__", None)
+            # Nested Decoders iterate their input, so the raw list will do.
+            arg = value if isinstance(owner, type) and issubclass(owner, Decoder) else f"NLData({value})"
+            lines.append(
+                f"v{n} = [] if {value} is None else "
+                f"(d{n}({arg}) if isinstance({value}, list) else {value})"
+            )
+            value = f"v{n}"
+        elif key.intern:
+            lines.append(f"v{n} = _intern({value}) if {value}.__class__ is str else _intern_value({value})")
+            value = f"v{n}"
+        fields.append(f"{name.lower()!r}: {value}")
+
+    body = "\n".join(f"        {line}" for line in lines)
+    source = (
+        "def decode_el(el):\n"
+        "    try:\n"
+        f"{body}\n"
+        f"        return {{{', '.join(fields)}}}\n"
+        "    except (_Mismatch, IndexError):\n"
+        "        return _generic(el)\n"
+    )
+    exec(compile(source, f"<{cls.__name__}.decode_el>", "exec"), namespace)
+    return namespace["decode_el"]
+
+
 # Decoder is used to aggregate all fields and their paths
 class Decoder(abc.ABC):
+    # Built once per subclass at class creation by _compile_decode_el.
+    _decode_raw: Optional[Callable[[Any], Mapping[str, Any]]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        compiled = _compile_decode_el(cls)
+        cls._decode_raw = staticmethod(compiled) if compiled is not None else None  # type: ignore
+
     @classmethod
-    def decode_el(cls, el: NLData) -> Mapping[str, Any]:
-        decoded: Mapping[str, Any] = {}
-        for field_name, key_decoder in vars(cls).items():
-            if isinstance(key_decoder, DecoderKey):
-                value = key_decoder.decode(el)
-                decoded[field_name.lower()] = value
-        return decoded
+    def decode_el(cls, el: Union[list, NLData]) -> Mapping[str, Any]:
+        if cls._decode_raw is not None:
+            return cls._decode_raw(el.data if isinstance(el, NLData) else el)
+        return _decode_el_generic(cls, el if isinstance(el, NLData) else NLData(el))
 
     @classmethod
     def decode(cls, root: Union[list, NLData]) -> ...:
@@ -96,13 +211,13 @@ AirportName: TypeAlias = str
 ProtobufStr: TypeAlias = str
 Minute: TypeAlias = int
 
-@dataclass
+@dataclass(**_SLOTS)
 class Codeshare:
     airline_code: AirlineCode
     flight_number: int
     airline_name: AirlineName
 
-@dataclass
+@dataclass(**_SLOTS)
 class Flight:
     airline: AirlineCode
     airline_name: AirlineName
@@ -124,7 +239,7 @@ class Flight:
     seat_pitch_short: str
     # seat_pitch_long: str
 
-@dataclass
+@dataclass(**_SLOTS)
 class Layover:
     minutes: Minute
     departure_airport: AirportCode
@@ -134,7 +249,7 @@ class Layover:
     arrival_airport_name: AirportName
     arrival_airport_city: AirportName
 
-@dataclass
+@dataclass(**_SLOTS)
 class Itinerary:
     airline_code: AirlineCode
     airline_names: List[AirlineName]
@@ -150,7 +265,7 @@ class Itinerary:
     itinerary_summary: ItinerarySummary
     tfu: Optional[str] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class PriceGraphPoint:
     timestamp_ms: int
     price: int
@@ -253,8 +368,8 @@ class PriceInsights:
 
 @dataclass
 class DecodedResult:
-    # raw unparsed data
-    raw: list
+    # raw unparsed data; None when decoded with keep_raw=False
+    raw: Optional[list]
 
     best: List[Itinerary]
     other: List[Itinerary]
@@ -262,6 +377,23 @@ class DecodedResult:
     price_insights: Optional[PriceInsights] = None
     warnings: List[TravelWarning] = field(default_factory=list)
 
+    # JSON text behind ``raw`` when decoded with keep_raw="lazy"
+    raw_json: Union[str, bytes, None] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.raw is None and self.raw_json is not None:
+            # Leave the attribute unset so the first read goes to __getattr__.
+            del self.raw
+
+    def __getattr__(self, name: str) -> Any:
+        if name != 'raw':
+            raise AttributeError(name)
+        raw_json = self.__dict__.get('raw_json')
+        raw = _json.loads(raw_json) if raw_json is not None else None
+        self.raw = raw
+        self.raw_json = None
+        return raw
+
 
 def _list_has(root: Any, path: DecodePath) -> bool:
     it = root
@@ -384,32 +516,32 @@ def _parse_travel_warning(el: Any) -> Optional[TravelWarning]:
     return TravelWarning(code=code, title=body[0], message=body[1], severity=body[2])
 
 class CodeshareDecoder(Decoder):
-    AIRLINE_CODE: DecoderKey[AirlineCode] = DecoderKey([0])
+    AIRLINE_CODE: DecoderKey[AirlineCode] = DecoderKey([0], intern=True)
     FLIGHT_NUMBER: DecoderKey[str] = DecoderKey([1])
-    AIRLINE_NAME: DecoderKey[List[AirlineName]] = DecoderKey([3])
+    AIRLINE_NAME: DecoderKey[List[AirlineName]] = DecoderKey([3], intern=True)
 
     @classmethod
     @override
     def decode(cls, root: Union[list, NLData]) -> List[Codeshare]:
-        return [Codeshare(**cls.decode_el(NLData(el))) for el in root]
+        return [Codeshare(**cls.decode_el(el)) for el in root]
 
 class FlightDecoder(Decoder):
-    OPERATOR: DecoderKey[AirlineName] = DecoderKey([2])
-    DEPARTURE_AIRPORT: DecoderKey[AirportCode] = DecoderKey([3])
-    DEPARTURE_AIRPORT_NAME: DecoderKey[AirportName] = DecoderKey([4])
-    ARRIVAL_AIRPORT: DecoderKey[AirportCode] = DecoderKey([5])
-    ARRIVAL_AIRPORT_NAME: DecoderKey[AirportName] = DecoderKey([6])
+    OPERATOR: DecoderKey[AirlineName] = DecoderKey([2], intern=True)
+    DEPARTURE_AIRPORT: DecoderKey[AirportCode] = DecoderKey([3], intern=True)
+    DEPARTURE_AIRPORT_NAME: DecoderKey[AirportName] = DecoderKey([4], intern=True)
+    ARRIVAL_AIRPORT: DecoderKey[AirportCode] = DecoderKey([5], intern=True)
+    ARRIVAL_AIRPORT_NAME: DecoderKey[AirportName] = DecoderKey([6], intern=True)
     # SOME_ENUM: DecoderKey[int] = DecoderKey([7])
     # SOME_ENUM: DecoderKey[int] = DecoderKey([9])
     DEPARTURE_TIME: DecoderKey[Tuple[int, int]] = DecoderKey([8], normalize_time)
     ARRIVAL_TIME: DecoderKey[Tuple[int, int]] = DecoderKey([10], normalize_time)
     TRAVEL_TIME: DecoderKey[int] = DecoderKey([11])
-    SEAT_PITCH_SHORT: DecoderKey[str] = DecoderKey([14])
-    AIRCRAFT: DecoderKey[str] = DecoderKey([17])
+    SEAT_PITCH_SHORT: DecoderKey[str] = DecoderKey([14], intern=True)
+    AIRCRAFT: DecoderKey[str] = DecoderKey([17], intern=True)
     DEPARTURE_DATE: DecoderKey[Tuple[int, int, int]] = DecoderKey([20])
     ARRIVAL_DATE: DecoderKey[Tuple[int, int, int]] = DecoderKey([21])
-    AIRLINE: DecoderKey[AirlineCode] = DecoderKey([22, 0])
-    AIRLINE_NAME: DecoderKey[AirlineName] = DecoderKey([22, 3])
+    AIRLINE: DecoderKey[AirlineCode] = DecoderKey([22, 0], intern=True)
+    AIRLINE_NAME: DecoderKey[AirlineName] = DecoderKey([22, 3], intern=True)
     FLIGHT_NUMBER: DecoderKey[str] = DecoderKey([22, 1])
     # SEAT_PITCH_LONG: DecoderKey[str] = DecoderKey([30])
     CODESHARES: DecoderKey[List[Codeshare]] = DecoderKey([15], CodeshareDecoder.decode)
@@ -417,30 +549,30 @@ class FlightDecoder(Decoder):
     @classmethod
     @override
     def decode(cls, root: Union[list, NLData]) -> List[Flight]:
-        return [Flight(**cls.decode_el(NLData(el))) for el in root]
+        return [Flight(**cls.decode_el(el)) for el in root]
 
 class LayoverDecoder(Decoder):
     MINUTES: DecoderKey[int] = DecoderKey([0])
-    DEPARTURE_AIRPORT: DecoderKey[AirportCode] = DecoderKey([1])
-    DEPARTURE_AIRPORT_NAME: DecoderKey[AirportName] = DecoderKey([4])
-    DEPARTURE_AIRPORT_CITY: DecoderKey[AirportName] = DecoderKey([5])
-    ARRIVAL_AIRPORT: DecoderKey[AirportCode] = DecoderKey([2])
-    ARRIVAL_AIRPORT_NAME: DecoderKey[AirportName] = DecoderKey([6])
-    ARRIVAL_AIRPORT_CITY: DecoderKey[AirportName] = DecoderKey([7])
+    DEPARTURE_AIRPORT: DecoderKey[AirportCode] = DecoderKey([1], intern=True)
+    DEPARTURE_AIRPORT_NAME: DecoderKey[AirportName] = DecoderKey([4], intern=True)
+    DEPARTURE_AIRPORT_CITY: DecoderKey[AirportName] = DecoderKey([5], intern=True)
+    ARRIVAL_AIRPORT: DecoderKey[AirportCode] = DecoderKey([2], intern=True)
+    ARRIVAL_AIRPORT_NAME: DecoderKey[AirportName] = DecoderKey([6], intern=True)
+    ARRIVAL_AIRPORT_CITY: DecoderKey[AirportName] = DecoderKey([7], intern=True)
 
     @classmethod
     @override
     def decode(cls, root: Union[list, NLData]) -> List[Layover]:
-        return [Layover(**cls.decode_el(NLData(el))) for el in root]
+        return [Layover(**cls.decode_el(el)) for el in root]
 
 class ItineraryDecoder(Decoder):
-    AIRLINE_CODE: DecoderKey[AirlineCode] = DecoderKey([0, 0])
-    AIRLINE_NAMES: DecoderKey[List[AirlineName]] = DecoderKey([0, 1])
+    AIRLINE_CODE: DecoderKey[AirlineCode] = DecoderKey([0, 0], intern=True)
+    AIRLINE_NAMES: DecoderKey[List[AirlineName]] = DecoderKey([0, 1], intern=True)
     FLIGHTS: DecoderKey[List[Flight]] = DecoderKey([0, 2], FlightDecoder.decode)
-    DEPARTURE_AIRPORT: DecoderKey[AirportCode] = DecoderKey([0, 3])
+    DEPARTURE_AIRPORT: DecoderKey[AirportCode] = DecoderKey([0, 3], intern=True)
     DEPARTURE_DATE: DecoderKey[Tuple[int, int, int]] = DecoderKey([0, 4])
     DEPARTURE_TIME: DecoderKey[Tuple[int, int]] = DecoderKey([0, 5], normalize_time)
-    ARRIVAL_AIRPORT: DecoderKey[AirportCode] = DecoderKey([0, 6])
+    ARRIVAL_AIRPORT: DecoderKey[AirportCode] = DecoderKey([0, 6], intern=True)
     ARRIVAL_DATE: DecoderKey[Tuple[int, int, int]] = DecoderKey([0, 7])
     ARRIVAL_TIME: DecoderKey[Tuple[int, int]] = DecoderKey([0, 8], normalize_time)
     TRAVEL_TIME: DecoderKey[int] = DecoderKey([0, 9])
@@ -457,34 +589,54 @@ class ItineraryDecoder(Decoder):
     @classmethod
     @override
     def decode(cls, root: Union[list, NLData]) -> List[Itinerary]:
+        return cls.partition(root)[0]
+
+    @classmethod
+    def partition(cls, root: Union[list, NLData]) -> Tuple[List[Itinerary], List[TravelWarning], List[Any]]:
+        """Split a ``data[2][0]`` / ``data[3][0]`` section in a single pass.
+
+        Returns ``(itineraries, warnings, unknowns)``. Each entry is validated
+        once: itinerary-shaped entries are decoded, the rest are tried as
+        travel warnings, and whatever is left (including itinerary-shaped
+        entries that failed to decode) ends up in ``unknowns``.
+        """
         # Filter decoration entries (e.g. injected travel-restriction
         # warnings) so they don't crash decode_el's [0, 0] traversal.
-        # Log unrecognized non-itinerary entries to stderr — silent drops
-        # of legitimate itineraries with surprising shapes are worse than
-        # the original crash.
-        out: List[Itinerary] = []
+        # Log unrecognized non-itinerary entries (rate limited, see
+        # fast_flights.diagnostics) — silent drops of legitimate itineraries
+        # with surprising shapes are worse than the original crash.
+        itineraries: List[Itinerary] = []
+        warnings: List[TravelWarning] = []
+        unknowns: List[Any] = []
         for i, el in enumerate(root):
             if _is_itinerary_entry(el):
                 try:
-                    out.append(Itinerary(**cls.decode_el(NLData(el))))
+                    itineraries.append(Itinerary(**cls.decode_el(el)))
                 except Exception as exc:
-                    preview = repr(el)[:200]
-                    print(
-                        f"[fast_flights] ItineraryDecoder skipped undecodable "
-                        f"entry at index {i}: {type(exc).__name__}: {exc}; {preview}",
-                        file=sys.stderr,
-                        flush=True,
-                    )
+                    unknowns.append(el)
+                    if logger.isEnabledFor(logging.WARNING):
+                        preview = LazyPreview(el)
+                        logger.warning(
+                            "ItineraryDecoder skipped undecodable entry at index %d: %s: %s; %s",
+                            i, type(exc).__name__, exc, preview,
+                            extra={"event": "itinerary_undecodable", "index": i,
+                                   "reason": type(exc).__name__, "preview": preview},
+                        )
                 continue
-            if _parse_travel_warning(el) is None:
-                preview = repr(el)[:200]
-                print(
-                    f"[fast_flights] ItineraryDecoder skipped unrecognized entry "
-                    f"at index {i}: {preview}",
-                    file=sys.stderr,
-                    flush=True,
+            warning = _parse_travel_warning(el)
+            if warning is not None:
+                warnings.append(warning)
+                continue
+            unknowns.append(el)
+            if logger.isEnabledFor(logging.WARNING):
+                preview = LazyPreview(el)
+                logger.warning(
+                    "ItineraryDecoder skipped unrecognized entry at index %d: %s",
+                    i, preview,
+                    extra={"event": "itinerary_unrecognized", "index": i,
+                           "reason": "unrecognized", "preview": preview},
                 )
-        return out
+        return itineraries, warnings, unknowns
 
 
 class ResultDecoder(Decoder):
@@ -495,36 +647,67 @@ class ResultDecoder(Decoder):
 
     @classmethod
     @override
-    def decode(cls, root: Union[list, NLData], tfu: str = "EgQIABABIgA") -> DecodedResult:
+    def decode(
+        cls,
+        root: Union[list, NLData],
+        tfu: str = "EgQIABABIgA",
+        *,
+        keep_raw: KeepRaw = True,
+        raw_json: Optional[str] = None,
+    ) -> DecodedResult:
+        """Decode the ``ds:1`` tree.
+
+        ``keep_raw`` controls what ``DecodedResult.raw`` holds on to: the tree
+        itself (``True``), nothing (``False``), or — with ``"lazy"`` and the
+        ``raw_json`` text ``root`` was parsed from — just that text, parsed
+        again on first access.
+        """
         assert isinstance(root, list), 'Root data must be list type'
-        result_data = cls.decode_el(NLData(root))
+        nl_root = NLData(root)
 
-        # Add tfu to each itinerary
-        for itinerary in result_data.get('best', []):
-            itinerary.tfu = tfu
-        for itinerary in result_data.get('other', []):
-            itinerary.tfu = tfu
+        # BEST / OTHER are partitioned here rather than through decode_el so
+        # the inline travel warnings come out of the same pass as the
+        # itineraries instead of a second walk over both sections.
+        result_data = {}
+        warnings: List[TravelWarning] = []
+        for name, key in (('best', cls.BEST), ('other', cls.OTHER)):
+            section = nl_root[key.decode_path]
+            # Return-flight pages have data[2] = None (no "best" section).
+            if not isinstance(section, list):
+                result_data[name] = []
+                continue
+            itineraries, section_warnings, _ = ItineraryDecoder.partition(section)
+            for itinerary in itineraries:
+                itinerary.tfu = tfu
+            result_data[name] = itineraries
+            warnings.extend(section_warnings)
 
         # Extract price insights from data[5] if present
         price_insights = None
         if len(root) > 5 and root[5] is not None:
             price_insights = PriceInsights.from_raw(root[5])
 
-        # Collect travel warnings from both placements Google uses:
-        #   * data[22][*] — top-level advisory list
-        #   * non-itinerary siblings inside data[2][0] / data[3][0]
-        warnings: List[TravelWarning] = []
-        for idx in (2, 3):
-            if idx < len(root) and isinstance(root[idx], list) and root[idx] and isinstance(root[idx][0], list):
-                for el in root[idx][0]:
-                    if not _is_itinerary_entry(el):
-                        parsed = _parse_travel_warning(el)
-                        if parsed is not None:
-                            warnings.append(parsed)
+        # Google also sends a top-level advisory list at data[22].
         if len(root) > 22 and isinstance(root[22], list):
             for el in root[22]:
                 parsed = _parse_travel_warning(el)
                 if parsed is not None:
                     warnings.append(parsed)
 
-        return DecodedResult(**result_data, raw=root, price_insights=price_insights, warnings=warnings)
+        raw: Optional[list] = root
+        stored_json: Union[str, bytes, None] = None
+        if keep_raw == 'lazy' and raw_json is not None:
+            raw = None
+            # A single non-ASCII character widens the whole str to 2-4 bytes
+            # per character; UTF-8 keeps it close to the wire size.
+            stored_json = raw_json if raw_json.isascii() else raw_json.encode('utf-8')
+        elif not keep_raw:
+            raw = None
+
+        return DecodedResult(
+            **result_data,
+            raw=raw,
+            price_insights=price_insights,
+            warnings=warnings,
+            raw_json=stored_json,
+        )
@@ -0,0 +1,302 @@
+"""Diagnostics for surprising pages: a rate-limited logger and error payload sinks.
+
+Two things used to be printed straight to stderr from the parsing path:
+
+* every ``ds:1`` entry ``ItineraryDecoder`` skips (Google injects decoration
+  entries into many pages), and
+* the whole Google ``ErrorResponse`` payload, in 8000-character chunks.
+
+The first now goes to the ``fast_flights`` :mod:`logging` logger with
+structured fields (``event``, ``index``, ``reason``, ``preview``) and a
+:class:`RateLimitedFilter`, so a flood of identical messages becomes a few
+lines plus a count of what was suppressed. The entry preview is only built
+for records that are actually emitted.
+
+The second goes to a :class:`PayloadSink`. The default keeps the chunked
+stderr dump; :class:`FilePayloadSink` and :class:`CallbackPayloadSink` hand
+the payload to a background thread instead, so the decode worker only pays
+for a queue put.
+
+Example:
+    >>> configure_diagnostics(burst=3, interval=300)
+    >>> configure_error_payload_sink(FilePayloadSink("/var/log/fast_flights"))
+"""
+
+import abc
+import atexit
+import logging
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger("fast_flights")
+
+_CHUNK_SIZE = 8000
+
+
+class LazyPreview:
+    """``repr(value)[:limit]``, computed only if the log record is formatted."""
+
+    __slots__ = ("value", "limit")
+
+    def __init__(self, value: Any, limit: int = 200):
+        self.value = value
+        self.limit = limit
+
+    def __str__(self) -> str:
+        return repr(self.value)[: self.limit]
+
+    __repr__ = __str__
+
+
+class RateLimitedFilter(logging.Filter):
+    """Let through ``burst`` records per key every ``interval`` seconds.
+
+    Records are keyed by their ``event`` field (falling back to the message
+    template). Past the burst, a record still passes with probability
+    ``sample_rate``. The first record let through after some were dropped
+    carries a ``suppressed`` count, also appended to its message.
+
+    Args:
+        burst (int, optional): Records per key per interval. Defaults to 5.
+        interval (float, optional): Window length in seconds. Defaults to 60.
+        sample_rate (float, optional): Chance that a record past the burst
+            is kept anyway. Defaults to 0.
+    """
+
+    def __init__(
+        self,
+        burst: int = 5,
+        interval: float = 60.0,
+        sample_rate: float = 0.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__()
+        assert burst >= 0, "burst must be >= 0"
+        assert 0.0 <= sample_rate <= 1.0, "sample_rate must be in [0, 1]"
+        self.burst = burst
+        self.interval = interval
+        self.sample_rate = sample_rate
+        self._clock = clock
+        # key -> (window start, records passed in window, records suppressed)
+        self._windows: Dict[Any, Tuple[float, int, int]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = getattr(record, "event", None) or record.msg
+        with self._lock:
+            now = self._clock()
+            start, passed, suppressed = self._windows.get(key, (now, 0, 0))
+            if now - start >= self.interval:
+                start, passed = now, 0
+            keep = passed < self.burst or (self.sample_rate > 0 and random.random() < self.sample_rate)
+            if not keep:
+                self._windows[key] = (start, passed, suppressed + 1)
+                return False
+            self._windows[key] = (start, passed + 1, 0)
+
+        record.suppressed = suppressed
+        if suppressed and isinstance(record.args, tuple):
+            record.msg = f"{record.msg} (%d similar messages suppressed)"
+            record.args = record.args + (suppressed,)
+        return True
+
+
+_filter = RateLimitedFilter()
+logger.addFilter(_filter)
+
+
+def configure_diagnostics(
+    *,
+    burst: int = 5,
+    interval: float = 60.0,
+    sample_rate: float = 0.0,
+) -> RateLimitedFilter:
+    """Replace the rate limiting on the ``fast_flights`` logger.
+
+    Args:
+        burst (int, optional): Records per message kind per interval.
+            Defaults to 5.
+        interval (float, optional): Window length in seconds. Defaults to 60.
+        sample_rate (float, optional): Chance a record past the burst is
+            kept anyway. Defaults to 0.
+    """
+    global _filter
+    logger.removeFilter(_filter)
+    _filter = RateLimitedFilter(burst, interval, sample_rate)
+    logger.addFilter(_filter)
+    return _filter
+
+
+# -- error payload sinks ----------------------------------------------------
+
+
+class PayloadSink(abc.ABC):
+    """Destination for raw Google ``ErrorResponse`` payloads.
+
+    With ``background=True`` :meth:`submit` only queues the payload; a shared
+    writer thread calls :meth:`write`. Payloads are dropped (and a warning
+    logged) if the queue is full.
+    """
+
+    background = False
+    description = "a payload sink"
+
+    def submit(self, digest: str, payload: str) -> None:
+        if self.background:
+            _get_writer().put(self, digest, payload)
+        else:
+            self.write(digest, payload)
+
+    @abc.abstractmethod
+    def write(self, digest: str, payload: str) -> None:
+        """Persist ``payload`` (its SHA-256 hex digest is ``digest``)."""
+
+
+class StderrPayloadSink(PayloadSink):
+    """Print the payload to stderr in checksummed chunks, inline (the default).
+
+    Some log pipelines (e.g. Vercel) truncate long lines, hence the chunks.
+    """
+
+    description = "stderr"
+
+    def __init__(self, chunk_size: int = _CHUNK_SIZE):
+        self.chunk_size = chunk_size
+
+    def write(self, digest: str, payload: str) -> None:
+        size = self.chunk_size
+        total = (len(payload) + size - 1) // size
+        lines = [
+            "[fast_flights][ERROR_RESPONSE_RAW][BEGIN] "
+            f"bytes={len(payload.encode('utf-8'))} chars={len(payload)} "
+            f"sha256={digest} chunks={total}"
+        ]
+        for index in range(total):
+            chunk = payload[index * size:(index + 1) * size]
+            lines.append(f"[fast_flights][ERROR_RESPONSE_RAW][{index + 1}/{total}] {chunk}")
+        lines.append(f"[fast_flights][ERROR_RESPONSE_RAW][END] sha256={digest}")
+        sys.stderr.write("\n".join(lines) + "\n")
+        sys.stderr.flush()
+
+
+class FilePayloadSink(PayloadSink):
+    """Write each payload to ``<directory>/<sha256>.json`` from a background thread.
+
+    Args:
+        directory (str): Created if missing.
+        background (bool, optional): Write off the calling thread.
+            Defaults to True.
+    """
+
+    def __init__(self, directory: str, *, background: bool = True):
+        self.directory = directory
+        self.background = background
+        self.description = f"{directory}{os.sep}<sha256>.json"
+
+    def write(self, digest: str, payload: str) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{digest}.json")
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+
+
+class CallbackPayloadSink(PayloadSink):
+    """Call ``callback(digest, payload)``, from a background thread by default.
+
+    Args:
+        callback (callable): Receives the SHA-256 hex digest and the payload.
+        background (bool, optional): Call off the calling thread.
+            Defaults to True.
+    """
+
+    description = "callback"
+
+    def __init__(self, callback: Callable[[str, str], Any], *, background: bool = True):
+        self.callback = callback
+        self.background = background
+
+    def write(self, digest: str, payload: str) -> None:
+        self.callback(digest, payload)
+
+
+class _BackgroundWriter:
+    def __init__(self, max_pending: int = 64):
+        self._queue: "queue.Queue[Tuple[PayloadSink, str, str]]" = queue.Queue(max_pending)
+        self._thread = threading.Thread(target=self._run, name="fast_flights-payload-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, sink: PayloadSink, digest: str, payload: str) -> None:
+        try:
+            self._queue.put_nowait((sink, digest, payload))
+        except queue.Full:
+            logger.warning(
+                "Dropped ErrorResponse payload sha256=%s: writer queue is full",
+                digest,
+                extra={"event": "error_payload_dropped", "sha256": digest},
+            )
+
+    def join(self, timeout: Optional[float]) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def _run(self) -> None:
+        while True:
+            sink, digest, payload = self._queue.get()
+            try:
+                sink.write(digest, payload)
+            except Exception as e:
+                logger.warning(
+                    "Could not write ErrorResponse payload sha256=%s: %s",
+                    digest,
+                    e,
+                    extra={"event": "error_payload_write_failed", "sha256": digest},
+                )
+            finally:
+                self._queue.task_done()
+
+
+_writer: Optional[_BackgroundWriter] = None
+_writer_lock = threading.Lock()
+
+
+def _get_writer() -> _BackgroundWriter:
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = _BackgroundWriter()
+        return _writer
+
+
+def flush_error_payloads(timeout: Optional[float] = 5.0) -> bool:
+    """Wait for queued payloads to be written. Returns False on timeout."""
+    return _writer.join(timeout) if _writer is not None else True
+
+
+atexit.register(flush_error_payloads)
+
+
+_payload_sink: PayloadSink = StderrPayloadSink()
+
+
+def get_error_payload_sink() -> PayloadSink:
+    """Return where Google ``ErrorResponse`` payloads are sent."""
+    return _payload_sink
+
+
+def configure_error_payload_sink(sink: Optional[PayloadSink] = None) -> PayloadSink:
+    """Replace the payload sink (``None`` restores the inline stderr dump)."""
+    global _payload_sink
+    _payload_sink = sink if sink is not None else StderrPayloadSink()
+    return _payload_sink
@@ -1,15 +1,60 @@
 """Public exception types raised by fast_flights."""
 
+from typing import Any, Mapping, Optional
+
 
 class GoogleFlightsErrorResponse(RuntimeError):
     """Google returned a typed Flights ErrorResponse instead of itineraries."""
 
-    def __init__(self, *, sha256: str, byte_count: int, char_count: int):
+    def __init__(self, *, sha256: str, byte_count: int, char_count: int, dumped_to: str = "stderr"):
         self.sha256 = sha256
         self.byte_count = byte_count
         self.char_count = char_count
+        self.dumped_to = dumped_to
         super().__init__(
             "Google Flights returned ErrorResponse payload "
-            f"(raw ds:1 dumped to stderr; sha256={sha256}; "
+            f"(raw ds:1 dumped to {dumped_to}; sha256={sha256}; "
             f"bytes={byte_count}; chars={char_count})"
         )
+
+
+class FetchError(AssertionError):
+    """A fetch came back with a non-200 status.
+
+    Subclasses ``AssertionError`` because that is what a failed fetch has
+    always raised, so existing ``except AssertionError`` handlers still apply.
+    """
+
+    def __init__(self, status_code: int, body: str = "", *, retry_after: Optional[float] = None):
+        self.status_code = status_code
+        self.body = body
+        self.retry_after = retry_after
+        super().__init__(f"{status_code} Result: {body}")
+
+    @classmethod
+    def from_response(cls, res: Any, body: str) -> "FetchError":
+        return cls(res.status_code, body, retry_after=_retry_after(getattr(res, "headers", None)))
+
+
+def _retry_after(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    # Only the delta-seconds form; an HTTP-date falls back to normal backoff.
+    if not headers:
+        return None
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+class CircuitOpenError(AssertionError):
+    """A fetch mode's circuit breaker is open, so the request was not sent.
+
+    An ``AssertionError`` like :class:`FetchError`, so ``mode="fallback"``
+    moves straight on to the browser fallback when ``common`` is open.
+    """
+
+    def __init__(self, mode: str, retry_after: float):
+        self.mode = mode
+        self.retry_after = retry_after
+        super().__init__(f"circuit for mode {mode!r} is open; retry in {retry_after:.1f}s")
@@ -1,31 +1,78 @@
 from typing import Any
 
-from .primp import Client
+from .exceptions import FetchError
+from .readiness import PROBE_JS, get_readiness_policy
+from .request_filter import get_request_filter
+from .session_pool import get_session_pool
+from .urls import flights_url
 
+# Runs on try.playwright.tech, so it can't import fast_flights; the readiness
+# probes from readiness.py and the request filter from request_filter.py are
+# inlined and their settings formatted in.
 CODE = """\
 import asyncio
 import sys
+import time
 from playwright.async_api import async_playwright
 
+PROBE = %(probe)r
+
+async def settle(page, deadline_ms, last_rows=None):
+    deadline = time.monotonic() + deadline_ms / 1000
+    streak = 0
+    while True:
+        rows, _ = await page.evaluate(PROBE)
+        if rows == last_rows:
+            streak += 1
+            if streak >= %(stable_polls)d:
+                return
+        else:
+            streak = 0
+        last_rows = rows
+        if time.monotonic() >= deadline:
+            return
+        await page.wait_for_timeout(%(poll_interval_ms)d)
+
+async def after_click(page, rows_before):
+    deadline = time.monotonic() + %(click_deadline_ms)d / 1000
+    while time.monotonic() < deadline:
+        rows, _ = await page.evaluate(PROBE)
+        if rows > rows_before:
+            return await settle(page, (deadline - time.monotonic()) * 1000, rows)
+        await page.wait_for_timeout(%(poll_interval_ms)d)
+
+ALLOWED_TYPES = %(allowed_types)r
+BLOCKED_URL_PARTS = %(blocked_url_parts)r
+
+async def filter_request(route):
+    request = route.request
+    if request.resource_type in ALLOWED_TYPES and not any(part in request.url for part in BLOCKED_URL_PARTS):
+        await route.continue_()
+    else:
+        await route.abort()
+
 async def main():
     async with async_playwright() as p:
         browser = await p.chromium.launch()
         page = await browser.new_page()
-        await page.goto("%s")
+        if ALLOWED_TYPES is not None:
+            await page.route("**/*", filter_request)
+        await page.goto("%(url)s")
         if page.url.startswith("https://consent.google.com"):
             await page.click('text="Accept all"')
         locator = page.locator('.eQ35Ce')
         await locator.wait_for()
 
-        # Wait for page to fully load before looking for "View more flights"
-        await page.wait_for_timeout(5000)
+        # Wait for the result list to settle before looking for "View more flights"
+        %(settle)s
 
         # Click "View more flights" if present (for long trips that hide additional results)
         try:
             view_more = page.locator('text="View more flights"')
             if await view_more.is_visible(timeout=10000):
+                rows_before, _ = await page.evaluate(PROBE)
                 await view_more.click()
-                await page.wait_for_timeout(3000)
+                %(after_click)s
         except:
             pass
 
@@ -41,22 +88,41 @@ asyncio.run(main())
 """
 
 
+def _render_code(url: str) -> str:
+    policy = get_readiness_policy()
+    request_filter = get_request_filter()
+    return CODE % {
+        "allowed_types": sorted(request_filter.allowed_types) if request_filter is not None else None,
+        "blocked_url_parts": list(request_filter.blocked_url_parts) if request_filter is not None else [],
+        "url": url,
+        "probe": PROBE_JS,
+        "click_deadline_ms": policy.click_deadline_ms,
+        "poll_interval_ms": policy.poll_interval_ms,
+        "stable_polls": policy.stable_polls,
+        "settle": (
+            f"await page.wait_for_timeout({policy.fixed_settle_ms})"
+            if policy.fixed_settle_ms is not None
+            else f"await settle(page, {policy.deadline_ms})"
+        ),
+        "after_click": (
+            f"await page.wait_for_timeout({policy.fixed_click_ms})"
+            if policy.fixed_click_ms is not None
+            else "await after_click(page, rows_before)"
+        ),
+    }
+
+
 def fallback_playwright_fetch(params: dict) -> Any:
-    client = Client(impersonate="chrome_100", verify=False)
-
-    res = client.post(
-        "https://try.playwright.tech/service/control/run",
-        json={
-            "code": CODE
-            % (
-                "https://www.google.com/travel/flights"
-                + "?"
-                + "&".join(f"{k}={v}" for k, v in params.items())
-            ),
-            "language": "python",
-        },
-    )
-    assert res.status_code == 200, f"{res.status_code} Result: {res.text_markdown}"
+    with get_session_pool().session(impersonate="chrome_100", verify=False) as client:
+        res = client.post(
+            "https://try.playwright.tech/service/control/run",
+            json={
+                "code": _render_code(flights_url(params)),
+                "language": "python",
+            },
+        )
+    if res.status_code != 200:
+        raise FetchError.from_response(res, res.text_markdown)
     import json
 
     class DummyResponse:
@@ -1,6 +1,7 @@
 """Typed implementation of flights_pb2.py"""
 
 import base64
+import sys
 from dataclasses import dataclass
 from typing import Any, List, Optional, TYPE_CHECKING, Literal, Union
 
@@ -293,7 +294,7 @@ class TFSData:
     def __repr__(self) -> str:
         return f"TFSData(flight_data={self.flight_data!r}, max_stops={self.max_stops!r}, exclude_basic_economy={self.exclude_basic_economy!r})"
 
-@dataclass
+@dataclass(**({"slots": True} if sys.version_info >= (3, 10) else {}))
 class ItinerarySummary:
     flights: str
     price: int
@@ -304,4 +305,4 @@ class ItinerarySummary:
         raw = base64.b64decode(b64_string)
         pb = PB.ItinerarySummary()
         pb.ParseFromString(raw)
-        return cls(pb.flights, pb.price.price / 100, pb.price.currency)
+        return cls(pb.flights, pb.price.price / 100, sys.intern(pb.price.currency))
@@ -0,0 +1,253 @@
+"""Hedged requests: race a second fetch mode when the first one is slow.
+
+``mode="fallback"`` is sequential — the browser only starts once the plain
+request has failed. With ``mode="hedged"`` the primary mode runs alone until
+it is slower than most recent searches (a latency percentile), then the
+secondary mode is started alongside it and whichever produces a parseable
+result first wins. A primary that fails outright starts the secondary
+immediately.
+
+The hedge delay adapts: it is the configured percentile of recent primary
+latencies, clamped to ``[min_delay, max_delay]``, and ``initial_delay`` until
+enough samples have been seen.
+
+Example:
+    >>> configure_hedging(HedgePolicy(primary="common", secondary="browserless", percentile=90))
+    >>> get_flights_from_filter(filter, mode="hedged", data_source="js")
+    >>> get_hedger().stats()
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Awaitable, Callable, Deque, List, Optional, TypeVar, Union
+
+if TYPE_CHECKING:
+    from .core import FetchMode
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """Which modes ``mode="hedged"`` races, and when the second one starts.
+
+    Args:
+        primary (str, optional): Fetch mode tried first. Defaults to "common".
+        secondary (str, optional): Fetch mode started once the primary is
+            slow or has failed. Defaults to "bright-data".
+        percentile (float, optional): Percentile of recent primary latencies
+            after which the secondary starts. Defaults to 95.
+        initial_delay (float, optional): Hedge delay, in seconds, until
+            ``min_samples`` latencies have been recorded. Defaults to 3.0.
+        min_delay (float, optional): Lower bound for the hedge delay.
+            Defaults to 0.5.
+        max_delay (float, optional): Upper bound for the hedge delay.
+            Defaults to 15.0.
+        min_samples (int, optional): Samples needed before the percentile is
+            trusted. Defaults to 20.
+        window (int, optional): Number of recent primary latencies kept.
+            Defaults to 200.
+    """
+
+    primary: "FetchMode" = "common"
+    secondary: "FetchMode" = "bright-data"
+    percentile: float = 95.0
+    initial_delay: float = 3.0
+    min_delay: float = 0.5
+    max_delay: float = 15.0
+    min_samples: int = 20
+    window: int = 200
+
+    def __post_init__(self):
+        assert "hedged" not in (self.primary, self.secondary), "cannot hedge with mode='hedged'"
+        assert self.primary != self.secondary, "primary and secondary modes must differ"
+        assert 0 < self.percentile <= 100, "percentile must be in (0, 100]"
+        assert self.window >= 1, "window must be >= 1"
+
+
+@dataclass(frozen=True)
+class HedgeStats:
+    """Outcomes of hedged searches."""
+
+    requests: int = 0
+    hedged: int = 0
+    secondary_wins: int = 0
+    failures: int = 0
+
+
+class Hedger:
+    """Runs hedged fetches and learns the primary mode's latency distribution.
+
+    Sync callers race on a dedicated thread per leg, so a hedge never waits
+    behind other searches; a losing sync fetch can't be interrupted, so it
+    finishes on its own thread and its result is dropped. Async callers race
+    tasks and the loser is cancelled. Primary latency is measured from when
+    the leg starts running.
+
+    Args:
+        policy (HedgePolicy, optional): Modes and timing. Defaults to
+            ``HedgePolicy()``.
+    """
+
+    def __init__(self, policy: Optional[HedgePolicy] = None):
+        self.policy = policy if policy is not None else HedgePolicy()
+        self._latencies: Deque[float] = deque(maxlen=self.policy.window)
+        self._stats = HedgeStats()
+        self._lock = threading.Lock()
+
+    def delay(self) -> float:
+        """Seconds the primary runs alone before the secondary is started."""
+        policy = self.policy
+        with self._lock:
+            samples = sorted(self._latencies)
+        if len(samples) < policy.min_samples:
+            delay = policy.initial_delay
+        else:
+            delay = samples[max(0, math.ceil(policy.percentile / 100 * len(samples)) - 1)]
+        return min(policy.max_delay, max(policy.min_delay, delay))
+
+    def record(self, latency: float) -> None:
+        """Add a successful primary latency to the window."""
+        with self._lock:
+            self._latencies.append(latency)
+
+    def stats(self) -> HedgeStats:
+        with self._lock:
+            return self._stats
+
+    def run(self, primary: Callable[[], T], secondary: Callable[[], T]) -> T:
+        """Return the first successful result of ``primary()`` / ``secondary()`` (blocking)."""
+        def timed_primary() -> T:
+            started = time.monotonic()
+            value = primary()
+            self.record(time.monotonic() - started)
+            return value
+
+        first = _start_leg(timed_primary)
+        done, _ = wait([first], timeout=self.delay())
+        if done and first.exception() is None:
+            self._count()
+            return first.result()
+
+        pending = {_start_leg(secondary)}
+        if not done:
+            pending.add(first)
+        errors: List[BaseException] = []
+        if done:
+            exc = first.exception()
+            assert exc is not None
+            errors.append(exc)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    for other in pending:
+                        other.cancel()
+                    self._count(hedged=True, secondary_won=future is not first)
+                    return future.result()
+                errors.append(error)
+        self._count(hedged=True, failed=True)
+        raise _primary_error(errors, first)
+
+    async def run_async(
+        self,
+        primary: Callable[[], Awaitable[T]],
+        secondary: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Async variant of :meth:`run`; the losing fetch is cancelled."""
+        async def timed_primary() -> T:
+            started = time.monotonic()
+            value = await primary()
+            self.record(time.monotonic() - started)
+            return value
+
+        first = asyncio.ensure_future(timed_primary())
+        tasks = [first]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.delay())
+            if done and first.exception() is None:
+                self._count()
+                return first.result()
+
+            tasks.append(asyncio.ensure_future(secondary()))
+            pending = {t for t in tasks if not t.done()}
+            errors: List[BaseException] = []
+            if done:
+                exc = first.exception()
+                assert exc is not None
+                errors.append(exc)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        self._count(hedged=True, secondary_won=task is not first)
+                        return task.result()
+                    errors.append(error)
+            self._count(hedged=True, failed=True)
+            raise _primary_error(errors, first)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def _count(self, *, hedged: bool = False, secondary_won: bool = False, failed: bool = False) -> None:
+        with self._lock:
+            stats = self._stats
+            self._stats = replace(
+                stats,
+                requests=stats.requests + 1,
+                hedged=stats.hedged + hedged,
+                secondary_wins=stats.secondary_wins + secondary_won,
+                failures=stats.failures + failed,
+            )
+
+
+def _primary_error(errors: List[BaseException], first: Union[Future, asyncio.Future]) -> BaseException:
+    # When both modes fail, the primary's error is the one worth reporting.
+    if first.done() and not first.cancelled():
+        exc = first.exception()
+        if exc is not None:
+            return exc
+    return errors[0]
+
+
+def _start_leg(fn: Callable[[], T]) -> "Future[T]":
+    # One thread per leg: a shared pool would let stale losing legs hold
+    # workers and queue new primaries behind them under batch load.
+    future: "Future[T]" = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="fast_flights-hedge", daemon=True).start()
+    return future
+
+
+_hedger = Hedger()
+
+
+def get_hedger() -> Hedger:
+    """Return the process-wide hedger used by ``mode="hedged"``."""
+    return _hedger
+
+
+def configure_hedging(policy: Optional[HedgePolicy] = None) -> Hedger:
+    """Replace the process-wide hedger (``None`` restores the default policy).
+
+    Latencies learned by the previous hedger are dropped.
+    """
+    global _hedger
+    _hedger = Hedger(policy)
+    return _hedger
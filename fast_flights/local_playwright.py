@@ -1,61 +1,114 @@
-from typing import Any
 import asyncio
-from playwright.async_api import async_playwright
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterable, Optional
 
-async def fetch_with_playwright(url: str) -> str:
-    async with async_playwright() as p:
-        # Launch with anti-detection settings
-        browser = await p.chromium.launch(
-            args=['--disable-blink-features=AutomationControlled']
-        )
-        # Create context with realistic user agent
-        context = await browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        )
-        page = await context.new_page()
-
-        # Remove webdriver property to avoid detection
-        await page.add_init_script('delete Object.getPrototypeOf(navigator).webdriver')
-
-        await page.goto(url)
-        if page.url.startswith("https://consent.google.com"):
-            await page.click('text="Accept all"')
-
-        # Wait for flight results (try multiple selectors)
-        try:
-            await page.wait_for_selector('.eQ35Ce', timeout=30000)
-        except:
-            # Try waiting for any flight list item instead
-            await page.wait_for_selector('li.pIav2d', timeout=30000)
-
-        # Wait for page to fully load before looking for "View more flights"
-        await page.wait_for_timeout(5000)
-
-        # Click ALL "View more flights" buttons (there can be multiple in Best + Cheapest sections)
-        try:
-            buttons = await page.locator('span.bEfgkb:has-text("View more flights")').all()
-            for btn in buttons:
-                try:
-                    await btn.click()
-                    await page.wait_for_timeout(2000)
-                except:
-                    pass  # Button may have become stale, continue
-        except:
-            pass  # No buttons found, continue
-
-        body = await page.evaluate(
-            "() => document.querySelector('[role=\"main\"]').innerHTML"
-        )
-        await browser.close()
-    return body
+from .browser_pool import get_browser_pool
+from .readiness import expand_results, get_readiness_policy
+from .urls import flights_url
 
-def local_playwright_fetch(params: dict) -> Any:
-    url = "https://www.google.com/travel/flights?" + "&".join(f"{k}={v}" for k, v in params.items())
-    body = asyncio.run(fetch_with_playwright(url))
 
+async def _load_results(page: Any, url: str) -> str:
+    await page.goto(url)
+    if page.url.startswith("https://consent.google.com"):
+        await page.click('text="Accept all"')
+
+    # Wait for flight results (try multiple selectors)
+    try:
+        await page.wait_for_selector('.eQ35Ce', timeout=30000)
+    except:
+        # Try waiting for any flight list item instead
+        await page.wait_for_selector('li.pIav2d', timeout=30000)
+
+    # Let the list settle, then expand Best + Cheapest sections
+    policy = get_readiness_policy()
+    await policy.settle(page)
+    await expand_results(page, policy)
+
+    return await page.evaluate(
+        "() => document.querySelector('[role=\"main\"]').innerHTML"
+    )
+
+async def fetch_with_playwright(url: str) -> str:
+    # Pages come from the shared browser pool (see browser_pool.py), so only
+    # the first search pays for launching Chromium.
+    return await get_browser_pool().run(lambda page: _load_results(page, url))
+
+def _dummy_response(body: str) -> Any:
     class DummyResponse:
         status_code = 200
         text = body
         text_markdown = body
 
     return DummyResponse
+
+def local_playwright_fetch(params: dict) -> Any:
+    url = flights_url(params)
+    body = get_browser_pool().run_sync(lambda page: _load_results(page, url))
+    return _dummy_response(body)
+
+async def local_playwright_fetch_async(params: dict) -> Any:
+    """Async variant of :func:`local_playwright_fetch` for use inside a running event loop."""
+    url = flights_url(params)
+    body = await fetch_with_playwright(url)
+    return _dummy_response(body)
+
+
+@dataclass
+class PageFetch:
+    """One page of a :func:`local_playwright_fetch_many` run.
+
+    ``error`` is the exception raised while loading this page, or ``None``
+    on success (then ``body`` holds the results HTML).
+    """
+
+    index: int
+    url: str
+    body: Optional[str] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+async def local_playwright_fetch_many(
+    params_list: Iterable[dict],
+    *,
+    concurrency: Optional[int] = None,
+) -> AsyncIterator[PageFetch]:
+    """Load many searches in parallel pages of the pooled browsers.
+
+    Each entry of ``params_list`` is turned into a URL exactly as
+    :func:`local_playwright_fetch` does. At most ``concurrency`` pages load at
+    once (default: the pool's capacity, ``size * max_pages_per_browser``;
+    use ``configure_browser_pool(size=1, max_pages_per_browser=N)`` to keep
+    everything in one browser). Pages are yielded as they finish, so
+    ``index`` gives the position in ``params_list``. A failing page is
+    reported with ``error`` set and doesn't stop the others.
+
+    Example:
+        >>> async for page in local_playwright_fetch_many(params_list, concurrency=6):
+        ...     if page.ok:
+        ...         handle(page.index, page.body)
+    """
+    pool = get_browser_pool()
+    limit = concurrency or pool.size * pool.max_pages_per_browser
+    assert limit >= 1, "concurrency must be >= 1"
+    semaphore = asyncio.Semaphore(limit)
+
+    async def load(index: int, url: str) -> PageFetch:
+        async with semaphore:
+            try:
+                body = await pool.run(lambda page: _load_results(page, url))
+            except Exception as e:
+                return PageFetch(index=index, url=url, error=e)
+            return PageFetch(index=index, url=url, body=body)
+
+    tasks = [asyncio.ensure_future(load(i, flights_url(params))) for i, params in enumerate(params_list)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Reached when the caller stops iterating early too; don't leave
+        # pages loading for results nobody will read.
+        for task in tasks:
+            task.cancel()
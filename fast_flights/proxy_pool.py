@@ -0,0 +1,180 @@
+"""Rotate ``mode="common"`` requests across a set of proxies.
+
+Google throttles per client IP, so one proxy caps sustained throughput no
+matter how many threads are searching. A :class:`ProxyPool` passed as
+``proxy=`` hands each request (and each retry, once retries are enabled
+with :func:`~fast_flights.retry.configure_retry`) the next healthy proxy,
+records how it went, and sits a proxy out for a cooldown once it keeps
+failing. Every proxy gets its own pooled ``primp`` sessions and its own
+rate-limit bucket, since both are keyed by the proxy URL.
+
+Example:
+    >>> proxies = ProxyPool(["http://p1:8080", "http://p2:8080"])
+    >>> get_flights_from_filter(filter, proxy=proxies)
+    >>> proxies.stats()
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .exceptions import FetchError
+
+# Statuses that say more about the exit IP than about the search.
+PROXY_FAILURE_STATUSES = frozenset({403, 407, 429})
+
+
+@dataclass(frozen=True)
+class ProxyStats:
+    """Outcomes observed for one proxy."""
+
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    # Exponentially weighted moving average of request latency, in seconds.
+    latency: Optional[float] = None
+    ejections: int = 0
+    ejected_until: Optional[float] = None
+
+    @property
+    def success_rate(self) -> float:
+        return 1.0 - self.failures / self.requests if self.requests else 1.0
+
+
+class ProxyPool:
+    """A thread-safe rotation of proxies with health tracking.
+
+    Healthy proxies are used round-robin, which spreads load evenly across
+    exit IPs. A proxy that fails ``max_failures`` times in a row is ejected
+    for ``cooldown`` seconds (doubling on each further ejection, up to
+    ``max_cooldown``); if every proxy is ejected, the one due back soonest is
+    used rather than failing the search.
+
+    Args:
+        proxies (iterable of str): Proxy URLs.
+        max_failures (int, optional): Consecutive failures before a proxy is
+            ejected. Defaults to 3.
+        cooldown (float, optional): Seconds a proxy sits out after its first
+            ejection. Defaults to 30.
+        max_cooldown (float, optional): Cap on the cooldown. Defaults to 600.
+        latency_weight (float, optional): Weight of the newest sample in the
+            latency moving average. Defaults to 0.2.
+    """
+
+    def __init__(
+        self,
+        proxies: Iterable[str],
+        *,
+        max_failures: int = 3,
+        cooldown: float = 30.0,
+        max_cooldown: float = 600.0,
+        latency_weight: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.proxies: Tuple[str, ...] = tuple(dict.fromkeys(proxies))
+        assert self.proxies, "ProxyPool needs at least one proxy"
+        assert max_failures >= 1, "max_failures must be >= 1"
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.latency_weight = latency_weight
+        self._clock = clock
+        self._stats: Dict[str, ProxyStats] = {p: ProxyStats() for p in self.proxies}
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def choose(self) -> str:
+        """Return the next proxy to send a request through."""
+        with self._lock:
+            now = self._clock()
+            count = len(self.proxies)
+            for offset in range(count):
+                proxy = self.proxies[(self._next + offset) % count]
+                if self._available(proxy, now):
+                    self._next = (self._next + offset + 1) % count
+                    return proxy
+            return min(self.proxies, key=lambda p: self._stats[p].ejected_until or 0.0)
+
+    def record(self, proxy: str, *, ok: bool, latency: Optional[float] = None) -> None:
+        """Record the outcome of one request sent through ``proxy``."""
+        with self._lock:
+            stats = self._stats.get(proxy)
+            if stats is None:
+                return
+            if latency is not None:
+                w = self.latency_weight
+                latency = latency if stats.latency is None else w * latency + (1 - w) * stats.latency
+            else:
+                latency = stats.latency
+
+            if ok:
+                self._stats[proxy] = replace(
+                    stats,
+                    requests=stats.requests + 1,
+                    consecutive_failures=0,
+                    latency=latency,
+                    ejections=0,
+                    ejected_until=None,
+                )
+                return
+
+            stats = replace(
+                stats,
+                requests=stats.requests + 1,
+                failures=stats.failures + 1,
+                consecutive_failures=stats.consecutive_failures + 1,
+                latency=latency,
+            )
+            if stats.consecutive_failures >= self.max_failures:
+                cooldown = min(self.max_cooldown, self.cooldown * 2 ** stats.ejections)
+                stats = replace(
+                    stats,
+                    consecutive_failures=0,
+                    ejections=stats.ejections + 1,
+                    ejected_until=self._clock() + cooldown,
+                )
+            self._stats[proxy] = stats
+
+    @contextmanager
+    def track(self, proxy: str) -> Iterator[None]:
+        """Time the ``with`` block and record its outcome against ``proxy``.
+
+        Transport errors and 403/407/429/5xx responses count against the
+        proxy; other errors (e.g. a 404 for a malformed search) are re-raised
+        without touching its health.
+        """
+        started = self._clock()
+        try:
+            yield
+        except Exception as e:
+            if is_proxy_failure(e):
+                self.record(proxy, ok=False, latency=self._clock() - started)
+            raise
+        self.record(proxy, ok=True, latency=self._clock() - started)
+
+    def healthy(self) -> List[str]:
+        """Proxies not currently ejected."""
+        with self._lock:
+            now = self._clock()
+            return [p for p in self.proxies if self._available(p, now)]
+
+    def stats(self) -> Dict[str, ProxyStats]:
+        """Snapshot of the outcomes observed per proxy."""
+        with self._lock:
+            return dict(self._stats)
+
+    def _available(self, proxy: str, now: float) -> bool:
+        # Caller must hold self._lock.
+        until = self._stats[proxy].ejected_until
+        return until is None or now >= until
+
+
+ProxyLike = Union[str, ProxyPool, None]
+
+
+def is_proxy_failure(exc: BaseException) -> bool:
+    if isinstance(exc, FetchError):
+        return exc.status_code in PROXY_FAILURE_STATUSES or exc.status_code >= 500
+    return isinstance(exc, (RuntimeError, OSError))
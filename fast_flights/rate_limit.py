@@ -0,0 +1,184 @@
+"""Token-bucket rate limiting for outgoing fetches.
+
+Every fetch ``get_flights_from_tfs`` issues (cache hits excluded) first takes
+a token from the bucket for its fetch mode — and, by default, its proxy — so
+bursts from many threads or coroutines are smoothed out before Google or a
+paid backend starts refusing them. Nothing is limited until limits are
+configured.
+
+Example:
+    >>> configure_rate_limiter({
+    ...     "common": RateLimit(rate=2.0, burst=5),   # per proxy
+    ...     "bright-data": RateLimit(rate=10.0, burst=20),
+    ... })
+    >>> get_rate_limiter().stats()
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+# (fetch mode, proxy)
+LimiterKey = Tuple[str, Optional[str]]
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """A sustained request rate with room for short bursts.
+
+    Args:
+        rate (float): Requests per second allowed on average.
+        burst (int, optional): Requests that may go out back to back after
+            an idle period. Defaults to 1.
+    """
+
+    rate: float
+    burst: int = 1
+
+    def __post_init__(self):
+        assert self.rate > 0, "rate must be > 0"
+        assert self.burst >= 1, "burst must be >= 1"
+
+
+@dataclass(frozen=True)
+class RateLimitStats:
+    """Waiting observed for one (mode, proxy) key."""
+
+    requests: int = 0
+    waited: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.requests if self.requests else 0.0
+
+
+class TokenBucket:
+    """A thread-safe token bucket.
+
+    Callers reserve a token up front and are told how long to wait for it, so
+    the lock is never held while sleeping and sync and async callers can
+    share one bucket.
+    """
+
+    def __init__(self, limit: RateLimit, *, clock: Callable[[], float] = time.monotonic):
+        self.limit = limit
+        self._clock = clock
+        self._tokens = float(limit.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return the seconds to wait before using it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                float(self.limit.burst),
+                self._tokens + (now - self._updated) * self.limit.rate,
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.limit.rate
+
+
+class RateLimiter:
+    """Per-mode (and optionally per-proxy) token buckets.
+
+    Args:
+        limits (dict, optional): Fetch mode (``common``, ``bright-data``,
+            ``browserless``, ``local``, ``force-fallback``) to its
+            :class:`RateLimit`. Modes without an entry use ``default``.
+        default (RateLimit, optional): Limit for modes not in ``limits``.
+            Defaults to None (unlimited).
+        per_proxy (bool, optional): Give each proxy its own bucket, since the
+            target throttles per client IP. Defaults to True.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Mapping[str, RateLimit]] = None,
+        *,
+        default: Optional[RateLimit] = None,
+        per_proxy: bool = True,
+    ):
+        self.limits = dict(limits or {})
+        self.default = default
+        self.per_proxy = per_proxy
+        self._buckets: Dict[LimiterKey, Optional[TokenBucket]] = {}
+        self._stats: Dict[LimiterKey, RateLimitStats] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, mode: str, proxy: Optional[str] = None) -> float:
+        """Block until a request for ``mode`` / ``proxy`` may go out; returns the wait."""
+        wait = self._reserve(mode, proxy)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, mode: str, proxy: Optional[str] = None) -> float:
+        """Async variant of :meth:`acquire`; waits without blocking the event loop."""
+        wait = self._reserve(mode, proxy)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def stats(self) -> Dict[LimiterKey, RateLimitStats]:
+        """Snapshot of the waiting observed per (mode, proxy) key."""
+        with self._lock:
+            return dict(self._stats)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def _reserve(self, mode: str, proxy: Optional[str]) -> float:
+        key: LimiterKey = (mode, proxy if self.per_proxy else None)
+        with self._lock:
+            if key not in self._buckets:
+                limit = self.limits.get(mode, self.default)
+                self._buckets[key] = TokenBucket(limit) if limit is not None else None
+            bucket = self._buckets[key]
+
+        wait = bucket.reserve() if bucket is not None else 0.0
+
+        with self._lock:
+            stats = self._stats.get(key, RateLimitStats())
+            self._stats[key] = replace(
+                stats,
+                requests=stats.requests + 1,
+                waited=stats.waited + (wait > 0),
+                total_wait=stats.total_wait + wait,
+                max_wait=max(stats.max_wait, wait),
+            )
+        return wait
+
+
+_rate_limiter = RateLimiter()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide rate limiter consulted before every fetch."""
+    return _rate_limiter
+
+
+def configure_rate_limiter(
+    limits: Optional[Mapping[str, RateLimit]] = None,
+    *,
+    default: Optional[RateLimit] = None,
+    per_proxy: bool = True,
+) -> RateLimiter:
+    """Replace the process-wide rate limiter. With no arguments, nothing is limited.
+
+    Args:
+        limits (dict, optional): Fetch mode to :class:`RateLimit`.
+        default (RateLimit, optional): Limit for modes not in ``limits``.
+        per_proxy (bool, optional): One bucket per proxy. Defaults to True.
+    """
+    global _rate_limiter
+    _rate_limiter = RateLimiter(limits, default=default, per_proxy=per_proxy)
+    return _rate_limiter
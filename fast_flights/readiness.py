@@ -0,0 +1,170 @@
+"""Decide when a Google Flights results page is ready to be read.
+
+The Playwright fetchers used to sleep unconditionally once results appeared
+(5 s) and after every "View more flights" click (2-3 s). A
+:class:`ReadinessPolicy` instead polls the page — the result list has
+stopped growing, the ``ds:1`` script is present, optionally the network is
+idle — and gives up waiting at a deadline, returning whatever has loaded.
+
+``ReadinessPolicy.fixed_delays()`` restores the old sleeps, which is handy
+for measuring the latency saved:
+
+    >>> configure_readiness(ReadinessPolicy.fixed_delays())
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+RESULT_ITEM_SELECTOR = "li.pIav2d"
+VIEW_MORE_SELECTOR = 'span.bEfgkb:has-text("View more flights")'
+
+# [number of result rows, ds:1 script present]
+PROBE_JS = (
+    "() => [document.querySelectorAll('" + RESULT_ITEM_SELECTOR + "').length, "
+    "!!document.querySelector('script[class=\"ds:1\"]')]"
+)
+
+
+@dataclass(frozen=True)
+class ReadinessPolicy:
+    """How the Playwright fetchers wait for a results page to settle.
+
+    Args:
+        deadline_ms (int, optional): Longest wait for results to settle once
+            they first appear. Defaults to 8000.
+        click_deadline_ms (int, optional): Longest wait for more rows after a
+            "View more flights" click, or for the URL to change after
+            selecting a flight. Defaults to 4000.
+        poll_interval_ms (int, optional): Delay between probes. Defaults to 200.
+        stable_polls (int, optional): Consecutive probes with an unchanged row
+            count that count as "settled". Defaults to 2.
+        network_idle (bool, optional): Also wait for Playwright's
+            ``networkidle`` load state (within the deadline). Defaults to False.
+        fixed_settle_ms (int, optional): Sleep this long instead of probing
+            (legacy behaviour). Defaults to None.
+        fixed_click_ms (int, optional): Sleep this long after each click
+            instead of probing (legacy behaviour). Defaults to None.
+    """
+
+    deadline_ms: int = 8000
+    click_deadline_ms: int = 4000
+    poll_interval_ms: int = 200
+    stable_polls: int = 2
+    network_idle: bool = False
+    fixed_settle_ms: Optional[int] = None
+    fixed_click_ms: Optional[int] = None
+
+    @classmethod
+    def fixed_delays(cls, settle_ms: int = 5000, click_ms: int = 2000) -> "ReadinessPolicy":
+        """The unconditional sleeps the fetchers used before readiness probing."""
+        return cls(fixed_settle_ms=settle_ms, fixed_click_ms=click_ms)
+
+    async def settle(self, page: Any, *, require_ds1: bool = False) -> bool:
+        """Wait until the result list stops changing.
+
+        With ``require_ds1`` the ``ds:1`` script must be present as well
+        (needed when the caller parses the page with ``data_source='js'``).
+
+        Returns:
+            bool: ``True`` if the page settled, ``False`` if the deadline hit
+            first. Either way the caller goes on with what has loaded.
+        """
+        if self.fixed_settle_ms is not None:
+            await page.wait_for_timeout(self.fixed_settle_ms)
+            return True
+
+        deadline = time.monotonic() + self.deadline_ms / 1000
+        if self.network_idle:
+            try:
+                await page.wait_for_load_state("networkidle", timeout=self.deadline_ms)
+            except Exception:
+                pass  # long-polling XHRs can keep the network busy; fall through to probing
+
+        return await self._wait_stable(page, deadline, require_ds1=require_ds1)
+
+    async def after_click(self, page: Any, rows_before: int) -> bool:
+        """Wait for a "View more flights" click to add rows, then for them to settle."""
+        if self.fixed_click_ms is not None:
+            await page.wait_for_timeout(self.fixed_click_ms)
+            return True
+
+        deadline = time.monotonic() + self.click_deadline_ms / 1000
+        while True:
+            rows, _ = await _probe(page)
+            if rows > rows_before:
+                return await self._wait_stable(page, deadline, last_rows=rows)
+            if time.monotonic() >= deadline:
+                return False
+            await page.wait_for_timeout(self.poll_interval_ms)
+
+    async def after_select(self, page: Any, url_before: str) -> bool:
+        """Wait for Google to rewrite the URL after a flight card is clicked."""
+        if self.fixed_click_ms is not None:
+            await page.wait_for_timeout(self.fixed_click_ms)
+            return True
+
+        deadline = time.monotonic() + self.click_deadline_ms / 1000
+        while page.url == url_before:
+            if time.monotonic() >= deadline:
+                return False
+            await page.wait_for_timeout(self.poll_interval_ms)
+        return True
+
+    async def _wait_stable(
+        self,
+        page: Any,
+        deadline: float,
+        *,
+        require_ds1: bool = False,
+        last_rows: Optional[int] = None,
+    ) -> bool:
+        streak = 0
+        while True:
+            rows, has_ds1 = await _probe(page)
+            if rows == last_rows and (has_ds1 or not require_ds1):
+                streak += 1
+                if streak >= self.stable_polls:
+                    return True
+            else:
+                streak = 0
+            last_rows = rows
+            if time.monotonic() >= deadline:
+                return False
+            await page.wait_for_timeout(self.poll_interval_ms)
+
+
+async def _probe(page: Any) -> Tuple[int, bool]:
+    rows, has_ds1 = await page.evaluate(PROBE_JS)
+    return int(rows), bool(has_ds1)
+
+
+async def expand_results(page: Any, policy: Optional[ReadinessPolicy] = None) -> None:
+    """Click every "View more flights" button (Best and Cheapest sections can each have one)."""
+    policy = policy or get_readiness_policy()
+    try:
+        buttons = await page.locator(VIEW_MORE_SELECTOR).all()
+    except Exception:
+        return  # No buttons found, continue
+    for btn in buttons:
+        try:
+            rows_before, _ = await _probe(page)
+            await btn.click()
+            await policy.after_click(page, rows_before)
+        except Exception:
+            pass  # Button may have become stale, continue
+
+
+_readiness_policy = ReadinessPolicy()
+
+
+def get_readiness_policy() -> ReadinessPolicy:
+    """Return the process-wide readiness policy used by the Playwright fetchers."""
+    return _readiness_policy
+
+
+def configure_readiness(policy: Optional[ReadinessPolicy] = None) -> ReadinessPolicy:
+    """Replace the process-wide readiness policy (``None`` restores the default)."""
+    global _readiness_policy
+    _readiness_policy = policy if policy is not None else ReadinessPolicy()
+    return _readiness_policy
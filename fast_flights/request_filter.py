@@ -0,0 +1,81 @@
+"""Drop page resources the parser never looks at.
+
+A Google Flights results page pulls in images, web fonts, map tiles and
+tracking beacons; ``parse_response`` only needs the document, the scripts
+that render the result list and the flights data XHRs. Aborting the rest
+makes page loads finish sooner and cuts browserless bandwidth.
+
+Stylesheets stay allowed by default: Playwright's visibility checks (waiting
+for ``.eQ35Ce``, clicking "View more flights") rely on computed styles.
+"""
+
+from dataclasses import dataclass
+from typing import Any, FrozenSet, Optional, Tuple
+
+DEFAULT_ALLOWED_TYPES: FrozenSet[str] = frozenset({"document", "script", "xhr", "fetch", "stylesheet"})
+
+# Hosts / paths aborted even when their resource type is allowed.
+DEFAULT_BLOCKED_URL_PARTS: Tuple[str, ...] = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googleadservices.com",
+    "maps.googleapis.com",
+    "maps.gstatic.com",
+    "fonts.googleapis.com",
+    "fonts.gstatic.com",
+    "play.google.com/log",
+    "/gen_204",
+    "/client_204",
+)
+
+
+@dataclass(frozen=True)
+class RequestFilter:
+    """Allowlist of resource types, plus URL fragments that are always blocked.
+
+    Args:
+        allowed_types (frozenset, optional): Playwright ``resource_type``
+            values to let through. Defaults to document, script, xhr, fetch
+            and stylesheet.
+        blocked_url_parts (tuple, optional): Substrings of URLs to abort
+            regardless of type (analytics, ads, maps, fonts, log beacons).
+    """
+
+    allowed_types: FrozenSet[str] = DEFAULT_ALLOWED_TYPES
+    blocked_url_parts: Tuple[str, ...] = DEFAULT_BLOCKED_URL_PARTS
+
+    def allows(self, resource_type: str, url: str) -> bool:
+        if resource_type not in self.allowed_types:
+            return False
+        return not any(part in url for part in self.blocked_url_parts)
+
+    async def install(self, target: Any) -> None:
+        """Route every request of a Playwright page or context through this filter."""
+        await target.route("**/*", self._handle)
+
+    async def _handle(self, route: Any) -> None:
+        request = route.request
+        if self.allows(request.resource_type, request.url):
+            await route.continue_()
+        else:
+            await route.abort()
+
+
+_request_filter: Optional[RequestFilter] = RequestFilter()
+
+
+def get_request_filter() -> Optional[RequestFilter]:
+    """Return the filter the browser fetch modes install, or ``None`` if disabled."""
+    return _request_filter
+
+
+def configure_request_filter(request_filter: Optional[RequestFilter] = RequestFilter()) -> Optional[RequestFilter]:
+    """Replace the filter used by the browser fetch modes; ``None`` loads everything.
+
+    Browsers already held by the browser pool keep the filter they were
+    created with until they are recycled.
+    """
+    global _request_filter
+    _request_filter = request_filter
+    return _request_filter
@@ -0,0 +1,139 @@
+"""Retry transient fetch failures with exponential backoff and jitter.
+
+``mode="common"`` and ``mode="bright-data"`` are single HTTP requests; a 429
+or a 5xx from Google (or Bright Data) is usually gone a second later. Retrying
+those cheaply here means ``mode="fallback"`` only escalates to a Playwright
+run once the plain request has really failed.
+
+Backoff is "full jitter": attempt ``n`` sleeps a random time between zero and
+``min(max_delay, base_delay * multiplier ** n)`` (or ``Retry-After`` when the
+server sent one), and no retry is started past the total ``deadline``.
+
+Retrying is opt-in: by default a failed fetch raises straight away, as it
+always has. ``configure_retry(RetryPolicy())`` turns on the defaults below.
+
+Example:
+    >>> configure_retry(RetryPolicy(max_attempts=5, deadline=30))
+    >>> configure_retry(None)  # back to failing fast
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, FrozenSet, Optional, Tuple, Type, TypeVar
+
+from .exceptions import FetchError
+
+T = TypeVar("T")
+
+DEFAULT_RETRY_STATUSES: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+# primp surfaces connect / read failures as RuntimeError.
+DEFAULT_RETRY_EXCEPTIONS: Tuple[Type[BaseException], ...] = (RuntimeError, OSError)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often, and how patiently, a failed fetch is retried.
+
+    Args:
+        max_attempts (int, optional): Total tries including the first one;
+            1 disables retrying. Defaults to 3.
+        base_delay (float, optional): Backoff cap for the first retry, in
+            seconds. Defaults to 0.5.
+        max_delay (float, optional): Upper bound for any single backoff.
+            Defaults to 8.0.
+        multiplier (float, optional): Growth of the backoff cap per attempt.
+            Defaults to 2.0.
+        jitter (bool, optional): Sleep a random time up to the cap ("full
+            jitter") so many clients don't retry in lockstep. Defaults to True.
+        retry_statuses (frozenset, optional): HTTP statuses worth retrying.
+            Defaults to 429, 500, 502, 503 and 504.
+        retry_exceptions (tuple, optional): Transport errors worth retrying.
+            Defaults to ``RuntimeError`` (primp) and ``OSError``.
+        deadline (float, optional): Seconds from the first attempt after which
+            no retry is started. Defaults to 20.0; None for no limit.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    multiplier: float = 2.0
+    jitter: bool = True
+    retry_statuses: FrozenSet[int] = DEFAULT_RETRY_STATUSES
+    retry_exceptions: Tuple[Type[BaseException], ...] = DEFAULT_RETRY_EXCEPTIONS
+    deadline: Optional[float] = 20.0
+
+    def __post_init__(self):
+        assert self.max_attempts >= 1, "max_attempts must be >= 1"
+        assert self.base_delay >= 0 and self.max_delay >= 0, "delays must be >= 0"
+
+    @classmethod
+    def disabled(cls) -> "RetryPolicy":
+        """A policy that never retries."""
+        return cls(max_attempts=1)
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        if isinstance(exc, FetchError):
+            return exc.status_code in self.retry_statuses
+        return isinstance(exc, self.retry_exceptions)
+
+    def backoff(self, attempt: int, exc: Optional[BaseException] = None) -> float:
+        """Seconds to wait after failed attempt number ``attempt`` (0-based)."""
+        retry_after = getattr(exc, "retry_after", None)
+        if retry_after is not None:
+            return min(self.max_delay, retry_after)
+        cap = min(self.max_delay, self.base_delay * self.multiplier ** attempt)
+        return random.uniform(0, cap) if self.jitter else cap
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """Call ``fn()`` until it succeeds, raises something non-retryable, or the policy runs out."""
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                return fn()
+            except Exception as e:
+                delay = self._next_delay(e, attempt, started)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    async def call_async(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Async variant of :meth:`call`; backs off without blocking the event loop."""
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                return await fn()
+            except Exception as e:
+                delay = self._next_delay(e, attempt, started)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _next_delay(self, exc: BaseException, attempt: int, started: float) -> Optional[float]:
+        if attempt + 1 >= self.max_attempts or not self.is_retryable(exc):
+            return None
+        delay = self.backoff(attempt, exc)
+        if self.deadline is not None and time.monotonic() - started + delay > self.deadline:
+            return None
+        return delay
+
+
+_retry_policy = RetryPolicy.disabled()
+
+
+def get_retry_policy() -> RetryPolicy:
+    """Return the process-wide retry policy for the ``common`` and ``bright-data`` fetches."""
+    return _retry_policy
+
+
+def configure_retry(policy: Optional[RetryPolicy] = None) -> RetryPolicy:
+    """Replace the process-wide retry policy (``None`` restores the no-retry default)."""
+    global _retry_policy
+    _retry_policy = policy if policy is not None else RetryPolicy.disabled()
+    return _retry_policy
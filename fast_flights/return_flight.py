@@ -4,6 +4,8 @@ import base64
 from dataclasses import dataclass
 from typing import Optional, List, Literal, Dict, Any
 from . import flights_pb2 as PB
+from .core import FetchMode, get_flights_from_tfs, get_flights_from_tfs_async
+from .proxy_pool import ProxyLike
 
 
 def create_return_flight_filter(
@@ -516,10 +518,10 @@ def decode_return_flight_tfs(tfs: str) -> Dict[str, Any]:
 def get_return_flight_options(
     return_search_tfs: str,
     *,
-    mode: Literal["common", "fallback", "force-fallback", "local", "bright-data", "browserless"] = "fallback",
+    mode: FetchMode = "fallback",
     currency: str = "",
     tfu: str = "EgQIABABIgA",
-    proxy: Optional[str] = None,
+    proxy: ProxyLike = None,
 ) -> List[ReturnFlightOption]:
     """Fetch and decode all return flight options for a given outbound selection.
 
@@ -563,8 +565,6 @@ def get_return_flight_options(
         >>> for option in options:
         ...     print(f"{option.airline} {option.flight_number}: ${option.total_price}")
     """
-    from .core import get_flights_from_tfs
-
     result_js = get_flights_from_tfs(
         return_search_tfs,
         data_source='js',
@@ -574,6 +574,35 @@ def get_return_flight_options(
         proxy=proxy,
     )
 
+    return _return_options_from_result(result_js, currency)
+
+
+async def get_return_flight_options_async(
+    return_search_tfs: str,
+    *,
+    mode: FetchMode = "fallback",
+    currency: str = "",
+    tfu: str = "EgQIABABIgA",
+    proxy: ProxyLike = None,
+) -> List[ReturnFlightOption]:
+    """Async variant of :func:`get_return_flight_options`.
+
+    Example:
+        >>> options = await get_return_flight_options_async(tfs, tfu=selected_outbound.tfu)
+    """
+    result_js = await get_flights_from_tfs_async(
+        return_search_tfs,
+        data_source='js',
+        mode=mode,
+        currency=currency,
+        tfu=tfu,
+        proxy=proxy,
+    )
+
+    return _return_options_from_result(result_js, currency)
+
+
+def _return_options_from_result(result_js: Any, currency: str) -> List[ReturnFlightOption]:
     # If JS worked and has the expected structure, use it
     if result_js and hasattr(result_js, 'best'):
         return_options = []
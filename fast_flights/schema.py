@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import List, Literal, Optional
 
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 @dataclass
 class Result:
@@ -10,7 +13,7 @@ class Result:
     flights: List[Flight]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Flight:
     is_best: bool
     name: str
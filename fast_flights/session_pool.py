@@ -0,0 +1,140 @@
+"""Long-lived, pooled ``primp`` sessions shared by the HTTP fetch modes.
+
+Building a ``primp.Client`` per request means a fresh TLS handshake, a fresh
+connection and a fresh impersonation profile on every search. The pool keeps
+idle clients around (keyed by proxy / impersonation profile) so the next
+request can reuse their keep-alive connections.
+
+Each client is checked out by exactly one caller at a time, so the pool is
+safe to share between threads.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Tuple
+
+from .primp import Client
+
+# (proxy, impersonate, verify)
+SessionKey = Tuple[Optional[str], Optional[str], bool]
+
+
+class SessionPool:
+    """A thread-safe pool of reusable ``primp.Client`` sessions.
+
+    Args:
+        max_size (int, optional): Maximum number of idle sessions kept per
+            (proxy, impersonation profile) key. Defaults to 8.
+        idle_timeout (float, optional): Seconds an idle session may sit in the
+            pool before it is evicted. Defaults to 90.
+        client_factory (callable, optional): Builds a new client from keyword
+            arguments. Defaults to ``primp.Client``.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 8,
+        idle_timeout: float = 90.0,
+        client_factory: Callable[..., Client] = Client,
+    ):
+        assert max_size >= 0, "max_size must be >= 0"
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.client_factory = client_factory
+        self._idle: Dict[SessionKey, Deque[Tuple[float, Client]]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def session(
+        self,
+        *,
+        proxy: Optional[str] = None,
+        impersonate: Optional[str] = None,
+        verify: bool = True,
+    ) -> Iterator[Client]:
+        """Check out a session for the duration of the ``with`` block.
+
+        The session goes back to the pool when the block exits normally. If
+        the block raises (e.g. a transport error), the session is discarded
+        since its connection may be in an unknown state.
+        """
+        key: SessionKey = (proxy, impersonate, verify)
+        client = self._checkout(key)
+        yield client
+        self._checkin(key, client)
+
+    def clear(self) -> None:
+        """Drop every idle session."""
+        with self._lock:
+            self._idle.clear()
+
+    def idle_count(self) -> int:
+        """Number of idle sessions currently held (after evicting stale ones)."""
+        with self._lock:
+            self._evict_stale(time.monotonic())
+            return sum(len(q) for q in self._idle.values())
+
+    def _checkout(self, key: SessionKey) -> Client:
+        with self._lock:
+            self._evict_stale(time.monotonic())
+            queue = self._idle.get(key)
+            if queue:
+                # LIFO: the most recently used session has the warmest connection.
+                _, client = queue.pop()
+                return client
+
+        proxy, impersonate, verify = key
+        kwargs: Dict[str, Any] = {"verify": verify}
+        if proxy is not None:
+            kwargs["proxy"] = proxy
+        if impersonate is not None:
+            kwargs["impersonate"] = impersonate
+        return self.client_factory(**kwargs)
+
+    def _checkin(self, key: SessionKey, client: Client) -> None:
+        if self.max_size == 0:
+            return
+        with self._lock:
+            queue = self._idle.setdefault(key, deque())
+            queue.append((time.monotonic(), client))
+            while len(queue) > self.max_size:
+                queue.popleft()
+
+    def _evict_stale(self, now: float) -> None:
+        # Caller must hold self._lock.
+        for key in list(self._idle):
+            queue = self._idle[key]
+            while queue and now - queue[0][0] > self.idle_timeout:
+                queue.popleft()
+            if not queue:
+                del self._idle[key]
+
+
+_session_pool = SessionPool()
+
+
+def get_session_pool() -> SessionPool:
+    """Return the process-wide session pool used by the HTTP fetch modes."""
+    return _session_pool
+
+
+def configure_session_pool(
+    *,
+    max_size: int = 8,
+    idle_timeout: float = 90.0,
+) -> SessionPool:
+    """Replace the process-wide session pool.
+
+    Idle sessions held by the previous pool are dropped.
+
+    Args:
+        max_size (int, optional): Maximum idle sessions per key. Defaults to 8.
+        idle_timeout (float, optional): Idle eviction timeout in seconds.
+            Defaults to 90.
+    """
+    global _session_pool
+    _session_pool = SessionPool(max_size=max_size, idle_timeout=idle_timeout)
+    return _session_pool
@@ -0,0 +1,140 @@
+"""Coalesce identical concurrent searches into one fetch.
+
+An API tier often receives the same route, date and cabin from many users
+within the same second. With single-flight enabled, the first caller for a
+search runs the fetch and ``parse_response``; callers arriving while it is in
+flight wait for it and receive the same result (or the same exception)
+instead of issuing their own request. Nothing is remembered once the search
+completes — pair it with a :class:`~fast_flights.cache.ResponseCache` for
+that.
+
+Threads coalesce with threads and coroutines with coroutines on the same
+event loop. Coalesced callers share one result object, so treat it as
+read-only.
+
+Example:
+    >>> configure_single_flight(True)
+    >>> with ThreadPoolExecutor(16) as pool:
+    ...     results = list(pool.map(lambda _: get_flights_from_filter(f, data_source="js"), range(16)))
+"""
+
+import asyncio
+import json
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def search_key(params: dict, mode: str, data_source: str, keep_raw: Any) -> str:
+    """Key identifying searches that may share one fetch.
+
+    Built from the final request params (``tfs``, ``curr``, ``tfu``, ``hl``,
+    ``gl``) plus what shapes the result: the data source, ``keep_raw``, and the
+    fetch mode (browser modes return a different document).
+    """
+    return json.dumps(
+        [mode, data_source, keep_raw, sorted((str(k), str(v)) for k, v in params.items())],
+        separators=(",", ":"),
+    )
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    """Calls seen by a :class:`SingleFlight`."""
+
+    calls: int = 0
+    shared: int = 0
+
+
+class _Call:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time; concurrent callers share its outcome."""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], "asyncio.Task[Any]"] = {}
+        self._stats = SingleFlightStats()
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Return ``fn()``, or the outcome of the in-flight call for ``key`` (blocking)."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            self._count(shared=not leader)
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = fn()
+            return call.value
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Async variant of :meth:`do`.
+
+        The shared call runs as its own task, so one caller being cancelled
+        doesn't cancel it for the others.
+        """
+        loop = asyncio.get_running_loop()
+        task_key = (loop, key)
+        with self._lock:
+            task = self._tasks.get(task_key)
+            leader = task is None
+            if leader:
+                task = self._tasks[task_key] = loop.create_task(fn())  # type: ignore[arg-type]
+                task.add_done_callback(lambda _: self._forget(task_key))
+            self._count(shared=not leader)
+        return await asyncio.shield(task)
+
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return self._stats
+
+    def _forget(self, task_key: Tuple[asyncio.AbstractEventLoop, Hashable]) -> None:
+        with self._lock:
+            self._tasks.pop(task_key, None)
+
+    def _count(self, *, shared: bool) -> None:
+        # Caller must hold self._lock.
+        self._stats = SingleFlightStats(
+            calls=self._stats.calls + 1,
+            shared=self._stats.shared + shared,
+        )
+
+
+_single_flight: Optional[SingleFlight] = None
+
+
+def get_single_flight() -> Optional[SingleFlight]:
+    """Return the process-wide single-flight group, or ``None`` if coalescing is off."""
+    return _single_flight
+
+
+def configure_single_flight(enabled: bool = True) -> Optional[SingleFlight]:
+    """Turn coalescing of identical concurrent searches on (the default here) or off."""
+    global _single_flight
+    _single_flight = SingleFlight() if enabled else None
+    return _single_flight
@@ -0,0 +1,152 @@
+"""Per-stage timing hooks: TFS encoding, fetch, DOM parsing, JSON and decoding.
+
+Every search reports its stages to the active :class:`Tracer`. The default
+one does nothing, so tracing costs a function call and a shared no-op
+context manager per stage. Two implementations ship with the package:
+
+* :class:`CallbackTracer` hands a :class:`SpanRecord` to a callback when each
+  stage finishes — enough for logging or metrics.
+* :class:`OpenTelemetryTracer` forwards to an OpenTelemetry tracer (the
+  ``opentelemetry-api`` package is only needed if you use it).
+
+Spans (all prefixed ``fast_flights.``): ``encode_tfs``, ``search`` (mode,
+data_source), ``fetch`` (mode, bytes, cache_hit), ``parse`` (data_source,
+bytes, itineraries), ``dom_parse``, ``extract_ds1`` (scanner), ``json_decode``
+(backend, bytes) and ``decode`` (itineraries). Events: ``fallback``
+(from_mode, to_mode, reason).
+
+Example:
+    >>> configure_tracing(CallbackTracer(lambda span: print(span.name, span.duration, span.attributes)))
+"""
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, ContextManager, Dict, Iterator, Optional
+
+Attributes = Dict[str, Any]
+
+
+class Span:
+    """What a stage can annotate while it runs."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+class _NoopSpanContext(Span):
+    # Shared by every disabled stage: entering it allocates nothing.
+    def __enter__(self) -> Span:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpanContext()
+
+
+class Tracer:
+    """Receives the stages of each search. This base class ignores them.
+
+    Subclasses override :meth:`span` and :meth:`event` and set ``enabled``,
+    which lets callers skip computing attributes nobody will read.
+    """
+
+    enabled = False
+
+    def span(self, name: str, attributes: Optional[Attributes] = None) -> ContextManager[Span]:
+        """Context manager timing one stage."""
+        return _NOOP_SPAN
+
+    def event(self, name: str, attributes: Optional[Attributes] = None) -> None:
+        """A point-in-time occurrence, such as a fallback transition."""
+
+
+@dataclass
+class SpanRecord(Span):
+    """A finished stage (or an event, with zero duration) passed to :class:`CallbackTracer`."""
+
+    name: str
+    start: float
+    duration: float = 0.0
+    attributes: Attributes = field(default_factory=dict)
+    error: Optional[BaseException] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+class CallbackTracer(Tracer):
+    """Calls ``callback(record)`` as each stage finishes and for each event.
+
+    Exceptions raised by the callback are swallowed so instrumentation can't
+    fail a search.
+
+    Args:
+        callback (callable): Receives a :class:`SpanRecord`.
+    """
+
+    enabled = True
+
+    def __init__(self, callback: Callable[[SpanRecord], Any]):
+        self.callback = callback
+
+    @contextmanager
+    def span(self, name: str, attributes: Optional[Attributes] = None) -> Iterator[Span]:
+        record = SpanRecord(name, time.perf_counter(), attributes=dict(attributes or {}))
+        try:
+            yield record
+        except BaseException as e:
+            record.error = e
+            raise
+        finally:
+            record.duration = time.perf_counter() - record.start
+            self._emit(record)
+
+    def event(self, name: str, attributes: Optional[Attributes] = None) -> None:
+        self._emit(SpanRecord(name, time.perf_counter(), attributes=dict(attributes or {})))
+
+    def _emit(self, record: SpanRecord) -> None:
+        try:
+            self.callback(record)
+        except Exception:
+            pass  # never let a metrics sink break a search
+
+
+class OpenTelemetryTracer(Tracer):
+    """Forwards stages to an OpenTelemetry tracer as nested spans.
+
+    Args:
+        tracer (optional): An ``opentelemetry.trace.Tracer``. Defaults to
+            ``trace.get_tracer("fast_flights")``.
+    """
+
+    enabled = True
+
+    def __init__(self, tracer: Any = None):
+        from opentelemetry import trace  # type: ignore
+
+        self._trace = trace
+        self._tracer = tracer if tracer is not None else trace.get_tracer("fast_flights")
+
+    def span(self, name: str, attributes: Optional[Attributes] = None) -> ContextManager[Span]:
+        return self._tracer.start_as_current_span(name, attributes=attributes)
+
+    def event(self, name: str, attributes: Optional[Attributes] = None) -> None:
+        self._trace.get_current_span().add_event(name, attributes=attributes or {})
+
+
+_tracer: Tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Return the process-wide tracer every search reports its stages to."""
+    return _tracer
+
+
+def configure_tracing(tracer: Optional[Tracer] = None) -> Tracer:
+    """Replace the process-wide tracer (``None`` restores the no-op tracer)."""
+    global _tracer
+    _tracer = tracer if tracer is not None else Tracer()
+    return _tracer
@@ -0,0 +1,11 @@
+"""URLs shared by the fetch modes."""
+
+FLIGHTS_URL = "https://www.google.com/travel/flights"
+
+
+def flights_url(params: dict) -> str:
+    """Build the results page URL for ``params`` (as built by ``get_flights_from_tfs``).
+
+    Values are joined as-is: ``tfs``/``tfu`` are already URL-safe base64.
+    """
+    return FLIGHTS_URL + "?" + "&".join(f"{k}={v}" for k, v in params.items())
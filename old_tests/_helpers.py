@@ -0,0 +1,170 @@
+"""Pages and ``ds:1`` roots shared by the offline tests.
+
+Responses are wrapped in :class:`fast_flights.cache.CachedResponse`, the
+package's own stand-in for a fetched page.
+"""
+
+import base64
+import json
+import random
+
+from fast_flights import flights_pb2 as PB
+
+
+WARNING_ENTRY = [
+    12,
+    None,
+    None,
+    None,
+    None,
+    ["Travel restricted", "Airspace closure may affect flights.", 2],
+]
+
+
+METADATA_ENTRY_WITH_INNER_LIST = [
+    [
+        None,
+        [[1783215731165430, 16320100, 3694350293], None, None, None, None, [[0]]],
+        0,
+        "c7ZJaraMCuSM5LcP1Z_N4Q0",
+        "HSQ2vRWrHUckAIEgBQBG--------pfbgq40AAAAAGpJtnMCmjXOA",
+    ],
+    [None, ""],
+]
+
+
+_UNSET = object()
+
+
+def minimal_itinerary(*, layovers=_UNSET, arrival_time=None):
+    """Return a minimally-structured itinerary el that decodes cleanly."""
+    arrival_time = [13, 0] if arrival_time is None else arrival_time
+    inner_flight = [None] * 23
+    inner_flight[3] = "WAW"  # departure_airport
+    inner_flight[4] = "Warsaw Frederic Chopin"
+    inner_flight[5] = "Helsinki Airport"
+    inner_flight[6] = "HEL"
+    inner_flight[8] = [10, 30]
+    inner_flight[10] = arrival_time
+    inner_flight[11] = 150
+    inner_flight[14] = ""
+    inner_flight[17] = "Aircraft"
+    inner_flight[20] = [2026, 6, 12]
+    inner_flight[21] = [2026, 6, 12]
+    inner_flight[22] = ["AY", "100", None, "Finnair"]
+    inner_flight[15] = []  # codeshares
+
+    main = [None] * 14
+    main[0] = "AY"
+    main[1] = ["Finnair"]
+    main[2] = [inner_flight]
+    main[3] = "WAW"
+    main[4] = [2026, 6, 12]
+    main[5] = [10, 30]
+    main[6] = "HEL"
+    main[7] = [2026, 6, 12]
+    main[8] = arrival_time
+    main[9] = 150
+    main[13] = [] if layovers is _UNSET else layovers
+
+    summary_b64 = ""  # ItinerarySummary.from_b64("") is tolerated downstream
+    return [main, [None, summary_b64]]
+
+
+def root_with(best_entries, other_entries=None, warnings_at_22=None):
+    """Build a 31-element root mimicking Google's data[*] response shape."""
+    other = other_entries if other_entries is not None else [minimal_itinerary()]
+    root = [None] * 31
+    root[2] = [best_entries]
+    root[3] = [other]
+    if warnings_at_22 is not None:
+        root[22] = warnings_at_22
+    return root
+
+
+_AIRPORTS = [
+    ("SFO", "San Francisco International Airport", "San Francisco"),
+    ("JFK", "John F. Kennedy International Airport", "New York"),
+    ("ORD", "O'Hare International Airport", "Chicago"),
+    ("DEN", "Denver International Airport", "Denver"),
+    ("MCO", "Orlando International Airport", "Orlando"),
+    ("ATL", "Hartsfield-Jackson Atlanta International Airport", "Atlanta"),
+]
+
+_AIRLINES = [("UA", "United"), ("AA", "American"), ("DL", "Delta"), ("B6", "JetBlue"), ("F9", "Frontier")]
+
+
+def _flight(rng, dep, arr, date, hour, minutes):
+    code, name = rng.choice(_AIRLINES)
+    arrives = hour * 60 + minutes
+    f = [None] * 31
+    f[2] = name
+    f[3], f[4] = dep[0], dep[1]
+    f[5], f[6] = arr[0], arr[1]
+    f[8] = [hour % 24, rng.choice([0, 15, 30, 45])]
+    f[10] = [(arrives // 60) % 24, arrives % 60]
+    f[11] = minutes
+    f[14] = "31 inches"
+    f[15] = [[c, str(rng.randint(1000, 9999)), None, n] for c, n in rng.sample(_AIRLINES, rng.randint(0, 2))]
+    f[17] = "Airbus A320"
+    f[20] = list(date)
+    f[21] = list(date)
+    f[22] = [code, str(rng.randint(100, 2999)), None, name]
+    return f
+
+
+def _itinerary(rng, origin, destination, date):
+    stops = rng.choice([0, 1, 2])
+    path = [origin] + rng.sample([a for a in _AIRPORTS if a not in (origin, destination)], stops) + [destination]
+    hour = rng.randint(5, 18)
+    flights, layovers, total = [], [], 0
+    for i, (dep, arr) in enumerate(zip(path, path[1:])):
+        minutes = rng.randint(55, 300)
+        flights.append(_flight(rng, dep, arr, date, hour, minutes))
+        total += minutes
+        hour += minutes // 60 + 1
+        if i < stops:
+            wait = rng.randint(40, 180)
+            total += wait
+            layovers.append([wait, arr[0], arr[0], None, arr[1], arr[2], arr[1], arr[2]])
+
+    main = [None] * 24
+    main[0] = flights[0][22][0]
+    main[1] = sorted({f[2] for f in flights})
+    main[2] = flights
+    main[3] = origin[0]
+    main[4] = list(date)
+    main[5] = flights[0][8]
+    main[6] = destination[0]
+    main[7] = list(date)
+    main[8] = flights[-1][10]
+    main[9] = total
+    main[13] = layovers or None
+
+    summary = PB.ItinerarySummary()
+    summary.flights = "|".join(f"{f[22][0]}{f[22][1]}" for f in flights)
+    summary.price.price = rng.randint(79, 1400) * 100
+    summary.price.currency = "USD"
+    return [main, [None, base64.b64encode(summary.SerializeToString()).decode("ascii")]]
+
+
+def synthetic_root(*, best=1, other=1, seed=0, return_page=False):
+    """Build a root of varied itineraries (stops, layovers, codeshares); deterministic per seed."""
+    rng = random.Random(seed)
+    origin, destination = rng.sample(_AIRPORTS, 2)
+    date = (2026, rng.randint(1, 12), rng.randint(1, 28))
+    root = [None] * 31
+    root[0] = [None, "c7ZJaraMCuSM5LcP1Z_N4Q0", [[origin[0], origin[2]], [destination[0], destination[2]]]]
+    root[2] = None if return_page else [[_itinerary(rng, origin, destination, date) for _ in range(best)]]
+    root[3] = [[_itinerary(rng, origin, destination, date) for _ in range(other)]]
+    return root
+
+
+def js_page(root) -> str:
+    """Wrap a ``ds:1`` data root in the script tag ``parse_response(..., 'js')`` reads."""
+    payload = json.dumps(root, separators=(",", ":"), ensure_ascii=False)
+    return (
+        "<html><body>"
+        f"<script class=\"ds:1\">AF_initDataCallback({{key:'ds:1',data:{payload},sideChannel:{{}}}});</script>"
+        "</body></html>"
+    )
@@ -0,0 +1,83 @@
+"""Tests for the asyncio entry points in fast_flights.core."""
+
+import asyncio
+import threading
+
+from fast_flights import core, get_flights_from_tfs_async
+from fast_flights.return_flight import get_return_flight_options_async
+from fast_flights.cache import CachedResponse
+
+from _helpers import js_page, minimal_itinerary, root_with
+
+
+def test_concurrent_searches_with_gather(monkeypatch):
+    page = js_page(root_with(best_entries=[minimal_itinerary()]))
+    fetched = []
+    main_thread = threading.get_ident()
+
+    def fake_fetch(params, proxy=None):
+        fetched.append((params["tfs"], threading.get_ident()))
+        return CachedResponse(page)
+
+    monkeypatch.setattr(core, "fetch", fake_fetch)
+
+    async def run():
+        return await asyncio.gather(
+            get_flights_from_tfs_async("AAA", data_source="js"),
+            get_flights_from_tfs_async("BBB", data_source="js", tfu="custom"),
+        )
+
+    first, second = asyncio.run(run())
+
+    assert len(first.best) == 1
+    assert second.best[0].tfu == "custom"
+    assert sorted(tfs for tfs, _ in fetched) == ["AAA", "BBB"]
+    # The blocking HTTP call must not run on the event loop thread.
+    assert all(thread != main_thread for _, thread in fetched)
+
+
+def test_browserless_mode_is_awaited_on_running_loop(monkeypatch):
+    page = js_page(root_with(best_entries=[minimal_itinerary()]))
+    loops = []
+
+    async def fake_browserless_fetch_async(params):
+        loops.append(asyncio.get_running_loop())
+        return CachedResponse(page)
+
+    monkeypatch.setattr(core, "browserless_fetch_async", fake_browserless_fetch_async)
+
+    async def run():
+        result = await get_flights_from_tfs_async("AAA", mode="browserless", data_source="js")
+        return result, asyncio.get_running_loop()
+
+    result, loop = asyncio.run(run())
+
+    assert len(result.best) == 1
+    assert loops == [loop]
+
+
+def test_fallback_mode_escalates_after_failed_fetch(monkeypatch):
+    page = js_page(root_with(best_entries=[minimal_itinerary()]))
+
+    def failing_fetch(params, proxy=None):
+        raise AssertionError("429 Result: rate limited")
+
+    import fast_flights.fallback_playwright as fallback
+
+    monkeypatch.setattr(core, "fetch", failing_fetch)
+    monkeypatch.setattr(fallback, "fallback_playwright_fetch", lambda params: CachedResponse(page))
+
+    result = asyncio.run(get_flights_from_tfs_async("AAA", mode="fallback", data_source="js"))
+
+    assert len(result.best) == 1
+
+
+def test_return_flight_options_async(monkeypatch):
+    page = js_page(root_with(best_entries=[minimal_itinerary()], other_entries=[]))
+    monkeypatch.setattr(core, "fetch", lambda params, proxy=None: CachedResponse(page))
+
+    options = asyncio.run(get_return_flight_options_async("AAA", mode="common"))
+
+    assert len(options) == 1
+    assert options[0].airline == "AY"
+    assert options[0].departure_time == "10:30"
@@ -0,0 +1,88 @@
+"""Tests for get_flights_batch fan-out."""
+
+import threading
+
+from fast_flights import (
+    FlightData,
+    Passengers,
+    TFSData,
+    core,
+    get_flights_batch,
+)
+from fast_flights.cache import CachedResponse
+
+from _helpers import js_page, minimal_itinerary, root_with
+
+
+def _filter(date: str) -> TFSData:
+    return TFSData.from_interface(
+        flight_data=[FlightData(date=date, from_airport="WAW", to_airport="HEL")],
+        trip="one-way",
+        passengers=Passengers(adults=1),
+        seat="economy",
+    )
+
+
+def test_batch_yields_every_filter_and_reports_errors(monkeypatch):
+    page = js_page(root_with(best_entries=[minimal_itinerary()]))
+    failing_tfs = _filter("2026-06-13").as_b64().decode("utf-8")
+
+    def fake_fetch(params, proxy=None):
+        if params["tfs"] == failing_tfs:
+            raise AssertionError("503 Result: unavailable")
+        return CachedResponse(page)
+
+    monkeypatch.setattr(core, "fetch", fake_fetch)
+
+    filters = [_filter(f"2026-06-{day:02d}") for day in range(10, 16)]
+    results = list(get_flights_batch(filters, concurrency=3, data_source="js"))
+
+    assert sorted(r.index for r in results) == list(range(6))
+    failed = [r for r in results if not r.ok]
+    assert [r.index for r in failed] == [3]
+    assert isinstance(failed[0].error, AssertionError)
+    assert failed[0].filter is filters[3]
+    assert all(len(r.result.best) == 1 for r in results if r.ok)
+
+
+def test_batch_bounds_in_flight_searches(monkeypatch):
+    page = js_page(root_with(best_entries=[minimal_itinerary()]))
+    lock = threading.Lock()
+    active = [0]
+    peak = [0]
+    release = threading.Event()
+
+    def fake_fetch(params, proxy=None):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        release.wait(0.05)
+        with lock:
+            active[0] -= 1
+        return CachedResponse(page)
+
+    monkeypatch.setattr(core, "fetch", fake_fetch)
+
+    results = list(
+        get_flights_batch((_filter(f"2026-07-{d:02d}") for d in range(1, 21)), concurrency=4, data_source="js")
+    )
+
+    assert len(results) == 20
+    assert peak[0] <= 4
+
+
+def test_batch_consumes_filters_lazily(monkeypatch):
+    page = js_page(root_with(best_entries=[minimal_itinerary()]))
+    monkeypatch.setattr(core, "fetch", lambda params, proxy=None: CachedResponse(page))
+    produced = []
+
+    def filters():
+        for d in range(1, 29):
+            produced.append(d)
+            yield _filter(f"2026-08-{d:02d}")
+
+    stream = get_flights_batch(filters(), concurrency=2, data_source="js")
+    next(stream)
+    stream.close()
+
+    assert len(produced) < 28
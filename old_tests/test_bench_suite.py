@@ -0,0 +1,45 @@
+"""Tests for the offline benchmark corpus and suite runner."""
+
+from fast_flights.cache import CachedResponse
+from fast_flights.core import parse_response
+
+from benchmarks import bench_suite
+from benchmarks.corpus import html_corpus, html_page, js_corpus, synthetic_root
+
+
+def test_html_pages_render_the_same_itineraries():
+    root = synthetic_root(best=2, other=5, seed=7)
+    html = parse_response(CachedResponse(html_page(root)), "html")
+    js = parse_response(CachedResponse(html_page(root)), "js")
+
+    assert len(html.flights) == len(js.best) + len(js.other) == 7
+    assert [f.is_best for f in html.flights] == [True, True] + [False] * 5
+    assert html.flights[0].name == ", ".join(js.best[0].airline_names)
+    assert html.flights[0].price == f"${js.best[0].itinerary_summary.price:.0f}"
+    assert html.current_price in ("typical", "high")
+
+
+def test_corpus_covers_error_responses():
+    assert "error-response" in dict(js_corpus())
+    assert [name for name, _ in html_corpus()] == [name for name, _ in js_corpus() if name != "error-response"]
+
+
+def test_suite_reports_every_target():
+    results = bench_suite.run(repeat=2, only="[")
+    names = {s.name.split("[")[0] for s in results}
+    assert names == {
+        "parse_response",
+        "ResultDecoder.decode",
+        "TFSData.as_b64",
+        "create_return_flight_filter",
+        "decode_return_flight_tfs",
+    }
+    for s in results:
+        assert s.runs == 2 and s.p50 <= s.p95 <= s.p99 and s.ops_per_sec > 0 and s.peak_kib > 0
+
+
+def test_compare_flags_regressions():
+    stats = bench_suite.CaseStats("case", 10, 100.0, p50=2.0, p95=3.0, p99=4.0, peak_kib=10.0)
+    assert bench_suite.compare([stats], {"case": {"p50": 1.9, "peak_kib": 10.0}}, 0.25) == []
+    regressions = bench_suite.compare([stats], {"case": {"p50": 1.0, "peak_kib": 5.0}}, 0.25)
+    assert len(regressions) == 2 and regressions[0].startswith("case: p50")
@@ -0,0 +1,297 @@
+"""Tests for the shared Playwright browser pool, using fake browsers."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from fast_flights import browserless_fetch, local_playwright
+from fast_flights.browser_pool import BrowserPool
+
+
+class _FakePage:
+    def __init__(self, browser):
+        self.browser = browser
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeContext:
+    def __init__(self, browser, options):
+        self.browser = browser
+        self.options = options
+        self.init_scripts = []
+        self.routes = []
+
+    async def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+
+    async def add_init_script(self, script):
+        self.init_scripts.append(script)
+
+    async def new_page(self):
+        page = _FakePage(self.browser)
+        self.browser.pages.append(page)
+        return page
+
+
+class _FakeBrowser:
+    def __init__(self, n):
+        self.n = n
+        self.connected = True
+        self.closed = False
+        self.contexts = []
+        self.pages = []
+
+    def is_connected(self):
+        return self.connected and not self.closed
+
+    async def new_context(self, **options):
+        context = _FakeContext(self, options)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakePlaywright:
+    def __init__(self):
+        self.stopped = False
+
+    async def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture
+def pool_factory():
+    pools = []
+
+    def make(**kwargs):
+        launched = []
+        playwright = _FakePlaywright()
+
+        async def launcher(pw):
+            assert pw is playwright
+            browser = _FakeBrowser(len(launched))
+            launched.append(browser)
+            return browser
+
+        async def factory():
+            return playwright
+
+        pool = BrowserPool(launcher=launcher, playwright_factory=factory, **kwargs)
+        pools.append(pool)
+        return pool, launched, playwright
+
+    yield make
+    for pool in pools:
+        pool.close()
+
+
+async def _which_browser(page):
+    return page.browser.n
+
+
+def test_browser_is_reused_across_searches(pool_factory):
+    pool, launched, _ = pool_factory(size=2)
+    assert [pool.run_sync(_which_browser) for _ in range(5)] == [0] * 5
+    assert len(launched) == 1
+    browser = launched[0]
+    assert len(browser.contexts) == 1
+    assert browser.contexts[0].init_scripts
+    assert [pattern for pattern, _ in browser.contexts[0].routes] == ["**/*"]
+    assert all(page.closed for page in browser.pages)
+
+
+def test_recycles_after_max_uses(pool_factory):
+    pool, launched, _ = pool_factory(size=1, max_uses=2)
+    assert [pool.run_sync(_which_browser) for _ in range(5)] == [0, 0, 1, 1, 2]
+    assert launched[0].closed and launched[1].closed
+    assert pool.browser_count() == 1
+
+
+def test_crashed_browser_is_replaced(pool_factory):
+    pool, launched, _ = pool_factory(size=1)
+
+    async def crash(page):
+        page.browser.connected = False
+        raise RuntimeError("Target closed")
+
+    pool.run_sync(_which_browser)
+    with pytest.raises(RuntimeError, match="Target closed"):
+        pool.run_sync(crash)
+    assert pool.run_sync(_which_browser) == 1
+    assert pool.browser_count() == 1
+
+
+def test_slow_close_does_not_block_the_pool(pool_factory):
+    pool, launched, _ = pool_factory(size=2, max_uses=2)
+    assert pool.run_sync(_which_browser) == 0
+    unblock = threading.Event()
+
+    async def slow_close():
+        while not unblock.is_set():
+            await asyncio.sleep(0.01)
+        launched[0].closed = True
+
+    launched[0].close = slow_close
+    retiring = threading.Thread(target=pool.run_sync, args=(_which_browser,))
+    retiring.start()
+    try:
+        while not launched[0].pages[-1].closed:
+            time.sleep(0.001)
+        # browser 0 is retired and its close is still pending
+        search = asyncio.run_coroutine_threadsafe(pool._with_page(_which_browser), pool._ensure_loop())
+        assert search.result(timeout=2) == 1
+    finally:
+        unblock.set()
+        retiring.join(5)
+    assert launched[0].closed
+
+
+def test_concurrency_is_bounded_by_size_and_pages(pool_factory):
+    pool, launched, _ = pool_factory(size=2, max_pages_per_browser=2)
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    async def work(page):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+        return page.browser.n
+
+    async def main():
+        return await asyncio.gather(*(pool.run(work) for _ in range(10)))
+
+    used = asyncio.run(main())
+    assert state["peak"] == 4
+    assert len(launched) == 2
+    assert set(used) == {0, 1}
+
+
+def test_close_stops_browsers_and_playwright(pool_factory):
+    pool, launched, playwright = pool_factory()
+    pool.run_sync(_which_browser)
+    pool.close()
+    assert launched[0].closed
+    assert playwright.stopped
+    with pytest.raises(AssertionError):
+        pool.run_sync(_which_browser)
+
+
+def test_local_fetch_draws_from_pool(monkeypatch, pool_factory):
+    pool, launched, _ = pool_factory()
+    seen = []
+
+    async def fake_load(page, url):
+        seen.append(url)
+        return "<div>results</div>"
+
+    monkeypatch.setattr(local_playwright, "get_browser_pool", lambda: pool)
+    monkeypatch.setattr(local_playwright, "_load_results", fake_load)
+
+    res = local_playwright.local_playwright_fetch({"tfs": "abc", "hl": "en"})
+    async_res = asyncio.run(local_playwright.local_playwright_fetch_async({"tfs": "def"}))
+
+    assert res.text == "<div>results</div>" and async_res.status_code == 200
+    assert seen == [
+        "https://www.google.com/travel/flights?tfs=abc&hl=en",
+        "https://www.google.com/travel/flights?tfs=def",
+    ]
+    assert len(launched) == 1
+
+
+def test_browser_is_replaced_after_max_age(pool_factory):
+    pool, launched, _ = pool_factory(size=1, max_age=0.05)
+    assert pool.run_sync(_which_browser) == 0
+    assert pool.run_sync(_which_browser) == 0
+    time.sleep(0.06)
+    assert pool.run_sync(_which_browser) == 1
+    assert launched[0].closed
+
+
+def test_page_is_retried_once_after_disconnect(pool_factory):
+    pool, launched, _ = pool_factory(size=1, reconnect_retries=1)
+    attempts = []
+
+    async def flaky(page):
+        attempts.append(page.browser.n)
+        if len(attempts) == 1:
+            page.browser.connected = False
+            raise RuntimeError("Browser has been closed")
+        return "ok"
+
+    assert pool.run_sync(flaky) == "ok"
+    assert attempts == [0, 1]
+
+
+def test_errors_on_a_live_browser_are_not_retried(pool_factory):
+    pool, _, _ = pool_factory(size=1, reconnect_retries=1)
+    attempts = []
+
+    async def broken(page):
+        attempts.append(page)
+        raise ValueError("selector not found")
+
+    with pytest.raises(ValueError):
+        pool.run_sync(broken)
+    assert len(attempts) == 1
+
+
+def test_browserless_pool_is_configured_from_env(monkeypatch):
+    monkeypatch.setattr(browserless_fetch, "_browserless_pool", None)
+    monkeypatch.setattr(browserless_fetch, "_browserless_pool_config", None)
+    monkeypatch.setenv("BROWSERLESS_ENDPOINT", "wss://chrome.example.com?stealth=true")
+    monkeypatch.setenv("BROWSERLESS_POOL_SIZE", "3")
+    monkeypatch.setenv("BROWSERLESS_MAX_PAGES_PER_SESSION", "2")
+    monkeypatch.setenv("BROWSERLESS_SESSION_TTL", "60")
+
+    pool = browserless_fetch.get_browserless_pool("key-1")
+    assert (pool.size, pool.max_pages_per_browser, pool.max_age, pool.reconnect_retries) == (3, 2, 60.0, 1)
+    assert browserless_fetch._browserless_pool_config[0] == "wss://chrome.example.com?stealth=true&token=key-1"
+    assert browserless_fetch.get_browserless_pool("key-1") is pool
+
+    replaced = browserless_fetch.get_browserless_pool("key-2")
+    assert replaced is not pool
+    assert browserless_fetch._browserless_pool_config[0].endswith("&token=key-2")
+
+
+def test_fetch_many_runs_pages_concurrently_and_yields_as_completed(monkeypatch, pool_factory):
+    pool, launched, _ = pool_factory(size=1, max_pages_per_browser=3)
+    state = {"active": 0, "peak": 0}
+
+    async def fake_load(page, url):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        tfs = url.split("tfs=")[1].split("&")[0]
+        await asyncio.sleep(0.05 if tfs == "slow" else 0.01)
+        state["active"] -= 1
+        if tfs == "bad":
+            raise RuntimeError("Timeout 30000ms exceeded")
+        return f"<main>{tfs}</main>"
+
+    monkeypatch.setattr(local_playwright, "get_browser_pool", lambda: pool)
+    monkeypatch.setattr(local_playwright, "_load_results", fake_load)
+
+    params = [{"tfs": "slow"}] + [{"tfs": f"t{i}"} for i in range(6)] + [{"tfs": "bad"}]
+
+    async def collect():
+        return [page async for page in local_playwright.local_playwright_fetch_many(params, concurrency=2)]
+
+    pages = asyncio.run(collect())
+
+    assert state["peak"] == 2
+    assert len(launched) == 1
+    assert sorted(p.index for p in pages) == list(range(8))
+    assert pages[0].index != 0  # the slow page doesn't hold back the others
+    by_index = {p.index: p for p in pages}
+    assert by_index[0].body == "<main>slow</main>"
+    assert by_index[0].url == "https://www.google.com/travel/flights?tfs=slow"
+    assert not by_index[7].ok and "Timeout" in str(by_index[7].error)
@@ -0,0 +1,251 @@
+"""Tests for per-mode circuit breakers and mode="auto"."""
+
+import asyncio
+
+import pytest
+
+from fast_flights import circuit_breaker, core, retry
+from fast_flights.cache import CachedResponse
+from fast_flights.circuit_breaker import (
+    BreakerPolicy,
+    CircuitBreaker,
+    CircuitBreakers,
+    is_fetch_failure,
+    is_page_failure,
+)
+from fast_flights.exceptions import CircuitOpenError, FetchError, GoogleFlightsErrorResponse
+from fast_flights.retry import RetryPolicy
+
+from _helpers import js_page, synthetic_root
+
+POLICY = BreakerPolicy(window=4, min_requests=4, failure_rate=0.5, open_for=10)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def no_retry(monkeypatch):
+    monkeypatch.setattr(retry, "_retry_policy", RetryPolicy.disabled())
+
+
+def _trip(breaker, failures=2, successes=2):
+    for ok in [True] * successes + [False] * failures:
+        breaker.record(ok)
+
+
+def test_opens_at_failure_rate_over_window(clock):
+    breaker = CircuitBreaker("common", POLICY, clock=clock)
+    for ok in (False, True, True):
+        breaker.record(ok)
+    assert breaker.state == "closed"  # below min_requests
+    breaker.record(True)
+    breaker.record(False)  # window is now T, T, T, F
+    assert breaker.state == "closed"
+    breaker.record(False)
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError) as info:
+        breaker.acquire()
+    assert info.value.mode == "common" and info.value.retry_after == 10
+
+
+def test_half_open_probe_closes_or_reopens(clock):
+    breaker = CircuitBreaker("common", POLICY, clock=clock)
+    _trip(breaker)
+    clock.now += 10
+    assert breaker.state == "half-open"
+
+    assert breaker.acquire() is True
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire()  # only one probe at a time
+    breaker.record(False, probe=True)
+    assert breaker.state == "open"
+
+    clock.now += 10
+    probe = breaker.acquire()
+    breaker.record(True, probe=probe)
+    assert breaker.state == "closed"
+    assert breaker.acquire() is False
+
+
+def test_cancelled_probe_frees_its_slot(clock):
+    breaker = CircuitBreaker("common", POLICY, clock=clock)
+    _trip(breaker)
+    clock.now += 10
+    breaker.release(breaker.acquire())
+    assert breaker.available()
+
+
+def test_disabled_registry_never_refuses():
+    breakers = CircuitBreakers(policy=None, auto_modes=["common", "force-fallback"])
+
+    def failing():
+        raise FetchError(503)
+
+    for _ in range(50):
+        with pytest.raises(FetchError):
+            breakers.call("common", failing)
+    assert breakers.call("common", lambda: "ok") == "ok"
+    assert breakers.route() == ["common", "force-fallback"]
+    assert breakers.states() == {}
+
+
+def test_route_skips_open_modes_and_fails_fast_when_all_open(clock):
+    breakers = CircuitBreakers(POLICY, auto_modes=["common", "bright-data"], clock=clock)
+    _trip(breakers.breaker("common"))
+    assert breakers.route() == ["bright-data"]
+    clock.now += 5
+    _trip(breakers.breaker("bright-data"))
+    with pytest.raises(CircuitOpenError) as info:
+        breakers.route()
+    assert info.value.retry_after == 5
+    assert breakers.states() == {"common": "open", "bright-data": "open"}
+
+
+def test_default_auto_modes_follow_configured_keys(monkeypatch):
+    monkeypatch.delenv("BRIGHT_DATA_API_KEY", raising=False)
+    monkeypatch.setenv("BROWSERLESS_API_KEY", "key")
+    assert CircuitBreakers().route() == ["common", "browserless", "force-fallback"]
+
+
+def test_only_mode_health_errors_count():
+    assert is_fetch_failure(FetchError(429)) and is_fetch_failure(FetchError(503))
+    assert is_fetch_failure(RuntimeError("connection reset")) and is_fetch_failure(TimeoutError())
+    assert not is_fetch_failure(FetchError(404))
+    assert not is_fetch_failure(ValueError("BRIGHT_DATA_API_KEY environment variable is required"))
+    assert not is_fetch_failure(TypeError())
+    assert is_page_failure(RuntimeError("No flights found"))
+    assert not is_page_failure(GoogleFlightsErrorResponse(sha256="x", byte_count=1, char_count=1))
+
+
+def test_unparseable_pages_open_the_breaker(monkeypatch, no_retry):
+    fetches = []
+
+    def consent_page(params, proxy=None):
+        fetches.append(1)
+        return CachedResponse("<html><body>Before you continue to Google</body></html>")
+
+    monkeypatch.setattr(core, "fetch", consent_page)
+    monkeypatch.setattr(circuit_breaker, "_circuit_breakers", CircuitBreakers(POLICY))
+
+    for data_source in ("js", "html", "js", "html"):
+        with pytest.raises(Exception) as info:
+            core.get_flights_from_tfs("tfs", data_source=data_source)
+        assert not isinstance(info.value, CircuitOpenError)
+    with pytest.raises(CircuitOpenError):
+        core.get_flights_from_tfs("tfs", data_source='js')
+    assert len(fetches) == 4
+
+
+def test_errors_unrelated_to_mode_health_do_not_open(monkeypatch, no_retry):
+    def not_found(params, proxy=None):
+        raise FetchError(404)
+
+    monkeypatch.delenv("BRIGHT_DATA_API_KEY", raising=False)
+    monkeypatch.setattr(core, "fetch", not_found)
+    monkeypatch.setattr(circuit_breaker, "_circuit_breakers", CircuitBreakers(POLICY))
+
+    for _ in range(6):
+        with pytest.raises(FetchError):
+            core.get_flights_from_tfs("tfs", data_source='js')
+        with pytest.raises(ValueError):
+            core.get_flights_from_tfs("tfs", mode="bright-data", data_source='js')
+    assert circuit_breaker.get_circuit_breakers().states() == {"common": "closed", "bright-data": "closed"}
+
+
+def test_fallback_mode_skips_open_common_path(monkeypatch, no_retry):
+    from fast_flights import fallback_playwright as fallback
+
+    page = js_page(synthetic_root(best=1, other=1, seed=1))
+    fetches = []
+
+    def failing_fetch(params, proxy=None):
+        fetches.append(1)
+        raise FetchError(429)
+
+    monkeypatch.setattr(core, "fetch", failing_fetch)
+    monkeypatch.setattr(fallback, "fallback_playwright_fetch", lambda params: CachedResponse(page))
+    monkeypatch.setattr(circuit_breaker, "_circuit_breakers", CircuitBreakers(POLICY))
+
+    for _ in range(6):
+        assert core.get_flights_from_tfs("tfs", mode="fallback", data_source='js') is not None
+    # The breaker opened after min_requests failures; later searches skip fetch().
+    assert len(fetches) == 4
+    assert circuit_breaker.get_circuit_breakers().states()["common"] == "open"
+
+
+def test_explicit_mode_fails_fast_when_open(monkeypatch, no_retry):
+    calls = []
+
+    def failing_browserless(params):
+        calls.append(1)
+        raise RuntimeError("service unavailable")
+
+    monkeypatch.setattr(core, "browserless_fetch", failing_browserless)
+    monkeypatch.setattr(circuit_breaker, "_circuit_breakers", CircuitBreakers(POLICY))
+
+    for _ in range(4):
+        with pytest.raises(RuntimeError):
+            core.get_flights_from_tfs("tfs", mode="browserless", data_source='js')
+    with pytest.raises(CircuitOpenError):
+        core.get_flights_from_tfs("tfs", mode="browserless", data_source='js')
+    assert len(calls) == 4
+
+
+def test_auto_mode_moves_on_from_failing_and_unparseable_modes(monkeypatch, no_retry):
+    page = js_page(synthetic_root(best=1, other=1, seed=1))
+    used = []
+
+    def failing_fetch(params, proxy=None):
+        used.append("common")
+        raise FetchError(503)
+
+    def unparseable_bright_data(params):
+        used.append("bright-data")
+        return CachedResponse("<html></html>")
+
+    def browserless(params):
+        used.append("browserless")
+        return CachedResponse(page)
+
+    monkeypatch.setattr(core, "fetch", failing_fetch)
+    monkeypatch.setattr(core, "bright_data_fetch", unparseable_bright_data)
+    monkeypatch.setattr(core, "browserless_fetch", browserless)
+    monkeypatch.setattr(
+        circuit_breaker,
+        "_circuit_breakers",
+        CircuitBreakers(POLICY, auto_modes=["common", "bright-data", "browserless"]),
+    )
+
+    assert core.get_flights_from_tfs("tfs", mode="auto", data_source='js') is not None
+    assert used == ["common", "bright-data", "browserless"]
+    breakers = circuit_breaker.get_circuit_breakers()
+    assert [list(breakers.breaker(m)._outcomes) for m in used] == [[False], [False], [True]]
+
+
+def test_auto_mode_async_prefers_cheapest_healthy_mode(monkeypatch, no_retry):
+    page = js_page(synthetic_root(best=1, other=1, seed=1))
+    breakers = CircuitBreakers(POLICY, auto_modes=["common", "browserless"])
+    _trip(breakers.breaker("common"))
+    used = []
+
+    async def browserless(params):
+        used.append("browserless")
+        return CachedResponse(page)
+
+    monkeypatch.setattr(core, "fetch", lambda params, proxy=None: pytest.fail("open mode used"))
+    monkeypatch.setattr(core, "browserless_fetch_async", browserless)
+    monkeypatch.setattr(circuit_breaker, "_circuit_breakers", breakers)
+
+    result = asyncio.run(core.get_flights_from_tfs_async("tfs", mode="auto", data_source='js'))
+    assert result is not None and used == ["browserless"]
@@ -0,0 +1,70 @@
+"""Compiled decoders must produce exactly what the generic DecoderKey walk does."""
+
+import pytest
+
+from fast_flights.decoder import (
+    CodeshareDecoder,
+    Decoder,
+    DecoderKey,
+    FlightDecoder,
+    ItineraryDecoder,
+    LayoverDecoder,
+    NLData,
+    ResultDecoder,
+    _decode_el_generic,
+)
+
+from _helpers import METADATA_ENTRY_WITH_INNER_LIST, WARNING_ENTRY, minimal_itinerary, synthetic_root
+
+
+def _itineraries():
+    root = synthetic_root(best=3, other=40, seed=7)
+    return root[2][0] + root[3][0] + [minimal_itinerary(), minimal_itinerary(layovers=None)]
+
+
+def test_every_decoder_is_compiled():
+    for cls in (CodeshareDecoder, FlightDecoder, LayoverDecoder, ItineraryDecoder, ResultDecoder):
+        assert cls._decode_raw is not None
+
+
+@pytest.mark.parametrize("el", _itineraries())
+def test_itinerary_output_matches_generic(el):
+    assert ItineraryDecoder.decode_el(el) == _decode_el_generic(ItineraryDecoder, NLData(el))
+    flights = el[0][2]
+    for flight in flights:
+        assert FlightDecoder.decode_el(flight) == _decode_el_generic(FlightDecoder, NLData(flight))
+        for codeshare in flight[15]:
+            assert CodeshareDecoder.decode_el(codeshare) == _decode_el_generic(CodeshareDecoder, NLData(codeshare))
+    for layover in el[0][13] or []:
+        assert LayoverDecoder.decode_el(layover) == _decode_el_generic(LayoverDecoder, NLData(layover))
+
+
+@pytest.mark.parametrize("return_page", [False, True])
+def test_result_output_matches_generic(return_page):
+    root = synthetic_root(best=2, other=10, seed=3, return_page=return_page)
+    assert ResultDecoder.decode_el(root) == _decode_el_generic(ResultDecoder, NLData(root))
+
+
+@pytest.mark.parametrize("el", [WARNING_ENTRY, METADATA_ENTRY_WITH_INNER_LIST, [[None]], [], [[]]])
+def test_malformed_entries_raise_the_same_error(el):
+    with pytest.raises(Exception) as generic:
+        _decode_el_generic(ItineraryDecoder, NLData(el))
+    with pytest.raises(Exception) as compiled:
+        ItineraryDecoder.decode_el(el)
+
+    assert type(compiled.value) is type(generic.value)
+    assert str(compiled.value) == str(generic.value)
+
+
+def test_none_element_decodes_to_none_fields():
+    assert LayoverDecoder.decode_el(None) == _decode_el_generic(LayoverDecoder, NLData(None))
+
+
+def test_subclass_defined_later_is_compiled():
+    class PairDecoder(Decoder):
+        FIRST: DecoderKey[int] = DecoderKey([0, 0])
+        SECOND: DecoderKey[int] = DecoderKey([0, 1])
+
+    assert PairDecoder._decode_raw is not None
+    assert PairDecoder.decode_el([[1, 2]]) == {"first": 1, "second": 2}
+    assert PairDecoder.decode_el(NLData([[1, 2]])) == {"first": 1, "second": 2}
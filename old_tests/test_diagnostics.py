@@ -0,0 +1,130 @@
+"""Tests for rate-limited diagnostics and error payload sinks."""
+
+import hashlib
+import json
+import logging
+import os
+
+import pytest
+
+from fast_flights import core, diagnostics
+from fast_flights.cache import CachedResponse
+from fast_flights.decoder import ItineraryDecoder
+from fast_flights.diagnostics import (
+    CallbackPayloadSink,
+    FilePayloadSink,
+    LazyPreview,
+    RateLimitedFilter,
+    flush_error_payloads,
+)
+from fast_flights.exceptions import GoogleFlightsErrorResponse
+
+from _helpers import js_page
+
+ERROR_PAYLOAD = json.dumps(
+    ["type.googleapis.com/travel.frontend.flights.ErrorResponse", [[None, 0, "x"], 0]],
+    separators=(",", ":"),
+)
+
+
+def _error_page() -> CachedResponse:
+    return CachedResponse(js_page(json.loads(ERROR_PAYLOAD)))
+
+
+def _record(msg="m %s", args=("a",), event=None):
+    record = logging.LogRecord("fast_flights", logging.WARNING, __file__, 1, msg, args, None)
+    if event is not None:
+        record.event = event
+    return record
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_rate_limit_per_event_and_suppressed_count():
+    clock = _Clock()
+    limiter = RateLimitedFilter(burst=2, interval=10, clock=clock)
+
+    assert [limiter.filter(_record(event="a")) for _ in range(5)] == [True, True, False, False, False]
+    assert limiter.filter(_record(event="b"))
+
+    clock.now = 10
+    record = _record(event="a")
+    assert limiter.filter(record)
+    assert record.suppressed == 3
+    assert record.getMessage() == "m a (3 similar messages suppressed)"
+
+
+def test_sample_rate_lets_some_records_through(monkeypatch):
+    limiter = RateLimitedFilter(burst=0, sample_rate=0.5)
+    monkeypatch.setattr(diagnostics.random, "random", iter([0.9, 0.1]).__next__)
+    assert not limiter.filter(_record())
+    assert limiter.filter(_record())
+
+
+def test_preview_is_only_built_when_formatted():
+    class Entry:
+        calls = 0
+
+        def __repr__(self):
+            Entry.calls += 1
+            return "x" * 500
+
+    preview = LazyPreview(Entry())
+    assert Entry.calls == 0
+    assert str(preview) == "x" * 200 and Entry.calls == 1
+
+
+def test_skipped_entries_are_logged_with_fields(caplog):
+    caplog.set_level(logging.WARNING, logger="fast_flights")
+    diagnostics.configure_diagnostics(burst=2)
+    try:
+        _, _, unknowns = ItineraryDecoder.partition([["not", "an", "itinerary"]] * 4)
+    finally:
+        diagnostics.configure_diagnostics()
+
+    assert len(unknowns) == 4
+    records = [r for r in caplog.records if getattr(r, "event", None) == "itinerary_unrecognized"]
+    assert [r.index for r in records] == [0, 1]
+    assert records[0].reason == "unrecognized"
+    assert "'not', 'an', 'itinerary'" in records[0].getMessage()
+
+
+def test_file_sink_writes_in_background(monkeypatch, tmp_path):
+    monkeypatch.setattr(diagnostics, "_payload_sink", FilePayloadSink(str(tmp_path)))
+
+    with pytest.raises(GoogleFlightsErrorResponse) as exc_info:
+        core.parse_response(_error_page(), "js")
+    assert flush_error_payloads(5)
+
+    digest = hashlib.sha256(ERROR_PAYLOAD.encode()).hexdigest()
+    assert exc_info.value.sha256 == digest
+    assert str(tmp_path) in str(exc_info.value)
+    assert os.listdir(tmp_path) == [f"{digest}.json"]
+    assert (tmp_path / f"{digest}.json").read_text() == ERROR_PAYLOAD
+
+
+def test_callback_sink_failures_are_logged_not_raised(monkeypatch, caplog):
+    received = []
+
+    def callback(digest, payload):
+        received.append(payload)
+        raise OSError("disk full")
+
+    monkeypatch.setattr(diagnostics, "_payload_sink", CallbackPayloadSink(callback))
+    with pytest.raises(GoogleFlightsErrorResponse):
+        core.parse_response(_error_page(), "js")
+    assert flush_error_payloads(5)
+
+    assert received == [ERROR_PAYLOAD]
+    assert any(getattr(r, "event", None) == "error_payload_write_failed" for r in caplog.records)
+
+
+def test_default_sink_is_inline_stderr():
+    assert diagnostics.get_error_payload_sink().description == "stderr"
+    assert not diagnostics.get_error_payload_sink().background
@@ -0,0 +1,84 @@
+"""Tests for the DOM-free ds:1 extraction fast path in parse_response."""
+
+import json
+import re
+
+import pytest
+from selectolax.lexbor import LexborHTMLParser
+
+from fast_flights import core
+from fast_flights.core import _scan_ds1_data
+from fast_flights.cache import CachedResponse
+
+from _helpers import WARNING_ENTRY, js_page, minimal_itinerary, root_with
+
+
+def _regex_path(html: str) -> str:
+    script = LexborHTMLParser(html).css_first(r'script.ds\:1').text()
+    match = re.search(r'^.*?\{.*?data:(\[.*\]).*\}', script)
+    assert match
+    return match.group(1)
+
+
+_PAGES = [
+    js_page(root_with(best_entries=[minimal_itinerary()])),
+    js_page(root_with(best_entries=[WARNING_ENTRY, minimal_itinerary()], warnings_at_22=[WARNING_ENTRY])),
+    # Brackets and braces inside JSON strings.
+    js_page(["a]b", {"k": "}"}, [["[", "]"]], None]),
+    # Google's real wrapper: extra keys, a nonce and other scripts around it.
+    (
+        '<html><head><script nonce="x">var a = {data:[1]};</script></head><body>'
+        '<script class="ds:1" nonce="abc">AF_initDataCallback({key: \'ds:1\', hash: \'2\', '
+        'data:[null,[[1,"x"]],"]"], sideChannel: {}});</script>'
+        '<script class="ds:2">AF_initDataCallback({key: \'ds:2\', data:[2]});</script>'
+        "</body></html>"
+    ),
+]
+
+
+@pytest.mark.parametrize("html", _PAGES)
+def test_scanner_matches_regex_path(html):
+    assert _scan_ds1_data(html) == _regex_path(html)
+    json.loads(_scan_ds1_data(html))
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        "<html><body>no script here</body></html>",
+        '<div class="ds:1">{data:[1]}</div>',
+        '<script class="ds:1">AF_initDataCallback({key: \'ds:1\', data:\n[1]});</script>',
+        '<script class="ds:1">AF_initDataCallback({key: \'ds:1\', data: [1]});</script>',
+        '<script class="ds:1">AF_initDataCallback({key: \'ds:1\', data:[1,\n2]});</script>',
+    ],
+)
+def test_scanner_declines_unexpected_shapes(html):
+    assert _scan_ds1_data(html) is None
+
+
+def test_parse_response_skips_dom_on_fast_path(monkeypatch):
+    page = js_page(root_with(best_entries=[minimal_itinerary()]))
+
+    def no_dom(*_args, **_kwargs):
+        raise AssertionError("Lexbor should not be used when the scanner succeeds")
+
+    monkeypatch.setattr(core, "LexborHTMLParser", no_dom)
+
+    result = core.parse_response(CachedResponse(page), "js")
+
+    assert len(result.best) == 1
+
+
+def test_parse_response_falls_back_to_regex_path():
+    root = root_with(best_entries=[minimal_itinerary()])
+    payload = json.dumps(root, separators=(",", ":"))
+    page = (
+        "<html><body><script class='ds:1'>"
+        f"AF_initDataCallback({{key:'ds:1',data:{payload},sideChannel:{{}}}});"
+        "</script></body></html>"
+    )
+    assert _scan_ds1_data(page) is None
+
+    result = core.parse_response(CachedResponse(page), "js")
+
+    assert len(result.best) == 1
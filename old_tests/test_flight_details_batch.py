@@ -0,0 +1,146 @@
+"""Offline tests for batch flight-detail extraction on one browser page."""
+
+import asyncio
+import base64
+import threading
+
+import pytest
+
+from fast_flights import browserless_fetch, flights_pb2 as PB, readiness
+from fast_flights.browserless_fetch import FlightTarget, _flight_details_batch_on_page, _matches_flight
+
+RESULTS_URL = "https://www.google.com/travel/flights?tfs=search&hl=en"
+
+
+def _selected_url(segments):
+    query = PB.ReturnFlightQuery()
+    leg = query.legs.add()
+    for airline, number, origin, destination in segments:
+        sf = leg.selected_flight.add()
+        sf.airline, sf.flight_number = airline, number
+        sf.from_airport, sf.to_airport, sf.date = origin, destination, "2026-03-01"
+    tfs = base64.urlsafe_b64encode(query.SerializeToString()).decode().rstrip("=")
+    return f"https://www.google.com/travel/flights/booking?tfs={tfs}"
+
+
+class _Item:
+    def __init__(self, page, text, segments):
+        self.page, self.text, self.segments = page, text, segments
+
+    async def inner_text(self):
+        return self.text
+
+    async def scroll_into_view_if_needed(self):
+        pass
+
+    async def click(self):
+        self.page.clicks.append(self.text)
+        self.page.url = _selected_url(self.segments)
+
+
+class _Locator:
+    def __init__(self, items):
+        self.items = items
+
+    async def all(self):
+        return self.items
+
+
+class _Page:
+    def __init__(self, cards):
+        self.url = "about:blank"
+        self.items = [_Item(self, text, segments) for text, segments in cards]
+        self.gotos = 0
+        self.backs = 0
+        self.clicks = []
+
+    async def goto(self, url):
+        self.gotos += 1
+        self.url = url
+
+    async def go_back(self):
+        self.backs += 1
+        self.url = RESULTS_URL
+
+    async def wait_for_selector(self, selector, timeout=None):
+        pass
+
+    async def wait_for_timeout(self, ms):
+        await asyncio.sleep(0)
+
+    async def evaluate(self, script):
+        return [len(self.items), True]
+
+    def locator(self, selector):
+        return _Locator(self.items if selector == "li.pIav2d" else [])
+
+
+@pytest.fixture(autouse=True)
+def fast_readiness(monkeypatch):
+    monkeypatch.setattr(readiness, "_readiness_policy", readiness.ReadinessPolicy(poll_interval_ms=1))
+
+
+def test_batch_loads_page_once_and_resolves_every_target():
+    page = _Page([
+        ("Delta 8:05 AM – 11:30 AM $234", [("DL", "1203", "JFK", "ATL")]),
+        ("United 9:15 AM – 4:02 PM $312", [("UA", "88", "JFK", "ORD"), ("UA", "411", "ORD", "SFO")]),
+        ("JetBlue 1:00 PM – 4:20 PM $199", [("B6", "23", "JFK", "SFO")]),
+    ])
+    targets = [
+        FlightTarget("United", "9:15 AM", "$312"),
+        ("Alaska", "6:00 AM", "$150"),
+        FlightTarget("Delta", "8:05 AM", "$234"),
+    ]
+
+    results = asyncio.run(_flight_details_batch_on_page(page, RESULTS_URL, [FlightTarget(*t) for t in targets]))
+
+    assert page.gotos == 1
+    assert page.backs == 1
+    assert results[0]["flight_numbers"] == ["UA 88", "UA 411"]
+    assert results[0]["connecting_segments"][1]["to"] == "SFO"
+    assert results[1] is None
+    assert results[2]["flight_numbers"] == ["DL 1203"]
+
+
+def test_matches_flight_normalizes_time_and_price():
+    text = "Lufthansa, SunExpress\n8:05 PM\xa0– 2:10 PM+1\n$1,634"
+    assert _matches_flight(text, FlightTarget("Lufthansa+SunExpress", "2:10 PM", "$1,634"), False)
+    assert not _matches_flight(text, FlightTarget("Lufthansa", "2:10 PM", "$999"), False)
+    assert _matches_flight(text, FlightTarget("Lufthansa", "2:10 PM", "$999"), True)
+
+
+def test_empty_batch_skips_the_browser(monkeypatch):
+    monkeypatch.setenv("BROWSERLESS_API_KEY", "key")
+    monkeypatch.setattr(browserless_fetch, "get_browserless_pool", lambda api_key: pytest.fail("pool used"))
+    assert browserless_fetch.fetch_flight_details_batch({"tfs": "abc"}, []) == []
+
+
+def test_batch_requires_api_key(monkeypatch):
+    monkeypatch.delenv("BROWSERLESS_API_KEY", raising=False)
+    with pytest.raises(ValueError):
+        browserless_fetch.fetch_flight_details_batch({"tfs": "abc"}, [FlightTarget("Delta", "8:05 AM", "$1")])
+
+
+def test_sync_batch_runs_on_the_pool_inside_a_running_loop(monkeypatch):
+    page = _Page([("Delta 8:05 AM – 11:30 AM $234", [("DL", "1203", "JFK", "ATL")])])
+
+    class _Pool:
+        def run_sync(self, fn):
+            return asyncio.run_coroutine_threadsafe(fn(page), loop).result(timeout=5)
+
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("BROWSERLESS_API_KEY", "key")
+    monkeypatch.setattr(browserless_fetch, "get_browserless_pool", lambda api_key: _Pool())
+
+    async def main():
+        # asyncio.run() would refuse to start here; the pool's loop does the work.
+        return browserless_fetch.fetch_flight_details_batch({"tfs": "abc"}, [FlightTarget("Delta", "8:05 AM", "$234")])
+
+    try:
+        results = asyncio.run(main())
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+    assert results[0]["flight_numbers"] == ["DL 1203"]
@@ -0,0 +1,158 @@
+"""Tests for hedged fetches."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from fast_flights import core, hedging
+from fast_flights.cache import CachedResponse, MemoryCache
+from fast_flights.exceptions import FetchError
+from fast_flights.hedging import HedgePolicy, Hedger
+
+from _helpers import js_page, synthetic_root
+
+FAST = HedgePolicy(initial_delay=0.05, min_delay=0.0)
+
+
+def test_delay_uses_initial_then_percentile():
+    hedger = Hedger(HedgePolicy(percentile=90, min_samples=10, initial_delay=3.0, min_delay=0.1, max_delay=5.0))
+    assert hedger.delay() == 3.0
+    for latency in range(1, 11):
+        hedger.record(latency / 10)
+    assert hedger.delay() == pytest.approx(0.9)
+    for _ in range(10):
+        hedger.record(60.0)
+    assert hedger.delay() == 5.0
+
+
+def test_policy_rejects_hedging_a_mode_with_itself():
+    with pytest.raises(AssertionError):
+        HedgePolicy(primary="common", secondary="common")
+    with pytest.raises(AssertionError):
+        HedgePolicy(secondary="hedged")
+
+
+def test_fast_primary_never_starts_secondary():
+    hedger = Hedger(FAST)
+    assert hedger.run(lambda: "primary", lambda: pytest.fail("secondary started")) == "primary"
+    assert hedger.stats().hedged == 0
+    assert len(hedger._latencies) == 1
+
+
+def test_slow_primary_loses_to_secondary():
+    hedger = Hedger(FAST)
+    release = threading.Event()
+
+    def slow():
+        release.wait(5)
+        return "primary"
+
+    try:
+        assert hedger.run(slow, lambda: "secondary") == "secondary"
+    finally:
+        release.set()
+    stats = hedger.stats()
+    assert (stats.requests, stats.hedged, stats.secondary_wins) == (1, 1, 1)
+
+
+def test_stuck_losing_legs_do_not_delay_new_searches():
+    release = threading.Event()
+    safety = threading.Timer(5, release.set)
+    safety.start()
+    try:
+        eager = Hedger(HedgePolicy(initial_delay=0.0, min_delay=0.0))
+        for _ in range(40):
+            assert eager.run(lambda: release.wait(10) and "primary", lambda: "secondary") == "secondary"
+
+        hedger = Hedger(FAST)
+        start = time.monotonic()
+        assert hedger.run(lambda: "primary", lambda: pytest.fail("secondary started")) == "primary"
+        assert time.monotonic() - start < 1
+        assert hedger._latencies[0] < 0.05
+    finally:
+        release.set()
+        safety.cancel()
+
+
+def test_failed_primary_starts_secondary_without_waiting():
+    hedger = Hedger(HedgePolicy(initial_delay=10.0))
+
+    def failing():
+        raise FetchError(503)
+
+    started = time.monotonic()
+    assert hedger.run(failing, lambda: "secondary") == "secondary"
+    assert time.monotonic() - started < 5
+
+
+def test_both_failing_raises_primary_error():
+    hedger = Hedger(FAST)
+
+    def primary():
+        time.sleep(0.1)
+        raise FetchError(503, "primary")
+
+    def secondary():
+        raise ValueError("secondary")
+
+    with pytest.raises(FetchError, match="primary"):
+        hedger.run(primary, secondary)
+    assert hedger.stats().failures == 1
+
+
+def test_async_loser_is_cancelled():
+    hedger = Hedger(FAST)
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return "primary"
+
+    async def fast():
+        return "secondary"
+
+    async def main():
+        result = await hedger.run_async(slow, fast)
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(main()) == "secondary"
+    assert cancelled == [True]
+
+
+def test_hedged_mode_races_unparseable_primary(monkeypatch):
+    page = js_page(synthetic_root(best=1, other=1, seed=1))
+    monkeypatch.setattr(hedging, "_hedger", Hedger(HedgePolicy(secondary="browserless", initial_delay=10.0)))
+    # The primary answers, but with a page that has no results script.
+    monkeypatch.setattr(core, "fetch", lambda params, proxy=None: CachedResponse("<html></html>"))
+    monkeypatch.setattr(core, "browserless_fetch", lambda params: CachedResponse(page))
+    cache = MemoryCache()
+
+    result = core.get_flights_from_tfs("tfs", mode="hedged", data_source='js', cache=cache)
+    assert result is not None and result.best
+    assert cache.get(core.cache_key(core._build_params("tfs", "", "EgQIABABIgA"), "hedged")) == page
+
+
+def test_hedged_mode_async(monkeypatch):
+    page = js_page(synthetic_root(best=1, other=1, seed=1))
+    monkeypatch.setattr(hedging, "_hedger", Hedger(HedgePolicy(secondary="browserless", initial_delay=0.05, min_delay=0.0)))
+
+    def slow_fetch(params, proxy=None):
+        time.sleep(0.3)
+        return CachedResponse(page)
+
+    async def fast_browserless(params):
+        return CachedResponse(page)
+
+    monkeypatch.setattr(core, "fetch", slow_fetch)
+    monkeypatch.setattr(core, "browserless_fetch_async", fast_browserless)
+
+    result = asyncio.run(core.get_flights_from_tfs_async("tfs", mode="hedged", data_source='js'))
+    assert result is not None
+    assert hedging.get_hedger().stats().secondary_wins == 1
@@ -0,0 +1,47 @@
+"""Tests for the pluggable JSON backend used on the ds:1 payload."""
+
+import importlib
+import json
+
+import pytest
+
+from fast_flights import _json
+
+
+@pytest.fixture
+def restore_backend():
+    default = _json.backend
+    yield
+    _json.use_backend(default)
+
+
+@pytest.mark.parametrize("backend", _json.available_backends())
+def test_backends_decode_identically(backend, restore_backend):
+    payload = json.dumps([None, [[1783215731165430, "é", 1.5]], {"k": [True, False]}, ""])
+    _json.use_backend(backend)
+
+    assert _json.loads(payload) == json.loads(payload)
+
+
+@pytest.mark.parametrize("backend", _json.available_backends())
+def test_payload_rejected_by_fast_backend_falls_back_to_stdlib(backend, restore_backend):
+    _json.use_backend(backend)
+
+    assert _json.loads("[NaN]")[0] != _json.loads("[NaN]")[0]  # NaN, as json.loads returns
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        _json.use_backend("simdjson")
+
+
+def test_unavailable_env_backend_falls_back_to_stdlib(monkeypatch, caplog):
+    monkeypatch.setenv("FAST_FLIGHTS_JSON_BACKEND", "simdjson")
+    try:
+        importlib.reload(_json)
+        assert _json.backend == "json"
+        assert _json.loads("[1]") == [1]
+        assert any(getattr(r, "event", None) == "json_backend_unavailable" for r in caplog.records)
+    finally:
+        monkeypatch.delenv("FAST_FLIGHTS_JSON_BACKEND")
+        importlib.reload(_json)
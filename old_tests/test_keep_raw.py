@@ -0,0 +1,62 @@
+"""DecodedResult.raw retention: kept, dropped, or re-parsed lazily."""
+
+import json
+
+from fast_flights import core
+from fast_flights.cache import CachedResponse
+from fast_flights.core import parse_response
+from fast_flights.decoder import ResultDecoder
+
+from _helpers import js_page, synthetic_root
+
+
+def _page(root):
+    return CachedResponse(js_page(root))
+
+
+def test_default_keeps_parsed_tree():
+    root = synthetic_root(best=1, other=3, seed=1)
+    result = parse_response(_page(root), 'js')
+    assert result.raw == root
+    assert result.raw_json is None
+
+
+def test_keep_raw_false_drops_tree():
+    root = synthetic_root(best=1, other=3, seed=1)
+    result = parse_response(_page(root), 'js', keep_raw=False)
+    assert result.raw is None
+    assert result.raw_json is None
+    assert len(result.best) == 1 and len(result.other) == 3
+
+
+def test_lazy_reparses_on_first_access():
+    root = synthetic_root(best=1, other=3, seed=1)
+    result = parse_response(_page(root), 'js', keep_raw='lazy')
+    assert 'raw' not in result.__dict__
+    assert isinstance(result.raw_json, str)
+
+    raw = result.raw
+    assert raw == root
+    assert result.raw is raw
+    assert result.raw_json is None
+
+
+def test_lazy_stores_non_ascii_payload_as_utf8():
+    root = synthetic_root(best=1, other=0, seed=1)
+    root[0] = "Zürich – São Paulo"
+    text = json.dumps(root, ensure_ascii=False)
+    result = ResultDecoder.decode(json.loads(text), keep_raw='lazy', raw_json=text)
+    assert result.raw_json == text.encode('utf-8')
+    assert result.raw == root
+
+
+def test_lazy_result_equals_eager_result():
+    root = synthetic_root(best=2, other=5, seed=4)
+    assert parse_response(_page(root), 'js', keep_raw='lazy') == parse_response(_page(root), 'js')
+
+
+def test_keep_raw_threads_through_get_flights_from_tfs(monkeypatch):
+    page = js_page(synthetic_root(best=1, other=1, seed=2))
+    monkeypatch.setattr(core, "fetch", lambda params, proxy=None: CachedResponse(page))
+    result = core.get_flights_from_tfs("tfs", data_source='js', keep_raw=False)
+    assert result.raw is None
@@ -0,0 +1,172 @@
+"""Tests for proxy rotation and health tracking."""
+
+import asyncio
+import threading
+
+import pytest
+
+from fast_flights import core, rate_limit, retry
+from fast_flights.cache import CachedResponse
+from fast_flights.exceptions import FetchError
+from fast_flights.proxy_pool import ProxyPool
+from fast_flights.rate_limit import RateLimiter
+from fast_flights.session_pool import SessionPool
+
+from _helpers import js_page, synthetic_root
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_rotates_round_robin():
+    pool = ProxyPool(["http://p1", "http://p2", "http://p3", "http://p1"])
+    assert pool.proxies == ("http://p1", "http://p2", "http://p3")
+    assert [pool.choose() for _ in range(6)] == ["http://p1", "http://p2", "http://p3"] * 2
+
+
+def test_consecutive_failures_eject_until_cooldown():
+    clock = _Clock()
+    pool = ProxyPool(["http://p1", "http://p2"], max_failures=2, cooldown=10, clock=clock)
+
+    pool.record("http://p1", ok=False)
+    pool.record("http://p1", ok=True)
+    pool.record("http://p1", ok=False)
+    assert pool.healthy() == ["http://p1", "http://p2"]
+
+    pool.record("http://p1", ok=False)
+    assert pool.healthy() == ["http://p2"]
+    assert {pool.choose() for _ in range(4)} == {"http://p2"}
+
+    clock.now += 10
+    assert pool.healthy() == ["http://p1", "http://p2"]
+
+    stats = pool.stats()["http://p1"]
+    assert (stats.requests, stats.failures, stats.ejections) == (4, 3, 1)
+    assert stats.success_rate == pytest.approx(0.25)
+
+
+def test_cooldown_doubles_on_repeated_ejection():
+    clock = _Clock()
+    pool = ProxyPool(["http://p1"], max_failures=1, cooldown=10, max_cooldown=15, clock=clock)
+    pool.record("http://p1", ok=False)
+    assert pool.stats()["http://p1"].ejected_until == 110
+    clock.now = 110
+    pool.record("http://p1", ok=False)
+    assert pool.stats()["http://p1"].ejected_until == 125
+
+
+def test_all_ejected_uses_the_one_due_back_first():
+    clock = _Clock()
+    pool = ProxyPool(["http://p1", "http://p2"], max_failures=1, cooldown=10, clock=clock)
+    pool.record("http://p2", ok=False)
+    clock.now += 1
+    pool.record("http://p1", ok=False)
+    assert pool.healthy() == []
+    assert pool.choose() == "http://p2"
+
+
+def test_latency_is_a_moving_average():
+    pool = ProxyPool(["http://p1"], latency_weight=0.5)
+    pool.record("http://p1", ok=True, latency=1.0)
+    pool.record("http://p1", ok=True, latency=3.0)
+    assert pool.stats()["http://p1"].latency == pytest.approx(2.0)
+
+
+def test_track_only_blames_proxy_for_proxy_failures():
+    pool = ProxyPool(["http://p1"])
+    for exc in (FetchError(404), ValueError("bad")):
+        with pytest.raises(type(exc)):
+            with pool.track("http://p1"):
+                raise exc
+    assert pool.stats()["http://p1"].requests == 0
+
+    for exc in (FetchError(429), FetchError(502), RuntimeError("client error (Connect)")):
+        with pytest.raises(type(exc)):
+            with pool.track("http://p1"):
+                raise exc
+    with pool.track("http://p1"):
+        pass
+    assert (pool.stats()["http://p1"].requests, pool.stats()["http://p1"].failures) == (4, 3)
+
+
+def test_choose_is_thread_safe():
+    pool = ProxyPool([f"http://p{i}" for i in range(4)])
+    seen = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(250):
+            proxy = pool.choose()
+            with lock:
+                seen.append(proxy)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert {p: seen.count(p) for p in set(seen)} == {f"http://p{i}": 250 for i in range(4)}
+
+
+def test_search_rotates_proxies_and_retries_on_another(monkeypatch):
+    page = js_page(synthetic_root(best=1, other=1, seed=1))
+    used = []
+
+    def fake_fetch(params, proxy=None):
+        used.append(proxy)
+        if proxy == "http://bad":
+            raise FetchError(429)
+        return CachedResponse(page)
+
+    monkeypatch.setattr(core, "fetch", fake_fetch)
+    monkeypatch.setattr(retry, "_retry_policy", retry.RetryPolicy())
+    monkeypatch.setattr(retry.time, "sleep", lambda s: None)
+    monkeypatch.setattr(rate_limit, "_rate_limiter", RateLimiter())
+    pool = ProxyPool(["http://bad", "http://good"])
+
+    for _ in range(2):
+        assert core.get_flights_from_tfs("tfs", data_source='js', proxy=pool) is not None
+    assert used == ["http://bad", "http://good", "http://bad", "http://good"]
+    assert pool.stats()["http://bad"].failures == 2
+    assert pool.stats()["http://good"].failures == 0
+    assert {key[1] for key in rate_limit.get_rate_limiter().stats()} == {"http://bad", "http://good"}
+
+
+def test_async_search_rotates_proxies(monkeypatch):
+    page = js_page(synthetic_root(best=1, other=1, seed=1))
+    used = []
+
+    def fake_fetch(params, proxy=None):
+        used.append(proxy)
+        return CachedResponse(page)
+
+    monkeypatch.setattr(core, "fetch", fake_fetch)
+    pool = ProxyPool(["http://p1", "http://p2"])
+
+    async def main():
+        for _ in range(2):
+            await core.get_flights_from_tfs_async("tfs", data_source='js', proxy=pool)
+
+    asyncio.run(main())
+    assert used == ["http://p1", "http://p2"]
+    assert pool.stats()["http://p2"].requests == 1
+
+
+def test_each_proxy_reuses_its_own_session():
+    created = []
+
+    def factory(**kwargs):
+        created.append(kwargs.get("proxy"))
+        return object()
+
+    sessions = SessionPool(client_factory=factory)
+    pool = ProxyPool(["http://p1", "http://p2"])
+    for _ in range(4):
+        with sessions.session(proxy=pool.choose()):
+            pass
+    assert created == ["http://p1", "http://p2"]
@@ -0,0 +1,98 @@
+"""Tests for the token-bucket rate limiter."""
+
+import asyncio
+
+import pytest
+
+from fast_flights import core, rate_limit
+from fast_flights.cache import CachedResponse
+from fast_flights.rate_limit import RateLimit, RateLimiter, TokenBucket
+
+from _helpers import js_page, synthetic_root
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_bucket_allows_burst_then_spaces_requests():
+    clock = _Clock()
+    bucket = TokenBucket(RateLimit(rate=2.0, burst=3), clock=clock)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_bucket_refills_over_time_up_to_burst():
+    clock = _Clock()
+    bucket = TokenBucket(RateLimit(rate=1.0, burst=2), clock=clock)
+    bucket.reserve(), bucket.reserve()
+    clock.now += 10
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, pytest.approx(1.0)]
+
+
+def test_unconfigured_limiter_never_waits():
+    limiter = RateLimiter()
+    assert all(limiter.acquire("common", "http://p1") == 0.0 for _ in range(100))
+    assert limiter.stats()[("common", "http://p1")].requests == 100
+
+
+def test_buckets_are_per_mode_and_per_proxy(monkeypatch):
+    slept = []
+    monkeypatch.setattr(rate_limit.time, "sleep", slept.append)
+    limiter = RateLimiter({"common": RateLimit(rate=1.0)})
+
+    limiter.acquire("common", "http://p1")
+    limiter.acquire("common", "http://p2")
+    limiter.acquire("bright-data")
+    assert slept == []
+
+    limiter.acquire("common", "http://p1")
+    assert len(slept) == 1 and slept[0] > 0.9
+
+    stats = limiter.stats()[("common", "http://p1")]
+    assert (stats.requests, stats.waited) == (2, 1)
+    assert stats.max_wait == pytest.approx(slept[0])
+
+
+def test_shared_bucket_when_not_per_proxy(monkeypatch):
+    monkeypatch.setattr(rate_limit.time, "sleep", lambda s: None)
+    limiter = RateLimiter(default=RateLimit(rate=1.0), per_proxy=False)
+    limiter.acquire("local", "http://p1")
+    assert limiter.acquire("local", "http://p2") > 0
+    assert list(limiter.stats()) == [("local", None)]
+
+
+def test_async_acquire_waits_without_blocking():
+    limiter = RateLimiter({"browserless": RateLimit(rate=50.0)})
+
+    async def main():
+        return await asyncio.gather(*(limiter.acquire_async("browserless") for _ in range(3)))
+
+    waits = asyncio.run(main())
+    assert waits[0] == 0.0
+    assert waits[2] == pytest.approx(0.04, abs=0.01)
+
+
+def test_search_consults_limiter_before_fetching(monkeypatch):
+    calls = []
+    page = js_page(synthetic_root(best=1, other=1, seed=1))
+
+    class _Limiter(RateLimiter):
+        def acquire(self, mode, proxy=None):
+            calls.append(("acquire", mode, proxy))
+            return 0.0
+
+    def fake_fetch(params, proxy=None):
+        calls.append(("fetch",))
+        return CachedResponse(page)
+
+    monkeypatch.setattr(rate_limit, "_rate_limiter", _Limiter())
+    monkeypatch.setattr(core, "fetch", fake_fetch)
+
+    core.get_flights_from_tfs("tfs", data_source='js', proxy="http://p1")
+    assert calls == [("acquire", "common", "http://p1"), ("fetch",)]
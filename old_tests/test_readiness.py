@@ -0,0 +1,111 @@
+"""Tests for the Playwright readiness policy, using a scripted fake page."""
+
+import asyncio
+
+from fast_flights.readiness import ReadinessPolicy, expand_results
+
+
+class _Page:
+    """Replays ``rows`` (one value per probe, the last one repeating)."""
+
+    def __init__(self, rows, ds1=True, url="https://www.google.com/travel/flights?tfs=a"):
+        self.rows = list(rows)
+        self.ds1 = ds1
+        self.url = url
+        self.probes = 0
+        self.sleeps = []
+        self.load_states = []
+
+    async def evaluate(self, script):
+        value = self.rows[min(self.probes, len(self.rows) - 1)]
+        self.probes += 1
+        return [value, self.ds1]
+
+    async def wait_for_timeout(self, ms):
+        self.sleeps.append(ms)
+        await asyncio.sleep(0)
+
+    async def wait_for_load_state(self, state, timeout=None):
+        self.load_states.append(state)
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_settle_returns_once_rows_are_stable():
+    page = _Page([3, 10, 14, 14, 14])
+    assert _run(ReadinessPolicy(poll_interval_ms=1).settle(page)) is True
+    assert page.probes == 5
+    assert sum(page.sleeps) < 10
+
+
+def test_settle_gives_up_at_deadline():
+    page = _Page(list(range(10_000)))
+    policy = ReadinessPolicy(deadline_ms=30, poll_interval_ms=1)
+    assert _run(policy.settle(page)) is False
+
+
+def test_settle_waits_for_ds1_when_required():
+    page = _Page([5], ds1=False)
+    policy = ReadinessPolicy(deadline_ms=30, poll_interval_ms=1)
+    assert _run(policy.settle(page, require_ds1=True)) is False
+    assert _run(policy.settle(_Page([5]), require_ds1=True)) is True
+
+
+def test_network_idle_is_opt_in():
+    page = _Page([2, 2, 2])
+    _run(ReadinessPolicy(poll_interval_ms=1).settle(page))
+    assert page.load_states == []
+    _run(ReadinessPolicy(poll_interval_ms=1, network_idle=True).settle(page))
+    assert page.load_states == ["networkidle"]
+
+
+def test_after_click_waits_for_new_rows_then_stability():
+    page = _Page([10, 10, 25, 30, 30, 30])
+    assert _run(ReadinessPolicy(poll_interval_ms=1).after_click(page, 10)) is True
+    assert page.probes == 6
+
+
+def test_after_select_waits_for_url_change():
+    page = _Page([0])
+    policy = ReadinessPolicy(click_deadline_ms=30, poll_interval_ms=1)
+    assert _run(policy.after_select(page, page.url)) is False
+    page.url += "&selected=1"
+    assert _run(policy.after_select(page, "https://www.google.com/travel/flights?tfs=a")) is True
+
+
+def test_fixed_delays_reproduce_legacy_sleeps():
+    page = _Page([0])
+    policy = ReadinessPolicy.fixed_delays()
+    _run(policy.settle(page))
+    _run(policy.after_click(page, 0))
+    assert page.sleeps == [5000, 2000]
+    assert page.probes == 0
+
+
+def test_expand_results_clicks_every_button():
+    clicked = []
+
+    class _Button:
+        def __init__(self, page, n, grow):
+            self.page, self.n, self.grow = page, n, grow
+
+        async def click(self):
+            clicked.append(self.n)
+            self.page.rows = [self.page.rows[-1] + self.grow]
+
+    class _Locator:
+        def __init__(self, buttons):
+            self.buttons = buttons
+
+        async def all(self):
+            return self.buttons
+
+    page = _Page([10])
+    buttons = [_Button(page, 0, 5), _Button(page, 1, 7)]
+    page.locator = lambda selector: _Locator(buttons)
+
+    _run(expand_results(page, ReadinessPolicy(poll_interval_ms=1)))
+    assert clicked == [0, 1]
+    assert page.rows == [22]
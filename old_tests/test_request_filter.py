@@ -0,0 +1,74 @@
+"""Tests for the browser request filter."""
+
+import asyncio
+
+import pytest
+
+from fast_flights import request_filter
+from fast_flights.request_filter import RequestFilter
+
+
+@pytest.mark.parametrize(
+    "resource_type,url,allowed",
+    [
+        ("document", "https://www.google.com/travel/flights?tfs=abc", True),
+        ("script", "https://www.gstatic.com/_/mss/boq-travel/_/js/k=boq.js", True),
+        ("xhr", "https://www.google.com/_/FlightsFrontendUi/data/batchexecute", True),
+        ("stylesheet", "https://www.gstatic.com/_/mss/boq-travel/_/ss/k=boq.css", True),
+        ("image", "https://www.gstatic.com/flights/airline_logos/70px/UA.png", False),
+        ("font", "https://fonts.gstatic.com/s/googlesans/v58/font.woff2", False),
+        ("media", "https://www.google.com/video.mp4", False),
+        ("ping", "https://www.google.com/gen_204?atyp=i", False),
+        ("xhr", "https://play.google.com/log?format=json", False),
+        ("script", "https://www.googletagmanager.com/gtag/js", False),
+        ("xhr", "https://maps.googleapis.com/maps/vt?pb=tile", False),
+    ],
+)
+def test_default_allowlist(resource_type, url, allowed):
+    assert RequestFilter().allows(resource_type, url) is allowed
+
+
+class _Request:
+    def __init__(self, resource_type, url):
+        self.resource_type = resource_type
+        self.url = url
+
+
+class _Route:
+    def __init__(self, resource_type, url):
+        self.request = _Request(resource_type, url)
+        self.outcome = None
+
+    async def continue_(self):
+        self.outcome = "continue"
+
+    async def abort(self):
+        self.outcome = "abort"
+
+
+class _Target:
+    def __init__(self):
+        self.routes = []
+
+    async def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+
+
+def test_install_routes_every_request():
+    target = _Target()
+    asyncio.run(RequestFilter().install(target))
+    [(pattern, handler)] = target.routes
+    assert pattern == "**/*"
+
+    allowed, blocked = _Route("document", "https://www.google.com/"), _Route("image", "https://x/logo.png")
+    asyncio.run(handler(allowed))
+    asyncio.run(handler(blocked))
+    assert (allowed.outcome, blocked.outcome) == ("continue", "abort")
+
+
+def test_configure_request_filter_can_disable(monkeypatch):
+    monkeypatch.setattr(request_filter, "_request_filter", request_filter.get_request_filter())
+    assert request_filter.configure_request_filter(None) is None
+    assert request_filter.get_request_filter() is None
+    custom = RequestFilter(allowed_types=frozenset({"document"}))
+    assert request_filter.configure_request_filter(custom) is custom
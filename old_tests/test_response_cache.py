@@ -0,0 +1,99 @@
+"""Tests for the response body caches."""
+
+from fast_flights import MemoryCache, SQLiteCache, core, get_flights_from_tfs
+from fast_flights import cache as cache_module
+from fast_flights.cache import CachedResponse, cache_key
+
+from _helpers import js_page, minimal_itinerary, root_with
+
+
+def _params(tfs: str = "CBwQAhoeEgo", curr: str = "") -> dict:
+    return {"tfs": tfs, "hl": "en", "gl": "US", "tfu": "EgQIABABIgA", "curr": curr}
+
+
+def test_cache_key_is_canonical():
+    assert cache_key(_params("ab+/cd=="), "common") == cache_key(_params("ab-_cd"), "common")
+    assert cache_key(_params(), "common") == cache_key(dict(reversed(list(_params().items()))), "common")
+    assert cache_key(_params(), "common") != cache_key(_params(curr="EUR"), "common")
+    assert cache_key(_params(), "common") != cache_key(_params(), "local")
+
+
+def test_memory_cache_lru_eviction():
+    cache = MemoryCache(max_size=2)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    assert cache.get("a") == "A"  # "b" is now least recently used
+    cache.set("c", "C")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+
+
+def test_memory_cache_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = MemoryCache(ttl=10)
+    cache.set("a", "A")
+
+    now[0] += 5
+    assert cache.get("a") == "A"
+    now[0] += 6
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_sqlite_cache_lru_and_ttl(tmp_path, monkeypatch):
+    now = [1_000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    path = str(tmp_path / "responses.sqlite")
+    cache = SQLiteCache(path, ttl=60, max_size=2)
+    cache.set("a", "A")
+    now[0] += 1
+    cache.set("b", "B")
+    now[0] += 1
+    assert cache.get("a") == "A"
+    now[0] += 1
+    cache.set("c", "C")
+
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    # Entries survive reopening the database.
+    cache.close()
+    reopened = SQLiteCache(path, ttl=60, max_size=2)
+    assert reopened.get("c") == "C"
+    now[0] += 61
+    assert reopened.get("c") is None
+
+
+def test_cache_hit_skips_fetch_but_still_parses(monkeypatch):
+    page = js_page(root_with(best_entries=[minimal_itinerary()]))
+    calls = []
+
+    def fake_fetch(params, proxy=None):
+        calls.append(params)
+        return CachedResponse(page)
+
+    monkeypatch.setattr(core, "fetch", fake_fetch)
+    cache = MemoryCache()
+
+    first = get_flights_from_tfs("AAA", data_source="js", cache=cache)
+    second = get_flights_from_tfs("AAA", data_source="js", cache=cache, tfu="EgQIABABIgA")
+    third = get_flights_from_tfs("AAA", "EUR", data_source="js", cache=cache)
+
+    assert len(calls) == 2
+    assert len(first.best) == len(second.best) == len(third.best) == 1
+    assert first.best[0] is not second.best[0]
+
+
+def test_unparseable_body_is_not_cached(monkeypatch):
+    monkeypatch.setattr(core, "fetch", lambda params, proxy=None: CachedResponse("<html></html>"))
+    cache = MemoryCache()
+
+    try:
+        get_flights_from_tfs("AAA", cache=cache)
+    except RuntimeError:
+        pass
+
+    assert len(cache) == 0
@@ -0,0 +1,52 @@
+"""Decoded results use slotted models and share repeated airport / airline strings."""
+
+import json
+import sys
+
+import pytest
+
+from fast_flights import schema
+from fast_flights.decoder import Codeshare, Flight, Itinerary, Layover, ResultDecoder
+from fast_flights.flights_impl import ItinerarySummary
+
+from _helpers import synthetic_root
+
+
+def _decode(root):
+    # Round-trip through JSON so every string is a fresh object, as it is
+    # when decoded from a real response.
+    return ResultDecoder.decode(json.loads(json.dumps(root)))
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+@pytest.mark.parametrize("cls", [Codeshare, Flight, Layover, Itinerary, ItinerarySummary, schema.Flight])
+def test_models_are_slotted(cls):
+    assert "__slots__" in cls.__dict__
+    assert "__dict__" not in cls.__dict__
+
+
+def test_repeated_strings_are_shared():
+    result = _decode(synthetic_root(best=2, other=20, seed=3))
+    seen = {}
+
+    def check(value):
+        assert seen.setdefault(value, value) is value
+
+    for itinerary in result.best + result.other:
+        check(itinerary.departure_airport)
+        check(itinerary.arrival_airport)
+        for name in itinerary.airline_names:
+            check(name)
+        for flight in itinerary.flights:
+            check(flight.departure_airport)
+            check(flight.arrival_airport)
+            check(flight.airline)
+            check(flight.airline_name)
+
+
+def test_interned_values_are_unchanged():
+    root = synthetic_root(best=1, other=5, seed=11)
+    flight = _decode(root).best[0].flights[0]
+    raw = root[2][0][0][0][2][0]
+    assert flight.departure_airport == raw[3]
+    assert flight.airline_name == raw[22][3]
@@ -0,0 +1,193 @@
+"""Tests for retrying transient fetch failures."""
+
+import asyncio
+
+import pytest
+
+from fast_flights import bright_data_fetch as bright_data, core, retry
+from fast_flights.cache import CachedResponse
+from fast_flights.exceptions import FetchError
+from fast_flights.retry import RetryPolicy
+
+from _helpers import js_page, synthetic_root
+
+
+@pytest.fixture
+def slept(monkeypatch):
+    delays = []
+    monkeypatch.setattr(retry.time, "sleep", delays.append)
+    return delays
+
+
+def _flaky(failures, result="ok"):
+    calls = []
+
+    def fn():
+        calls.append(1)
+        if len(calls) <= len(failures):
+            raise failures[len(calls) - 1]
+        return result
+
+    return fn, calls
+
+
+def test_fetch_error_is_an_assertion_error_with_status():
+    err = FetchError(503, "unavailable")
+    assert isinstance(err, AssertionError)
+    assert (err.status_code, err.body, str(err)) == (503, "unavailable", "503 Result: unavailable")
+
+
+def test_fetch_error_reads_retry_after_header():
+    class _Res:
+        status_code = 429
+        headers = {"retry-after": "7"}
+
+    assert FetchError.from_response(_Res(), "").retry_after == 7.0
+    _Res.headers = {"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    assert FetchError.from_response(_Res(), "").retry_after is None
+
+
+def test_retries_transient_statuses_and_transport_errors(slept):
+    fn, calls = _flaky([FetchError(429), RuntimeError("client error (Connect)")])
+    assert RetryPolicy(jitter=False).call(fn) == "ok"
+    assert len(calls) == 3
+    assert slept == [0.5, 1.0]
+
+
+def test_non_retryable_errors_raise_immediately(slept):
+    for exc in (FetchError(404), AssertionError("bad"), ValueError("no key")):
+        fn, calls = _flaky([exc])
+        with pytest.raises(type(exc)):
+            RetryPolicy().call(fn)
+        assert len(calls) == 1
+    assert slept == []
+
+
+def test_gives_up_after_max_attempts(slept):
+    fn, calls = _flaky([FetchError(503)] * 5)
+    with pytest.raises(FetchError):
+        RetryPolicy(max_attempts=3).call(fn)
+    assert len(calls) == 3 and len(slept) == 2
+
+
+def test_backoff_is_capped_and_jittered():
+    policy = RetryPolicy(base_delay=1.0, max_delay=3.0)
+    assert RetryPolicy(base_delay=1.0, max_delay=3.0, jitter=False).backoff(5) == 3.0
+    assert all(0 <= policy.backoff(n) <= min(3.0, 2 ** n) for n in range(6) for _ in range(20))
+    assert policy.backoff(0, FetchError(429, retry_after=2.0)) == 2.0
+    assert policy.backoff(0, FetchError(429, retry_after=60.0)) == 3.0
+
+
+def test_deadline_stops_retrying(slept):
+    fn, calls = _flaky([FetchError(503)] * 5)
+    with pytest.raises(FetchError):
+        RetryPolicy(max_attempts=5, base_delay=2.0, jitter=False, deadline=1.0).call(fn)
+    assert len(calls) == 1 and slept == []
+
+
+def test_call_async_retries(monkeypatch):
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(retry.asyncio, "sleep", fake_sleep)
+    attempts = []
+
+    async def fn():
+        attempts.append(1)
+        if len(attempts) < 2:
+            raise FetchError(502)
+        return "ok"
+
+    assert asyncio.run(RetryPolicy(jitter=False).call_async(fn)) == "ok"
+    assert delays == [0.5]
+
+
+def test_default_policy_fails_fast(monkeypatch, slept):
+    calls = []
+
+    def failing_fetch(params, proxy=None):
+        calls.append(1)
+        raise FetchError(503)
+
+    monkeypatch.setattr(core, "fetch", failing_fetch)
+    assert retry.get_retry_policy().max_attempts == 1
+    with pytest.raises(FetchError):
+        core.get_flights_from_tfs("tfs", data_source='js')
+    assert len(calls) == 1 and slept == []
+
+
+def test_common_mode_retries_before_returning(monkeypatch, slept):
+    monkeypatch.setattr(retry, "_retry_policy", RetryPolicy())
+    page = js_page(synthetic_root(best=1, other=1, seed=1))
+    statuses = [429, 503]
+
+    def fake_fetch(params, proxy=None):
+        if statuses:
+            raise FetchError(statuses.pop(0))
+        return CachedResponse(page)
+
+    monkeypatch.setattr(core, "fetch", fake_fetch)
+    result = core.get_flights_from_tfs("tfs", data_source='js')
+    assert result is not None and len(slept) == 2
+
+
+def test_fallback_mode_escalates_only_after_retries(monkeypatch, slept):
+    from fast_flights import fallback_playwright as fallback
+
+    page = js_page(synthetic_root(best=1, other=1, seed=1))
+    events = []
+
+    def failing_fetch(params, proxy=None):
+        events.append("fetch")
+        raise FetchError(503)
+
+    def fake_fallback(params):
+        events.append("fallback")
+        return CachedResponse(page)
+
+    monkeypatch.setattr(core, "fetch", failing_fetch)
+    monkeypatch.setattr(fallback, "fallback_playwright_fetch", fake_fallback)
+    monkeypatch.setattr(retry, "_retry_policy", RetryPolicy(max_attempts=2))
+
+    assert core.get_flights_from_tfs("tfs", mode="fallback", data_source='js') is not None
+    assert events == ["fetch", "fetch", "fallback"]
+
+
+def test_bright_data_mode_retries(monkeypatch, slept):
+    monkeypatch.setattr(retry, "_retry_policy", RetryPolicy())
+    page = js_page(synthetic_root(best=1, other=1, seed=1))
+    calls = []
+
+    def fake_bright_data(params):
+        calls.append(1)
+        if len(calls) == 1:
+            raise FetchError(500)
+        return CachedResponse(page)
+
+    monkeypatch.setattr(core, "bright_data_fetch", fake_bright_data)
+    assert core.get_flights_from_tfs("tfs", mode="bright-data", data_source='js') is not None
+    assert len(calls) == 2
+
+
+def test_bright_data_fetch_raises_fetch_error(monkeypatch):
+    class _Res:
+        status_code = 429
+        text = "slow down"
+        headers = {}
+
+    class _Client:
+        def post(self, *args, **kwargs):
+            return _Res()
+
+    class _Pool:
+        def session(self, **kwargs):
+            from contextlib import nullcontext
+            return nullcontext(_Client())
+
+    monkeypatch.setenv("BRIGHT_DATA_API_KEY", "key")
+    monkeypatch.setattr(bright_data, "get_session_pool", lambda: _Pool())
+    with pytest.raises(FetchError) as info:
+        bright_data.bright_data_fetch({"tfs": "x"})
+    assert info.value.status_code == 429
@@ -0,0 +1,102 @@
+"""Tests for the pooled primp sessions shared by the HTTP fetch modes."""
+
+import threading
+
+from fast_flights import session_pool
+from fast_flights.session_pool import SessionPool
+
+
+class _FakeClient:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+def test_session_is_reused_after_checkin():
+    pool = SessionPool(client_factory=_FakeClient)
+
+    with pool.session(impersonate="chrome_126", verify=False) as first:
+        pass
+    with pool.session(impersonate="chrome_126", verify=False) as second:
+        pass
+
+    assert first is second
+    assert first.kwargs == {"impersonate": "chrome_126", "verify": False}
+
+
+def test_sessions_are_keyed_by_proxy_and_profile():
+    pool = SessionPool(client_factory=_FakeClient)
+
+    with pool.session(impersonate="chrome_126") as plain:
+        pass
+    with pool.session(proxy="socks5://127.0.0.1:9150", impersonate="chrome_126") as proxied:
+        pass
+    with pool.session(impersonate="chrome_100") as other_profile:
+        pass
+
+    assert plain is not proxied
+    assert plain is not other_profile
+    assert proxied.kwargs["proxy"] == "socks5://127.0.0.1:9150"
+    assert pool.idle_count() == 3
+
+
+def test_session_is_discarded_when_block_raises():
+    pool = SessionPool(client_factory=_FakeClient)
+
+    try:
+        with pool.session() as broken:
+            raise RuntimeError("error sending request")
+    except RuntimeError:
+        pass
+
+    with pool.session() as fresh:
+        pass
+
+    assert fresh is not broken
+
+
+def test_max_size_bounds_idle_sessions():
+    pool = SessionPool(max_size=2, client_factory=_FakeClient)
+
+    with pool.session() as a, pool.session() as b, pool.session() as c:
+        assert len({id(a), id(b), id(c)}) == 3
+
+    assert pool.idle_count() == 2
+
+
+def test_idle_sessions_are_evicted(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(session_pool.time, "monotonic", lambda: now[0])
+    pool = SessionPool(idle_timeout=30, client_factory=_FakeClient)
+
+    with pool.session() as first:
+        pass
+    now[0] += 31
+    with pool.session() as second:
+        pass
+
+    assert first is not second
+
+
+def test_concurrent_checkouts_never_share_a_session():
+    pool = SessionPool(client_factory=_FakeClient)
+    in_use = set()
+    lock = threading.Lock()
+    errors = []
+
+    def worker():
+        for _ in range(200):
+            with pool.session() as client:
+                with lock:
+                    if id(client) in in_use:
+                        errors.append("shared")
+                    in_use.add(id(client))
+                with lock:
+                    in_use.discard(id(client))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
@@ -0,0 +1,143 @@
+"""Tests for coalescing identical concurrent searches."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fast_flights import core, single_flight
+from fast_flights.cache import CachedResponse
+from fast_flights.exceptions import FetchError
+from fast_flights.single_flight import SingleFlight, search_key
+
+from _helpers import js_page, synthetic_root
+
+
+def test_search_key_covers_params_and_result_shape():
+    params = {"tfs": "x", "hl": "en", "gl": "US", "tfu": "t", "curr": "USD"}
+    same = dict(reversed(list(params.items())))
+    assert search_key(params, "common", "js", True) == search_key(same, "common", "js", True)
+    assert search_key(params, "common", "js", True) != search_key(params, "common", "html", True)
+    assert search_key(params, "common", "js", True) != search_key(params, "common", "js", "lazy")
+    assert search_key(params, "common", "js", True) != search_key({**params, "curr": "EUR"}, "common", "js", True)
+
+
+def test_concurrent_threads_share_one_call():
+    group = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        release.wait(5)
+        return object()
+
+    with ThreadPoolExecutor(8) as pool:
+        futures = [pool.submit(group.do, "k", slow) for _ in range(8)]
+        while group.stats().calls < 8:
+            time.sleep(0.001)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert group.stats().shared == 7
+
+
+def test_errors_are_shared_and_not_remembered():
+    group = SingleFlight()
+    release = threading.Event()
+
+    def failing():
+        release.wait(5)
+        raise FetchError(503)
+
+    with ThreadPoolExecutor(3) as pool:
+        futures = [pool.submit(group.do, "k", failing) for _ in range(3)]
+        while group.stats().calls < 3:
+            time.sleep(0.001)
+        release.set()
+        for f in futures:
+            with pytest.raises(FetchError):
+                f.result()
+
+    assert group.do("k", lambda: "fresh") == "fresh"
+
+
+def test_coroutines_share_one_task_and_survive_a_cancelled_caller():
+    group = SingleFlight()
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def main():
+        first = asyncio.ensure_future(group.do_async("k", slow))
+        others = [asyncio.ensure_future(group.do_async("k", slow)) for _ in range(3)]
+        await asyncio.sleep(0)
+        first.cancel()
+        return await asyncio.gather(*others)
+
+    assert asyncio.run(main()) == ["result"] * 3
+    assert len(calls) == 1
+
+
+def test_identical_searches_fetch_and_parse_once(monkeypatch):
+    page = js_page(synthetic_root(best=2, other=2, seed=3))
+    release = threading.Event()
+    fetches, parses = [], []
+    parse_response = core.parse_response
+
+    def slow_fetch(params, proxy=None):
+        fetches.append(params["tfs"])
+        release.wait(5)
+        return CachedResponse(page)
+
+    def counting_parse(*args, **kwargs):
+        parses.append(1)
+        return parse_response(*args, **kwargs)
+
+    monkeypatch.setattr(core, "fetch", slow_fetch)
+    monkeypatch.setattr(core, "parse_response", counting_parse)
+    monkeypatch.setattr(single_flight, "_single_flight", SingleFlight())
+
+    with ThreadPoolExecutor(6) as pool:
+        futures = [pool.submit(core.get_flights_from_tfs, "same", data_source='js') for _ in range(5)]
+        futures.append(pool.submit(core.get_flights_from_tfs, "other", data_source='js'))
+        while single_flight.get_single_flight().stats().calls < 6:
+            time.sleep(0.001)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert sorted(fetches) == ["other", "same"]
+    assert len(parses) == 2
+    assert all(r is results[0] for r in results[:5])
+
+
+def test_identical_async_searches_fetch_once(monkeypatch):
+    page = js_page(synthetic_root(best=1, other=1, seed=1))
+    fetches = []
+
+    async def slow_browserless(params):
+        fetches.append(1)
+        await asyncio.sleep(0.05)
+        return CachedResponse(page)
+
+    monkeypatch.setattr(core, "browserless_fetch_async", slow_browserless)
+    monkeypatch.setattr(single_flight, "_single_flight", SingleFlight())
+
+    async def main():
+        return await asyncio.gather(
+            *(core.get_flights_from_tfs_async("tfs", mode="browserless", data_source='js') for _ in range(4))
+        )
+
+    results = asyncio.run(main())
+    assert len(fetches) == 1 and all(r is results[0] for r in results)
+
+
+def test_disabled_by_default():
+    assert single_flight.get_single_flight() is None
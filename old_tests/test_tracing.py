@@ -0,0 +1,154 @@
+"""Tests for the per-stage tracing hooks."""
+
+import pytest
+
+from fast_flights import core, retry, tracing
+from fast_flights.cache import CachedResponse, MemoryCache
+from fast_flights.exceptions import FetchError
+from fast_flights.filter import create_filter
+from fast_flights.flights_impl import FlightData, Passengers
+from fast_flights.retry import RetryPolicy
+from fast_flights.tracing import CallbackTracer, Tracer
+
+from _helpers import js_page, synthetic_root
+
+HTML_PAGE = """
+<html><body>
+<div jsname="IWWDBc"><ul class="Rk10dc"><li>
+  <div class="sSHqwe tPgKwe ogfYpf"><span>Delta</span></div>
+  <span class="mv1WYe"><div>8:00 AM</div><div>11:00 AM</div></span>
+  <div class="BbR8Ec"><span class="ogfYpf">Nonstop</span></div>
+  <div class="YMlIz FpEdX">$1,234</div>
+</li></ul></div>
+<span class="gOatQ">typical</span>
+</body></html>
+"""
+
+
+@pytest.fixture
+def spans(monkeypatch):
+    records = []
+    monkeypatch.setattr(tracing, "_tracer", CallbackTracer(records.append))
+    return records
+
+
+def test_noop_tracer_by_default():
+    tracer = tracing.get_tracer()
+    assert type(tracer) is Tracer and not tracer.enabled
+    with tracer.span("x", {"a": 1}) as span:
+        span.set_attribute("b", 2)
+    assert tracer.span("y") is tracer.span("z")
+
+
+def test_callback_tracer_times_spans_and_records_errors():
+    records = []
+    tracer = CallbackTracer(records.append)
+    with tracer.span("ok", {"a": 1}) as span:
+        span.set_attribute("b", 2)
+    with pytest.raises(ValueError):
+        with tracer.span("failed"):
+            raise ValueError("boom")
+
+    assert [r.name for r in records] == ["ok", "failed"]
+    assert records[0].attributes == {"a": 1, "b": 2} and records[0].duration >= 0
+    assert isinstance(records[1].error, ValueError)
+
+
+def test_callback_errors_do_not_break_searches(monkeypatch):
+    def broken(record):
+        raise RuntimeError("sink down")
+
+    monkeypatch.setattr(tracing, "_tracer", CallbackTracer(broken))
+    page = js_page(synthetic_root(best=1, other=1, seed=1))
+    monkeypatch.setattr(core, "fetch", lambda params, proxy=None: CachedResponse(page))
+    assert core.get_flights_from_tfs("tfs", data_source='js') is not None
+
+
+def test_js_search_emits_every_stage(monkeypatch, spans):
+    page = js_page(synthetic_root(best=2, other=3, seed=4))
+    monkeypatch.setattr(core, "fetch", lambda params, proxy=None: CachedResponse(page))
+    flight_filter = create_filter(
+        flight_data=[FlightData(date="2026-01-01", from_airport="SFO", to_airport="JFK")],
+        trip="one-way",
+        passengers=Passengers(adults=1),
+        seat="economy",
+    )
+
+    core.get_flights_from_filter(flight_filter, data_source='js')
+
+    by_name = {r.name: r for r in spans}
+    assert [r.name for r in spans] == [
+        "fast_flights.encode_tfs",
+        "fast_flights.fetch",
+        "fast_flights.extract_ds1",
+        "fast_flights.json_decode",
+        "fast_flights.decode",
+        "fast_flights.parse",
+        "fast_flights.search",
+    ]
+    assert by_name["fast_flights.search"].attributes == {"mode": "common", "data_source": "js"}
+    assert by_name["fast_flights.fetch"].attributes == {"mode": "common", "cache_hit": False, "bytes": len(page.encode())}
+    assert by_name["fast_flights.extract_ds1"].attributes == {"scanner": True}
+    assert by_name["fast_flights.decode"].attributes == {"itineraries": 5}
+    assert by_name["fast_flights.parse"].attributes["itineraries"] == 5
+
+
+def test_html_search_emits_dom_parse(monkeypatch, spans):
+    monkeypatch.setattr(core, "fetch", lambda params, proxy=None: CachedResponse(HTML_PAGE))
+    result = core.get_flights_from_tfs("tfs", data_source='html')
+    assert result.flights[0].name == "Delta"
+    assert [r.name for r in spans] == [
+        "fast_flights.fetch",
+        "fast_flights.dom_parse",
+        "fast_flights.parse",
+        "fast_flights.search",
+    ]
+    assert spans[2].attributes["itineraries"] == 1
+
+
+def test_cache_hits_are_marked(monkeypatch, spans):
+    page = js_page(synthetic_root(best=1, other=1, seed=1))
+    monkeypatch.setattr(core, "fetch", lambda params, proxy=None: CachedResponse(page))
+    cache = MemoryCache()
+    core.get_flights_from_tfs("tfs", data_source='js', cache=cache)
+    spans.clear()
+    core.get_flights_from_tfs("tfs", data_source='js', cache=cache)
+    assert spans[0].name == "fast_flights.fetch" and spans[0].attributes["cache_hit"] is True
+
+
+def test_fallback_transition_is_an_event(monkeypatch, spans):
+    from fast_flights import fallback_playwright as fallback
+
+    page = js_page(synthetic_root(best=1, other=1, seed=1))
+
+    def failing_fetch(params, proxy=None):
+        raise FetchError(503)
+
+    monkeypatch.setattr(retry, "_retry_policy", RetryPolicy.disabled())
+    monkeypatch.setattr(core, "fetch", failing_fetch)
+    monkeypatch.setattr(fallback, "fallback_playwright_fetch", lambda params: CachedResponse(page))
+
+    core.get_flights_from_tfs("tfs", mode="fallback", data_source='js')
+    events = [r for r in spans if r.name == "fast_flights.fallback"]
+    assert [e.attributes for e in events] == [
+        {"from_mode": "common", "to_mode": "force-fallback", "reason": "FetchError"}
+    ]
+
+
+def test_opentelemetry_tracer_nests_spans(monkeypatch):
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    monkeypatch.setattr(tracing, "_tracer", tracing.OpenTelemetryTracer(provider.get_tracer("test")))
+
+    page = js_page(synthetic_root(best=1, other=1, seed=1))
+    monkeypatch.setattr(core, "fetch", lambda params, proxy=None: CachedResponse(page))
+    core.get_flights_from_tfs("tfs", data_source='js')
+
+    finished = {s.name: s for s in exporter.get_finished_spans()}
+    assert finished["fast_flights.fetch"].parent.span_id == finished["fast_flights.search"].context.span_id
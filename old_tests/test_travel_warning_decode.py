@@ -19,87 +19,19 @@ on Warsaw→Asia routes.
 
 from fast_flights.decoder import (
     DecodedResult,
+    ItineraryDecoder,
     ResultDecoder,
     TravelWarning,
     _is_itinerary_entry,
     _parse_travel_warning,
 )
 
-
-_WARNING_ENTRY = [
-    12,
-    None,
-    None,
-    None,
-    None,
-    ["Travel restricted", "Airspace closure may affect flights.", 2],
-]
-
-
-_UNSET = object()
-
-
-_METADATA_ENTRY_WITH_INNER_LIST = [
-    [
-        None,
-        [[1783215731165430, 16320100, 3694350293], None, None, None, None, [[0]]],
-        0,
-        "c7ZJaraMCuSM5LcP1Z_N4Q0",
-        "HSQ2vRWrHUckAIEgBQBG--------pfbgq40AAAAAGpJtnMCmjXOA",
-    ],
-    [None, ""],
-]
-
-
-def _minimal_itinerary(*, layovers=_UNSET, arrival_time=None):
-    """Return a minimally-structured itinerary el that decodes cleanly."""
-    arrival_time = [13, 0] if arrival_time is None else arrival_time
-    inner_flight = [None] * 23
-    inner_flight[3] = "WAW"  # departure_airport
-    inner_flight[4] = "Warsaw Frederic Chopin"
-    inner_flight[5] = "Helsinki Airport"
-    inner_flight[6] = "HEL"
-    inner_flight[8] = [10, 30]
-    inner_flight[10] = arrival_time
-    inner_flight[11] = 150
-    inner_flight[14] = ""
-    inner_flight[17] = "Aircraft"
-    inner_flight[20] = [2026, 6, 12]
-    inner_flight[21] = [2026, 6, 12]
-    inner_flight[22] = ["AY", "100", None, "Finnair"]
-    inner_flight[15] = []  # codeshares
-
-    main = [None] * 14
-    main[0] = "AY"
-    main[1] = ["Finnair"]
-    main[2] = [inner_flight]
-    main[3] = "WAW"
-    main[4] = [2026, 6, 12]
-    main[5] = [10, 30]
-    main[6] = "HEL"
-    main[7] = [2026, 6, 12]
-    main[8] = arrival_time
-    main[9] = 150
-    main[13] = [] if layovers is _UNSET else layovers
-
-    summary_b64 = ""  # ItinerarySummary.from_b64("") is tolerated downstream
-    return [main, [None, summary_b64]]
-
-
-def _root_with(best_entries, other_entries=None, warnings_at_22=None):
-    """Build a 31-element root mimicking Google's data[*] response shape."""
-    other = other_entries if other_entries is not None else [_minimal_itinerary()]
-    root = [None] * 31
-    root[2] = [best_entries]
-    root[3] = [other]
-    if warnings_at_22 is not None:
-        root[22] = warnings_at_22
-    return root
+from _helpers import METADATA_ENTRY_WITH_INNER_LIST, WARNING_ENTRY, minimal_itinerary, root_with
 
 
 def test_inline_warning_does_not_crash_decoder():
     """Repro: warning entry inline in BEST. Previously crashed with AssertionError."""
-    root = _root_with(best_entries=[_WARNING_ENTRY, _minimal_itinerary()])
+    root = root_with(best_entries=[WARNING_ENTRY, minimal_itinerary()])
 
     result = ResultDecoder.decode(root)
 
@@ -112,9 +44,9 @@ def test_inline_warning_does_not_crash_decoder():
 
 
 def test_top_level_warning_at_data_22_is_collected():
-    root = _root_with(
-        best_entries=[_minimal_itinerary()],
-        warnings_at_22=[_WARNING_ENTRY],
+    root = root_with(
+        best_entries=[minimal_itinerary()],
+        warnings_at_22=[WARNING_ENTRY],
     )
 
     result = ResultDecoder.decode(root)
@@ -125,7 +57,7 @@ def test_top_level_warning_at_data_22_is_collected():
 
 
 def test_clean_response_has_empty_warnings():
-    root = _root_with(best_entries=[_minimal_itinerary()])
+    root = root_with(best_entries=[minimal_itinerary()])
 
     result = ResultDecoder.decode(root)
 
@@ -133,11 +65,11 @@ def test_clean_response_has_empty_warnings():
 
 
 def test_is_itinerary_entry_discriminator():
-    assert _is_itinerary_entry(_minimal_itinerary()) is True
-    assert _is_itinerary_entry(_minimal_itinerary(layovers=None)) is True
-    assert _is_itinerary_entry(_minimal_itinerary(layovers=None, arrival_time=[None, 45])) is True
-    assert _is_itinerary_entry(_WARNING_ENTRY) is False
-    assert _is_itinerary_entry(_METADATA_ENTRY_WITH_INNER_LIST) is False
+    assert _is_itinerary_entry(minimal_itinerary()) is True
+    assert _is_itinerary_entry(minimal_itinerary(layovers=None)) is True
+    assert _is_itinerary_entry(minimal_itinerary(layovers=None, arrival_time=[None, 45])) is True
+    assert _is_itinerary_entry(WARNING_ENTRY) is False
+    assert _is_itinerary_entry(METADATA_ENTRY_WITH_INNER_LIST) is False
     assert _is_itinerary_entry([]) is False
     assert _is_itinerary_entry(None) is False
     assert _is_itinerary_entry("a string") is False
@@ -145,8 +77,8 @@ def test_is_itinerary_entry_discriminator():
 
 def test_nonstop_itinerary_with_null_layovers_decodes_as_empty_layovers():
     """Google encodes nonstop itinerary layovers as null, not an empty list."""
-    root = _root_with(
-        best_entries=[_minimal_itinerary(layovers=None)],
+    root = root_with(
+        best_entries=[minimal_itinerary(layovers=None)],
         other_entries=[],
     )
 
@@ -158,8 +90,8 @@ def test_nonstop_itinerary_with_null_layovers_decodes_as_empty_layovers():
 
 def test_midnight_arrival_with_null_hour_decodes():
     """Google can encode 00:mm arrival times as [null, minute]."""
-    root = _root_with(
-        best_entries=[_minimal_itinerary(layovers=None, arrival_time=[None, 45])],
+    root = root_with(
+        best_entries=[minimal_itinerary(layovers=None, arrival_time=[None, 45])],
         other_entries=[],
     )
 
@@ -177,8 +109,8 @@ def test_metadata_entry_with_inner_list_does_not_crash_decoder():
     be skipped, not repaired with synthetic time data and not allowed to crash
     the whole response.
     """
-    root = _root_with(
-        best_entries=[_METADATA_ENTRY_WITH_INNER_LIST, _minimal_itinerary()],
+    root = root_with(
+        best_entries=[METADATA_ENTRY_WITH_INNER_LIST, minimal_itinerary()],
         other_entries=[],
     )
 
@@ -189,7 +121,7 @@ def test_metadata_entry_with_inner_list_does_not_crash_decoder():
 
 
 def test_parse_travel_warning_extracts_fields():
-    parsed = _parse_travel_warning(_WARNING_ENTRY)
+    parsed = _parse_travel_warning(WARNING_ENTRY)
     assert isinstance(parsed, TravelWarning)
     assert parsed.code == 12
     assert parsed.title == "Travel restricted"
@@ -201,3 +133,36 @@ def test_parse_travel_warning_returns_none_for_unrelated():
     assert _parse_travel_warning([1, 2, 3]) is None
     assert _parse_travel_warning("not a list") is None
     assert _parse_travel_warning([]) is None
+
+
+def test_partition_classifies_each_entry_once(monkeypatch):
+    import fast_flights.decoder as decoder_module
+
+    calls = []
+    original = decoder_module._is_itinerary_entry
+
+    def counting(el):
+        calls.append(el)
+        return original(el)
+
+    monkeypatch.setattr(decoder_module, "_is_itinerary_entry", counting)
+    root = root_with(
+        best_entries=[minimal_itinerary(), WARNING_ENTRY],
+        other_entries=[METADATA_ENTRY_WITH_INNER_LIST, minimal_itinerary(), WARNING_ENTRY],
+        warnings_at_22=[WARNING_ENTRY],
+    )
+
+    result = ResultDecoder.decode(root)
+
+    assert len(calls) == 5
+    assert len(result.best) == 1 and len(result.other) == 1
+    assert len(result.warnings) == 3
+
+
+def test_partition_returns_unknown_entries():
+    itineraries, warnings, unknowns = ItineraryDecoder.partition(
+        [minimal_itinerary(), WARNING_ENTRY, METADATA_ENTRY_WITH_INNER_LIST]
+    )
+    assert len(itineraries) == 1
+    assert [w.code for w in warnings] == [12]
+    assert unknowns == [METADATA_ENTRY_WITH_INNER_LIST]